@@ -14,6 +14,7 @@ __all__ = [
     "HEDAnnotations",
     "Info",
     "Label",
+    "LabelExtractor",
     "MixedSourceEstimate",
     "MixedVectorSourceEstimate",
     "Projection",
@@ -379,6 +380,7 @@ from .proj import (
 from .rank import compute_rank
 from .report import Report, open_report
 from .source_estimate import (
+    LabelExtractor,
     MixedSourceEstimate,
     MixedVectorSourceEstimate,
     SourceEstimate,
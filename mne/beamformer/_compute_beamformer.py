@@ -172,13 +172,11 @@ def _sym_inv_sm(x, reduce_rank, inversion, sk):
             assert not reduce_rank  # guaranteed earlier
             with np.errstate(divide="ignore"):
                 diags = 1.0 / diags
-            # set the diagonal of each 3x3
+            # set the diagonal of each 3x3, reapplying the source covariance
+            # after inversion
             x_inv = np.zeros_like(x)
-            for k in range(x.shape[0]):
-                this = diags[k]
-                # Reapply source covariance after inversion
-                this *= sk[k] * sk[k]
-                x_inv[k].flat[::4] = this
+            idx = np.arange(x.shape[1])
+            x_inv[:, idx, idx] = diags * (sk * sk)
     return x_inv
 
 
@@ -205,8 +203,9 @@ def _compute_beamformer(
     ----------
     G : ndarray, shape (n_dipoles, n_channels)
         The leadfield.
-    Cm : ndarray, shape (n_channels, n_channels)
-        The data covariance matrix.
+    Cm : ndarray, shape ([n_cov, ]n_channels, n_channels)
+        The data covariance matrix, or a stack of them (e.g., one CSD matrix
+        per frequency), in which case the lead field is prepared only once.
     reg : float
         Regularization parameter.
     n_orient : int
@@ -217,8 +216,8 @@ def _compute_beamformer(
         The source orientation to compute the beamformer in.
     reduce_rank : bool
         Whether to reduce the rank by one during computation of the filter.
-    rank : dict | None | 'full' | 'info'
-        See compute_rank.
+    rank : int | list of int
+        The rank of the data covariance, one per matrix if ``Cm`` is a stack.
     inversion : 'matrix' | 'single'
         The inversion scheme to compute the weights.
     nn : ndarray, shape (n_dipoles, 3)
@@ -230,8 +229,10 @@ def _compute_beamformer(
 
     Returns
     -------
-    W : ndarray, shape (n_dipoles, n_channels)
+    W : ndarray, shape ([n_cov, ]n_dipoles, n_channels)
         The beamformer filter weights.
+    max_power_ori : ndarray, shape ([n_cov, ]n_sources, 3) | None
+        The max-power orientations, if ``pick_ori='max-power'``.
     """
     _check_option(
         "weight_norm",
@@ -239,25 +240,6 @@ def _compute_beamformer(
         ["unit-noise-gain-invariant", "unit-noise-gain", "nai", None],
     )
 
-    # Whiten the data covariance
-    Cm = whitener @ Cm @ whitener.T.conj()
-    # Restore to properly Hermitian as large whitening coefs can have bad
-    # rounding error
-    Cm[:] = (Cm + Cm.T.conj()) / 2.0
-
-    assert Cm.shape == (G.shape[0],) * 2
-    s, _ = np.linalg.eigh(Cm)
-    if not (s >= -s.max() * 1e-7).all():
-        # This shouldn't ever happen, but just in case
-        warn(
-            "data covariance does not appear to be positive semidefinite, "
-            "results will likely be incorrect"
-        )
-    # Tikhonov regularization using reg parameter to control for
-    # trade-off between spatial resolution and noise sensitivity
-    # eq. 25 in Gross and Ioannides, 1999 Phys. Med. Biol. 44 2081
-    Cm_inv, loading_factor, rank = _reg_pinv(Cm, reg, rank)
-
     assert orient_std.shape == (G.shape[1],)
     n_sources = G.shape[1] // n_orient
     assert nn.shape == (n_sources, 3)
@@ -309,17 +291,87 @@ def _compute_beamformer(
     if reduce_rank:
         Gk = _reduce_leadfield_rank(Gk)
 
-    def _compute_bf_terms(Gk, Cm_inv):
-        bf_numer = np.matmul(Gk.swapaxes(-2, -1).conj(), Cm_inv)
-        bf_denom = np.matmul(bf_numer, Gk)
-        return bf_numer, bf_denom
+    # All products with the lead field are done with a single matrix product
+    # over all sources, using the lead field in (n_sources * n_orient, n_chan)
+    Gk_H = Gk.swapaxes(-2, -1).conj().reshape(n_sources * n_orient, n_channels)
+
+    kwargs = dict(
+        Gk=Gk,
+        Gk_H=Gk_H,
+        sk=sk,
+        reg=reg,
+        weight_norm=weight_norm,
+        pick_ori=pick_ori,
+        reduce_rank=reduce_rank,
+        inversion=inversion,
+        nn=nn,
+        whitener=whitener,
+    )
+    if Cm.ndim == 2:
+        W, max_power_ori = _compute_beamformer_cm(Cm, rank=rank, **kwargs)
+    else:
+        assert len(rank) == len(Cm)
+        out = [
+            _compute_beamformer_cm(this_Cm, rank=this_rank, **kwargs)
+            for this_Cm, this_rank in zip(Cm, rank)
+        ]
+        W = np.array([o[0] for o in out])
+        max_power_ori = (
+            None if pick_ori != "max-power" else np.array([o[1] for o in out])
+        )
+    logger.info("Filter computation complete")
+    return W, max_power_ori
+
+
+def _compute_beamformer_cm(
+    Cm,
+    *,
+    rank,
+    Gk,
+    Gk_H,
+    sk,
+    reg,
+    weight_norm,
+    pick_ori,
+    reduce_rank,
+    inversion,
+    nn,
+    whitener,
+):
+    """Compute the beamformer filter for one data covariance."""
+    n_sources, n_channels, n_orient = Gk.shape
+    # Whiten the data covariance
+    Cm = whitener @ Cm @ whitener.T.conj()
+    # Restore to properly Hermitian as large whitening coefs can have bad
+    # rounding error
+    Cm[:] = (Cm + Cm.T.conj()) / 2.0
+
+    assert Cm.shape == (n_channels,) * 2
+    s, _ = np.linalg.eigh(Cm)
+    if not (s >= -s.max() * 1e-7).all():
+        # This shouldn't ever happen, but just in case
+        warn(
+            "data covariance does not appear to be positive semidefinite, "
+            "results will likely be incorrect"
+        )
+    # Tikhonov regularization using reg parameter to control for
+    # trade-off between spatial resolution and noise sensitivity
+    # eq. 25 in Gross and Ioannides, 1999 Phys. Med. Biol. 44 2081
+    Cm_inv, loading_factor, rank = _reg_pinv(Cm, reg, rank)
+
+    def _Gk_H_dot(C):
+        # Same as np.matmul(Gk.swapaxes(-2, -1).conj(), C)
+        return (Gk_H @ C).reshape(n_sources, n_orient, C.shape[1])
+
+    # Numerator of the beamformer formula for all orientations
+    bf_numer = _Gk_H_dot(Cm_inv)
 
     #
     # 2. Reorient lead field in direction of max power or normal
     #
     if pick_ori == "max-power":
         assert n_orient == 3
-        _, bf_denom = _compute_bf_terms(Gk, Cm_inv)
+        bf_denom = np.matmul(bf_numer, Gk)
         if weight_norm is None:
             ori_numer = np.eye(n_orient)[np.newaxis]
             ori_denom = bf_denom
@@ -327,9 +379,7 @@ def _compute_beamformer(
             # compute power, cf Sekihara & Nagarajan 2008, eq. 4.47
             ori_numer = bf_denom
             # Cm_inv should be Hermitian so no need for .T.conj()
-            ori_denom = np.matmul(
-                np.matmul(Gk.swapaxes(-2, -1).conj(), Cm_inv @ Cm_inv), Gk
-            )
+            ori_denom = np.matmul(_Gk_H_dot(Cm_inv @ Cm_inv), Gk)
         ori_denom_inv = _sym_inv_sm(ori_denom, reduce_rank, inversion, sk)
         ori_pick = np.matmul(ori_denom_inv, ori_numer)
         assert ori_pick.shape == (n_sources, n_orient, n_orient)
@@ -350,18 +400,20 @@ def _compute_beamformer(
         # Compute the lead field for the optimal orientation,
         # and adjust numer/denom
         Gk = np.matmul(Gk, max_power_ori[..., np.newaxis])
+        bf_numer = np.matmul(max_power_ori[:, np.newaxis].conj(), bf_numer)
         n_orient = 1
     else:
         max_power_ori = None
         if pick_ori == "normal":
             Gk = Gk[..., 2:3]
+            bf_numer = bf_numer[:, 2:3]
             n_orient = 1
 
     #
     # 3. Compute numerator and denominator of beamformer formula (unit-gain)
     #
 
-    bf_numer, bf_denom = _compute_bf_terms(Gk, Cm_inv)
+    bf_denom = np.matmul(bf_numer, Gk)
     assert bf_denom.shape == (n_sources,) + (n_orient,) * 2
     assert bf_numer.shape == (n_sources, n_orient, n_channels)
     del Gk  # lead field has been adjusted and should not be used anymore
@@ -446,7 +498,6 @@ def _compute_beamformer(
             W /= np.sqrt(noise)
 
     W = W.reshape(n_sources * n_orient, n_channels)
-    logger.info("Filter computation complete")
     return W, max_power_ori
 
 
@@ -467,10 +518,9 @@ def _compute_power(Cm, W, n_orient):
     """
     n_sources = W.shape[0] // n_orient
 
-    Wk = W.reshape(n_sources, n_orient, W.shape[1])
-    source_power = np.trace(
-        (Wk @ Cm @ Wk.conj().transpose(0, 2, 1)).real, axis1=1, axis2=2
-    )
+    # trace of Wk @ Cm @ Wk.conj().T for each source, from a single product
+    source_power = np.einsum("ij,ij->i", W @ Cm, W.conj()).real
+    source_power = source_power.reshape(n_sources, n_orient).sum(axis=1)
 
     return source_power
 
@@ -246,46 +246,35 @@ def make_dics(
     ch_names = list(info["ch_names"])
 
     logger.info("Computing DICS spatial filters...")
-    Ws = []
-    max_oris = []
-    for i, freq in enumerate(frequencies):
-        if n_freqs > 1:
-            logger.info(
-                "    computing DICS spatial filter at "
-                f"{round(freq, 2)} Hz ({i + 1}/{n_freqs})"
-            )
-
-        Cm = csd.get_data(index=i)
-
-        # XXX: Weird that real_filter happens *before* whitening, which could
-        # make things complex again...?
-        if real_filter:
-            Cm = Cm.real
-
-        # compute spatial filter
-        n_orient = 3 if is_free_ori else 1
-        W, max_power_ori = _compute_beamformer(
-            G,
-            Cm,
-            reg,
-            n_orient,
-            weight_norm,
-            pick_ori,
-            reduce_rank,
-            rank=csd_int_rank[i],
-            inversion=inversion,
-            nn=nn,
-            orient_std=orient_std,
-            whitener=whitener,
+    if n_freqs > 1:
+        logger.info(
+            f"    computing DICS spatial filters at {n_freqs} frequencies "
+            f"({round(frequencies[0], 2)}-{round(frequencies[-1], 2)} Hz)"
         )
-        Ws.append(W)
-        max_oris.append(max_power_ori)
+    # The filters for all frequencies share the prepared lead field
+    Cm = np.array([csd.get_data(index=i) for i in range(n_freqs)])
 
-    Ws = np.array(Ws)
-    if pick_ori == "max-power":
-        max_oris = np.array(max_oris)
-    else:
-        max_oris = None
+    # XXX: Weird that real_filter happens *before* whitening, which could
+    # make things complex again...?
+    if real_filter:
+        Cm = Cm.real
+
+    # compute spatial filter
+    n_orient = 3 if is_free_ori else 1
+    Ws, max_oris = _compute_beamformer(
+        G,
+        Cm,
+        reg,
+        n_orient,
+        weight_norm,
+        pick_ori,
+        reduce_rank,
+        rank=csd_int_rank,
+        inversion=inversion,
+        nn=nn,
+        orient_std=orient_std,
+        whitener=whitener,
+    )
 
     src_type = _get_src_type(forward["src"], vertices)
     subject = _subject_from_forward(forward)
@@ -975,3 +975,53 @@ def test_make_dics_rank(_load_forward, idx, whiten):
                 noise_csd=noise_csd,
                 verbose=True,
             )
+
+
+def test_make_dics_frequencies_batched():
+    """Test that filters for many frequencies match one frequency at a time."""
+    montage = mne.channels.make_standard_montage("spherical_1020")
+    info = mne.create_info(montage.ch_names, 100.0, "eeg").set_montage(montage)
+    evoked = mne.EvokedArray(np.zeros((len(info.ch_names), 1)), info)
+    info = evoked.set_eeg_reference(projection=True, verbose=False).info
+    sphere = mne.make_sphere_model("auto", "auto", info, verbose=False)
+    src = mne.setup_volume_source_space(pos=25.0, sphere=sphere, verbose=False)
+    fwd = mne.make_forward_solution(info, None, src, sphere, verbose=False)
+    rng = np.random.default_rng(0)
+    n_chan, freqs = len(info.ch_names), [10.0, 20.0, 30.0]
+    csd_data = list()
+    for _ in freqs:
+        x = rng.standard_normal((n_chan, 2 * n_chan))
+        x = x + 1j * rng.standard_normal((n_chan, 2 * n_chan))
+        csd_data.append(_sym_mat_to_vector(x @ x.conj().T / (2 * n_chan)))
+    csd = CrossSpectralDensity(np.array(csd_data).T, info.ch_names, freqs, 1.0)
+    for pick_ori, weight_norm, inversion in (
+        (None, None, "matrix"),
+        ("max-power", "unit-noise-gain", "matrix"),
+        ("vector", "nai", "single"),
+        ("max-power", None, "single"),
+    ):
+        kwargs = dict(
+            pick_ori=pick_ori,
+            weight_norm=weight_norm,
+            inversion=inversion,
+            real_filter=False,
+            verbose=False,
+        )
+        filters = make_dics(info, fwd, csd, **kwargs)
+        power, _ = apply_dics_csd(csd, filters, verbose=False)
+        assert filters["weights"].shape[0] == len(freqs)
+        for fi in range(len(freqs)):
+            this_filters = make_dics(info, fwd, csd[fi], **kwargs)
+            assert_allclose(filters["weights"][fi], this_filters["weights"][0])
+            if pick_ori == "max-power":
+                assert_allclose(
+                    filters["max_power_ori"][fi], this_filters["max_power_ori"][0]
+                )
+            this_power, _ = apply_dics_csd(csd[fi], this_filters, verbose=False)
+            assert_allclose(power.data[:, fi], this_power.data[:, 0])
+            # source power is the trace of W @ Cm @ W.H for each source
+            W = filters["weights"][fi].reshape(filters["n_sources"], -1, n_chan)
+            whitener = filters["whitener"]
+            Cm = whitener @ csd.get_data(index=fi) @ whitener.conj().T
+            want = np.einsum("sic,cd,sid->s", W, Cm, W.conj()).real
+            assert_allclose(power.data[:, fi], want)
@@ -16,6 +16,7 @@ from functools import partial
 from pathlib import Path
 
 import numpy as np
+from scipy import sparse
 from scipy.optimize import fmin_cobyla
 
 from ._fiff._digitization import _dig_kind_dict, _dig_kind_ints, _dig_kind_rev
@@ -34,6 +35,7 @@ from ._fiff.write import (
     write_string,
 )
 from .fixes import _compare_version, _safe_svd
+from .parallel import parallel_func
 from .surface import (
     _complete_sphere_surf,
     _compute_nearest,
@@ -62,8 +64,10 @@ from .utils import (
     _TempDir,
     _validate_type,
     _verbose_safe_false,
+    get_config,
     get_subjects_dir,
     logger,
+    object_hash,
     path_like,
     run_subprocess,
     verbose,
@@ -81,6 +85,10 @@ from .viz.misc import plot_bem
 # IEEE Trans Biomed Eng. 1992 39(9) : 986 - 990
 #
 
+# Number of (field point, triangle) pairs processed at once when assembling
+# the coefficient matrix
+_LIN_POT_BLOCK_SIZE = 2**14
+
 
 class ConductorModel(dict):
     """BEM or sphere model.
@@ -119,32 +127,50 @@ class ConductorModel(dict):
 
 def _calc_beta(rk, rk_norm, rk1, rk1_norm):
     """Compute coefficients for calculating the magic vector omega."""
+    # the edge vector is the same for all field points
     rkk1 = rk1[0] - rk[0]
-    size = np.linalg.norm(rkk1)
-    rkk1 /= size
-    num = rk_norm + np.dot(rk, rkk1)
-    den = rk1_norm + np.dot(rk1, rkk1)
+    size = np.linalg.norm(rkk1, axis=-1)
+    rkk1 /= size[:, np.newaxis]
+    num = rk_norm + np.einsum("ijk,jk->ij", rk, rkk1)
+    den = rk1_norm + np.einsum("ijk,jk->ij", rk1, rkk1)
     res = np.log(num / den) / size
     return res
 
 
 def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
-    """Compute the linear potential matrix element computations."""
-    omega = np.zeros((len(fros), 3))
+    """Compute the linear potential matrix element computations.
+
+    Parameters
+    ----------
+    fros : ndarray, shape (n_fro, 3)
+        The field points.
+    tri_rr : ndarray, shape (n_tri, 3, 3)
+        The triangle vertex locations.
+    tri_nn : ndarray, shape (n_tri, 3)
+        The triangle normals.
+    tri_area : ndarray, shape (n_tri,)
+        The triangle areas.
+
+    Returns
+    -------
+    omega : ndarray, shape (n_fro, n_tri, 3)
+        The coefficients of each triangle vertex for each field point.
+    """
+    omega = np.zeros((len(fros), len(tri_rr), 3))
 
     # we replicate a little bit of the _get_solids code here for speed
     # (we need some of the intermediate values later)
-    v1 = tri_rr[np.newaxis, 0, :] - fros
-    v2 = tri_rr[np.newaxis, 1, :] - fros
-    v3 = tri_rr[np.newaxis, 2, :] - fros
+    v1 = tri_rr[np.newaxis, :, 0, :] - fros[:, np.newaxis]
+    v2 = tri_rr[np.newaxis, :, 1, :] - fros[:, np.newaxis]
+    v3 = tri_rr[np.newaxis, :, 2, :] - fros[:, np.newaxis]
     triples = _fast_cross_nd_sum(v1, v2, v3)
-    l1 = np.linalg.norm(v1, axis=1)
-    l2 = np.linalg.norm(v2, axis=1)
-    l3 = np.linalg.norm(v3, axis=1)
+    l1 = np.sqrt(np.einsum("ijk,ijk->ij", v1, v1))
+    l2 = np.sqrt(np.einsum("ijk,ijk->ij", v2, v2))
+    l3 = np.sqrt(np.einsum("ijk,ijk->ij", v3, v3))
     ss = l1 * l2 * l3
-    ss += np.einsum("ij,ij,i->i", v1, v2, l3)
-    ss += np.einsum("ij,ij,i->i", v1, v3, l2)
-    ss += np.einsum("ij,ij,i->i", v2, v3, l1)
+    ss += np.einsum("ijk,ijk,ij->ij", v1, v2, l3)
+    ss += np.einsum("ijk,ijk,ij->ij", v1, v3, l2)
+    ss += np.einsum("ijk,ijk,ij->ij", v2, v3, l1)
     solids = np.arctan2(triples, ss)
 
     # We *could* subselect the good points from v1, v2, v3, triples, solids,
@@ -159,9 +185,9 @@ def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
 
     # Calculate the magic vector vec_omega
     beta = [
-        _calc_beta(v1, l1, v2, l2)[:, np.newaxis],
-        _calc_beta(v2, l2, v3, l3)[:, np.newaxis],
-        _calc_beta(v3, l3, v1, l1)[:, np.newaxis],
+        _calc_beta(v1, l1, v2, l2)[..., np.newaxis],
+        _calc_beta(v2, l2, v3, l3)[..., np.newaxis],
+        _calc_beta(v3, l3, v1, l1)[..., np.newaxis],
     ]
     vec_omega = (beta[2] - beta[0]) * v1
     vec_omega += (beta[0] - beta[1]) * v2
@@ -176,8 +202,9 @@ def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
     for k in range(3):
         diff = yys[idx[k - 1]] - yys[idx[k + 1]]
         zdots = _fast_cross_nd_sum(yys[idx[k + 1]], yys[idx[k - 1]], tri_nn)
-        omega[:, k] = -n2 * (
-            area2 * zdots * 2.0 * solids - triples * (diff * vec_omega).sum(axis=-1)
+        omega[..., k] = -n2 * (
+            area2 * zdots * 2.0 * solids
+            - triples * np.einsum("ijk,ijk->ij", diff, vec_omega)
         )
     # omit the bad points from the solution
     omega[bad_mask] = 0.0
@@ -187,68 +214,74 @@ def _lin_pot_coeff(fros, tri_rr, tri_nn, tri_area):
 def _correct_auto_elements(surf, mat):
     """Improve auto-element approximation."""
     pi2 = 2.0 * np.pi
-    tris_flat = surf["tris"].ravel()
+    tris = surf["tris"]
     misses = pi2 - mat.sum(axis=1)
-    for j, miss in enumerate(misses):
-        # How much is missing?
-        n_memb = len(surf["neighbor_tri"][j])
-        assert n_memb > 0  # should be guaranteed by our surface checks
-        # The node itself receives one half
-        mat[j, j] = miss / 2.0
-        # The rest is divided evenly among the member nodes...
-        miss /= 4.0 * n_memb
-        members = np.where(j == tris_flat)[0]
-        mods = members % 3
-        offsets = np.array([[1, 2], [-1, 1], [-1, -2]])
-        tri_1 = members + offsets[mods, 0]
-        tri_2 = members + offsets[mods, 1]
-        for t1, t2 in zip(tri_1, tri_2):
-            mat[j, tris_flat[t1]] += miss
-            mat[j, tris_flat[t2]] += miss
-    return
+    # How much is missing? The node itself receives one half
+    mat[np.arange(len(mat)), np.arange(len(mat))] = misses / 2.0
+    # The rest is divided evenly among the member nodes...
+    n_memb = np.bincount(tris.ravel(), minlength=len(mat))
+    assert (n_memb > 0).all()  # should be guaranteed by our surface checks
+    misses /= 4.0 * n_memb
+    rows = tris.ravel()
+    for shift in (1, 2):
+        cols = np.roll(tris, -shift, axis=1).ravel()
+        np.add.at(mat, (rows, cols), misses[rows])
+
+
+def _lin_pot_coeff_block(fro_idx, fros, tri_rr, tri_nn, tri_area, tris, incidence):
+    """Compute one block of rows of the coefficient matrix."""
+    coeffs = _lin_pot_coeff(
+        fros=fros[fro_idx], tri_rr=tri_rr, tri_nn=tri_nn, tri_area=tri_area
+    )
+    if tris is not None:
+        # No contribution from a triangle that this vertex belongs to
+        coeffs[(tris[np.newaxis] == fro_idx[:, np.newaxis, np.newaxis]).any(-1)] = 0.0
+    # Sum the contributions of each triangle vertex to its node
+    return coeffs.reshape(len(fro_idx), -1) @ incidence
 
 
-def _fwd_bem_lin_pot_coeff(surfs):
+def _fwd_bem_lin_pot_coeff(surfs, n_jobs=None):
     """Calculate the coefficients for linear collocation approach."""
     # taken from fwd_bem_linear_collocation.c
     nps = [surf["np"] for surf in surfs]
     np_tot = sum(nps)
     coeff = np.zeros((np_tot, np_tot))
     offsets = np.cumsum(np.concatenate(([0], nps)))
+    parallel, p_fun, n_jobs = parallel_func(
+        _lin_pot_coeff_block, n_jobs, prefer="threads"
+    )
     for si_1, surf1 in enumerate(surfs):
-        rr_ord = np.arange(nps[si_1])
         for si_2, surf2 in enumerate(surfs):
             logger.info(
                 f"        {_bem_surf_name[surf1['id']]} ({nps[si_1]:d}) -> "
                 f"{_bem_surf_name[surf2['id']]} ({nps[si_2]}) ..."
             )
-            tri_rr = surf2["rr"][surf2["tris"]]
-            tri_nn = surf2["tri_nn"]
-            tri_area = surf2["tri_area"]
+            tris = surf2["tris"]
+            # maps each (triangle, vertex) pair to its node
+            incidence = sparse.csr_array(
+                (np.ones(tris.size), (np.arange(tris.size), tris.ravel())),
+                shape=(tris.size, surf2["np"]),
+            )
+            # process blocks of field points against all triangles at once
+            n_blocks = -(-nps[si_1] * surf2["ntri"] // _LIN_POT_BLOCK_SIZE)
+            n_blocks = min(max(n_blocks, n_jobs), nps[si_1])
+            blocks = np.array_split(np.arange(nps[si_1]), n_blocks)
+            out = parallel(
+                p_fun(
+                    fro_idx,
+                    surf1["rr"],
+                    surf2["rr"][tris],
+                    surf2["tri_nn"],
+                    surf2["tri_area"],
+                    tris if si_1 == si_2 else None,
+                    incidence,
+                )
+                for fro_idx in blocks
+            )
             submat = coeff[
                 offsets[si_1] : offsets[si_1 + 1], offsets[si_2] : offsets[si_2 + 1]
             ]  # view
-            for k in range(surf2["ntri"]):
-                tri = surf2["tris"][k]
-                if si_1 == si_2:
-                    skip_idx = (
-                        (rr_ord == tri[0]) | (rr_ord == tri[1]) | (rr_ord == tri[2])
-                    )
-                else:
-                    skip_idx = list()
-                # No contribution from a triangle that
-                # this vertex belongs to
-                # if sidx1 == sidx2 and (tri == j).any():
-                #     continue
-                # Otherwise do the hard job
-                coeffs = _lin_pot_coeff(
-                    fros=surf1["rr"],
-                    tri_rr=tri_rr[k],
-                    tri_nn=tri_nn[k],
-                    tri_area=tri_area[k],
-                )
-                coeffs[skip_idx] = 0.0
-                submat[:, tri] -= coeffs
+            submat -= np.concatenate(out)
             if si_1 == si_2:
                 _correct_auto_elements(surf1, submat)
     return coeff
@@ -322,12 +355,12 @@ def _check_complete_surface(surf, copy=False, incomplete="raise", extra=""):
     return surf
 
 
-def _fwd_bem_linear_collocation_solution(bem):
+def _fwd_bem_linear_collocation_solution(bem, n_jobs=None):
     """Compute the linear collocation potential solution."""
     # first, add surface geometries
     logger.info("Computing the linear collocation solution...")
     logger.info("    Matrix coefficients...")
-    coeff = _fwd_bem_lin_pot_coeff(bem["surfs"])
+    coeff = _fwd_bem_lin_pot_coeff(bem["surfs"], n_jobs=n_jobs)
     bem["nsol"] = len(coeff)
     logger.info("    Inverting the coefficient matrix...")
     nps = [surf["np"] for surf in bem["surfs"]]
@@ -337,7 +370,7 @@ def _fwd_bem_linear_collocation_solution(bem):
         if ip_mult <= FWD.BEM_IP_APPROACH_LIMIT:
             logger.info("IP approach required...")
             logger.info("    Matrix coefficients (homog)...")
-            coeff = _fwd_bem_lin_pot_coeff([bem["surfs"][-1]])
+            coeff = _fwd_bem_lin_pot_coeff([bem["surfs"][-1]], n_jobs=n_jobs)
             logger.info("    Inverting the coefficient matrix (homog)...")
             ip_solution = _fwd_bem_homog_solution(coeff, [bem["surfs"][-1]["np"]])
             logger.info(
@@ -395,7 +428,7 @@ def _fwd_bem_openmeeg_solution(bem):
 
 
 @verbose
-def make_bem_solution(surfs, *, solver="mne", verbose=None):
+def make_bem_solution(surfs, *, solver="mne", n_jobs=None, verbose=None):
     """Create a BEM solution using the linear collocation approach.
 
     Parameters
@@ -407,6 +440,11 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
         `OpenMEEG <https://openmeeg.github.io>`__ package.
 
         .. versionadded:: 1.2
+    %(n_jobs)s
+        The coefficient matrix of the ``'mne'`` solver is assembled in blocks
+        of field points computed in parallel threads.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -425,6 +463,12 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
     Notes
     -----
     .. versionadded:: 0.10.0
+
+    If the ``MNE_BEM_CACHE_DIR`` configuration value is set to a directory
+    (see :func:`mne.set_config`), solutions are cached there. Caching is
+    disabled by default. Cache files are keyed on the surface geometries, the
+    conductivities, and the solver, so a cached solution is only reused when
+    it would be recomputed identically.
     """
     _validate_type(solver, str, "solver")
     _check_option("method", solver.lower(), ("mne", "openmeeg"))
@@ -439,16 +483,80 @@ def make_bem_solution(surfs, *, solver="mne", verbose=None):
     _check_bem_size(bem["surfs"])
     for surf in bem["surfs"]:
         _check_complete_surface(surf)
-    if solver.lower() == "openmeeg":
-        _fwd_bem_openmeeg_solution(bem)
-    else:
-        assert solver.lower() == "mne"
-        _fwd_bem_linear_collocation_solution(bem)
+    cache_fname = _get_bem_solution_cache_fname(bem, solver.lower())
+    if cache_fname is not None and cache_fname.is_file():
+        try:
+            _read_bem_solution_cache(cache_fname, bem)
+        except Exception as exp:
+            logger.info(f"Could not read cached BEM solution ({exp})")
+        else:
+            logger.info(f"Using cached BEM solution {cache_fname.name}")
+    if "solution" not in bem:
+        if solver.lower() == "openmeeg":
+            _fwd_bem_openmeeg_solution(bem)
+        else:
+            assert solver.lower() == "mne"
+            _fwd_bem_linear_collocation_solution(bem, n_jobs=n_jobs)
+        if cache_fname is not None:
+            _write_bem_solution_cache(cache_fname, bem)
     logger.info("Solution ready.")
     logger.info("BEM geometry computations complete.")
     return bem
 
 
+def _get_bem_solution_cache_fname(bem, solver):
+    """Get the content-addressed cache file name of a BEM solution."""
+    cache_dir = get_config("MNE_BEM_CACHE_DIR", None)
+    if cache_dir is None:
+        return None
+    key = object_hash(
+        dict(
+            surfs=[
+                dict(
+                    id=surf["id"],
+                    coord_frame=surf["coord_frame"],
+                    rr=surf["rr"],
+                    tris=surf["tris"],
+                )
+                for surf in bem["surfs"]
+            ],
+            sigma=bem["sigma"],
+            solver=solver,
+        )
+    )
+    return Path(cache_dir) / f"{key:032x}-bem-sol.npz"
+
+
+def _read_bem_solution_cache(fname, bem):
+    with np.load(fname, allow_pickle=False) as npz:
+        solution = npz["solution"]
+        bem_method = int(npz["bem_method"])
+        solver = str(npz["solver"])
+    bem.update(
+        solution=solution, nsol=len(solution), bem_method=bem_method, solver=solver
+    )
+
+
+def _write_bem_solution_cache(fname, bem):
+    # write to a temporary file first so that concurrent runs never see a
+    # partially written file
+    tmp_fname = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+    try:
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_fname, "wb") as fid:
+            np.savez(
+                fid,
+                solution=bem["solution"],
+                bem_method=bem["bem_method"],
+                solver=bem["solver"],
+            )
+        os.replace(tmp_fname, fname)
+    except Exception as exp:
+        logger.info(f"Could not cache BEM solution in {fname.parent} ({exp})")
+        if tmp_fname.exists():
+            tmp_fname.unlink()
+
+
 # ############################################################################
 # Make BEM model
 
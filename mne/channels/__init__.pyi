@@ -1,5 +1,6 @@
 __all__ = [
     "DigMontage",
+    "Interpolator",
     "Layout",
     "_EEG_SELECTIONS",
     "_SELECTIONS",
@@ -52,6 +53,7 @@ from .channels import (
     rename_channels,
     unify_bad_channels,
 )
+from .interpolation import Interpolator
 from .layout import (
     Layout,
     find_layout,
@@ -2,7 +2,9 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from collections import OrderedDict
 from copy import deepcopy
+from functools import partial
 
 import numpy as np
 from numpy.polynomial.legendre import legval
@@ -10,12 +12,26 @@ from scipy.interpolate import RectBivariateSpline
 from scipy.linalg import pinv
 from scipy.spatial.distance import pdist, squareform
 
-from .._fiff.meas_info import _simplify_info, create_info
+from .._fiff.meas_info import Info, _simplify_info, create_info
 from .._fiff.pick import pick_channels, pick_info, pick_types
 from .._fiff.proj import _has_eeg_average_ref_proj, make_eeg_average_ref_proj
 from ..bem import _check_origin
+from ..defaults import _handle_default
 from ..surface import _normalize_vectors
-from ..utils import _validate_type, logger, verbose, warn
+from ..utils import (
+    _check_option,
+    _check_preload,
+    _pl,
+    _validate_type,
+    fill_doc,
+    logger,
+    object_hash,
+    verbose,
+    warn,
+)
+
+_INTERPOLATION_CACHE = OrderedDict()
+_INTERPOLATION_CACHE_SIZE = 32  # maximum number of cached matrices
 
 
 def _calc_h(cosang, stiffness=4, n_legendre_terms=50):
@@ -134,24 +150,40 @@ def _do_interp_dots(inst, interpolation, goods_idx, bads_idx):
     )
 
 
-@verbose
-def _interpolate_bads_eeg(inst, origin, exclude=None, ecog=False, verbose=None):
+def _cached_interpolation(key, fun):
+    """Get an interpolation matrix (or its setup) from a bounded LRU cache."""
+    key = object_hash(key)
+    if key in _INTERPOLATION_CACHE:
+        _INTERPOLATION_CACHE.move_to_end(key)
+        logger.debug("Using cached interpolation matrix")
+    else:
+        interpolation = fun()
+        if isinstance(interpolation, np.ndarray):
+            interpolation.flags.writeable = False
+        _INTERPOLATION_CACHE[key] = interpolation
+        while len(_INTERPOLATION_CACHE) > _INTERPOLATION_CACHE_SIZE:
+            _INTERPOLATION_CACHE.popitem(last=False)
+    return _INTERPOLATION_CACHE[key]
+
+
+def _make_eeg_interpolator(info, bads, origin, exclude=None, ecog=False):
+    """Get the spherical spline interpolation of bad EEG or ECoG channels."""
     if exclude is None:
         exclude = list()
-    bads_idx = np.zeros(len(inst.ch_names), dtype=bool)
-    goods_idx = np.zeros(len(inst.ch_names), dtype=bool)
+    bads_idx = np.zeros(len(info.ch_names), dtype=bool)
+    goods_idx = np.zeros(len(info.ch_names), dtype=bool)
 
-    picks = pick_types(inst.info, meg=False, eeg=not ecog, ecog=ecog, exclude=exclude)
-    inst.info._check_consistency()
-    bads_idx[picks] = [inst.ch_names[ch] in inst.info["bads"] for ch in picks]
+    picks = pick_types(info, meg=False, eeg=not ecog, ecog=ecog, exclude=exclude)
+    info._check_consistency()
+    bads_idx[picks] = [info.ch_names[ch] in bads for ch in picks]
 
     if len(picks) == 0 or bads_idx.sum() == 0:
-        return
+        return None
 
     goods_idx[picks] = True
     goods_idx[bads_idx] = False
 
-    pos = inst._get_channel_positions(picks)
+    pos = info._get_channel_positions(picks)
 
     # Make sure only EEG are used
     bads_idx_pos = bads_idx[picks]
@@ -169,9 +201,22 @@ def _interpolate_bads_eeg(inst, origin, exclude=None, ecog=False, verbose=None):
     pos_good = pos[goods_idx_pos] - origin
     pos_bad = pos[bads_idx_pos] - origin
     logger.info(f"Computing interpolation matrix from {len(pos_good)} sensor positions")
-    interpolation = _make_interpolation_matrix(pos_good, pos_bad)
+    interpolation = _cached_interpolation(
+        ("spline", pos_good, pos_bad),
+        partial(_make_interpolation_matrix, pos_good, pos_bad),
+    )
+    return goods_idx, bads_idx, interpolation
+
 
-    logger.info(f"Interpolating {len(pos_bad)} sensors")
+@verbose
+def _interpolate_bads_eeg(inst, origin, exclude=None, ecog=False, verbose=None):
+    interpolator = _make_eeg_interpolator(
+        inst.info, inst.info["bads"], origin, exclude=exclude, ecog=ecog
+    )
+    if interpolator is None:
+        return
+    goods_idx, bads_idx, interpolation = interpolator
+    logger.info(f"Interpolating {bads_idx.sum()} sensors")
     _do_interp_dots(inst, interpolation, goods_idx, bads_idx)
 
 
@@ -208,9 +253,9 @@ def _interpolate_bads_nan(
     inst._data[..., picks_bad, :] = np.nan
 
 
-@verbose
-def _interpolate_bads_meeg(
-    inst,
+def _make_meeg_interpolators(
+    info,
+    bads,
     mode="accurate",
     *,
     meg=True,
@@ -218,28 +263,33 @@ def _interpolate_bads_meeg(
     ref_meg=False,
     exclude=(),
     origin,
-    method=None,
-    verbose=None,
+    setups=None,
 ):
-    from ..forward import _map_meg_or_eeg_channels
+    """Get the minimum-norm interpolations of bad MEG and EEG channels."""
+    from ..forward._field_interpolation import _setup_mapping_dots
 
-    if method is None:
-        method = {"meg": "MNE", "eeg": "MNE"}
-    bools = dict(meg=meg, eeg=eeg)
-    info = _simplify_info(inst.info)
-    for ch_type, do in bools.items():
+    if setups is None:
+        setups = dict()
+    interpolators = list()
+    for ch_type, do in dict(meg=meg, eeg=eeg).items():
         if not do:
             continue
-        kw = dict(meg=False, eeg=False)
-        kw[ch_type] = True
-        picks_type = pick_types(info, ref_meg=ref_meg, exclude=exclude, **kw)
-        picks_good = pick_types(info, ref_meg=ref_meg, exclude="bads", **kw)
-        use_ch_names = [inst.info["ch_names"][p] for p in picks_type]
-        bads_type = [ch for ch in inst.info["bads"] if ch in use_ch_names]
+        if ch_type not in setups:
+            setups[ch_type] = _setup_meeg_interpolation(
+                info, ch_type, ref_meg=ref_meg, exclude=exclude
+            )
+        setup = setups[ch_type]
+        picks_type, picks_all = setup["picks_type"], setup["picks_all"]
+        picks_good = picks_all[~np.isin(np.array(info.ch_names)[picks_all], bads)]
+        use_ch_names = [info["ch_names"][p] for p in picks_type]
+        bads_type = [ch for ch in bads if ch in use_ch_names]
         if len(bads_type) == 0 or len(picks_type) == 0:
             continue
-        # select the bad channels to be interpolated
-        picks_bad = pick_channels(inst.info["ch_names"], bads_type, exclude=[])
+        # select the bad channels to be interpolated (in channel order, like
+        # the rows of the mapping selected by bad_sel below)
+        picks_bad = pick_channels(
+            info["ch_names"], bads_type, exclude=[], ordered=False
+        )
 
         # do MNE based interpolation
         if ch_type == "eeg":
@@ -248,10 +298,95 @@ def _interpolate_bads_meeg(
         else:
             picks_to = picks_bad
             bad_sel = slice(None)
-        info_from = pick_info(inst.info, picks_good)
-        info_to = pick_info(inst.info, picks_to)
-        mapping = _map_meg_or_eeg_channels(info_from, info_to, mode=mode, origin=origin)
-        mapping = mapping[bad_sel]
+        if setup.get("fmd") is None:
+            setup["fmd"] = _cached_interpolation(
+                ("MNE", setup["key"], mode, origin),
+                partial(
+                    _setup_mapping_dots,
+                    setup["info"],
+                    setup["info"],
+                    mode,
+                    origin=origin,
+                ),
+            )
+        mapping = _cached_interpolation(
+            ("MNE", setup["key"], mode, origin, picks_good, picks_to),
+            partial(_mapping_from_setup, setup, picks_good, picks_to),
+        )
+        interpolators.append((picks_good, picks_bad, mapping[bad_sel]))
+    return interpolators
+
+
+def _setup_meeg_interpolation(info, ch_type, *, ref_meg, exclude):
+    """Pick the channels of one type for minimum-norm interpolation."""
+    simple_info = _simplify_info(info)
+    kw = dict(meg=False, eeg=False)
+    kw[ch_type] = True
+    picks_all = pick_types(simple_info, ref_meg=ref_meg, exclude=(), **kw)
+    setup = dict(
+        picks_type=pick_types(simple_info, ref_meg=ref_meg, exclude=exclude, **kw),
+        picks_all=picks_all,
+        info=pick_info(info, picks_all),
+    )
+    # the dot products of all channels are shared by all sets of bad channels
+    setup["info"]["bads"] = []
+    setup["key"] = object_hash(_interpolation_geometry(setup["info"]))
+    return setup
+
+
+def _mapping_from_setup(setup, picks_good, picks_to):
+    """Compute a minimum-norm mapping from the dot products of all channels."""
+    from ..forward._field_interpolation import _compute_mapping_matrix
+
+    from_sel = np.searchsorted(setup["picks_all"], picks_good)
+    to_sel = np.searchsorted(setup["picks_all"], picks_to)
+    fmd = setup["fmd"]
+    fmd = dict(
+        fmd,
+        ch_names=[fmd["ch_names"][ii] for ii in from_sel],
+        self_dots=fmd["self_dots"][np.ix_(from_sel, from_sel)],
+        surface_dots=fmd["surface_dots"][np.ix_(to_sel, from_sel)],
+        noise=dict(diag=True, data=fmd["noise"]["data"][from_sel]),
+    )
+    return _compute_mapping_matrix(fmd, pick_info(setup["info"], from_sel))
+
+
+def _interpolation_geometry(info):
+    """Get the parts of an Info that a minimum-norm interpolation depends on."""
+    return dict(
+        chs=[
+            {key: ch[key] for key in ("ch_name", "kind", "coil_type", "loc")}
+            for ch in info["chs"]
+        ],
+        dev_head_t=None if info["dev_head_t"] is None else info["dev_head_t"]["trans"],
+        projs=[(proj["active"], proj["data"]) for proj in info["projs"]],
+    )
+
+
+@verbose
+def _interpolate_bads_meeg(
+    inst,
+    mode="accurate",
+    *,
+    meg=True,
+    eeg=True,
+    ref_meg=False,
+    exclude=(),
+    origin,
+    method=None,
+    verbose=None,
+):
+    interpolators = _make_meeg_interpolators(
+        inst.info,
+        inst.info["bads"],
+        mode,
+        meg=meg,
+        eeg=eeg,
+        ref_meg=ref_meg,
+        exclude=exclude,
+        origin=origin,
+    )
+    for picks_good, picks_bad, mapping in interpolators:
         _do_interp_dots(inst, mapping, picks_good, picks_bad)
 
 
@@ -577,3 +712,189 @@ def _remap_add(inst, mapping, info_to, ch_type):
         new_order = orig_names
     inst_out.reorder_channels(new_order)
     return inst_out
+
+
+_INTERPOLATOR_METHODS = dict(eeg=("spline", "MNE"), meg=("MNE",), ecog=("spline",))
+
+
+@fill_doc
+class Interpolator:
+    """Interpolate bad channels with reusable interpolation matrices.
+
+    Parameters
+    ----------
+    %(info_not_none)s
+    mode : str
+        Either ``'accurate'`` or ``'fast'``, determines the quality of the
+        Legendre polynomial expansion used for interpolation of channels
+        using the minimum-norm method.
+    origin : array-like, shape (3,) | str
+        Origin of the sphere in the head coordinate frame and in meters.
+        Can be ``'auto'`` (default), which means a head-digitization-based
+        origin fit.
+    method : dict | str | None
+        Method to use for each channel type. ``"meg"`` channels support
+        ``"MNE"``, ``"eeg"`` channels support ``"spline"`` and ``"MNE"``, and
+        ``"ecog"`` channels support ``"spline"``. None (default) uses
+        ``"MNE"`` for MEG and ``"spline"`` for EEG and ECoG. A :class:`str` is
+        applied to all channel types present in ``info``.
+    exclude : list | tuple
+        The channels to exclude from interpolation.
+    %(verbose)s
+
+    See Also
+    --------
+    mne.io.Raw.interpolate_bads
+
+    Notes
+    -----
+    The interpolation matrices for a given set of bad channels are computed
+    once and kept in a bounded cache shared by all interpolators (and by
+    ``interpolate_bads``), keyed on the sensor geometry, the bad channels, the
+    origin and the mode. Interpolating the same bad channels again, e.g. in
+    another run with the same sensor positions, is a single matrix product.
+
+    :meth:`apply` also supports a different set of bad channels for each
+    epoch; epochs that share the same bad channels are interpolated together.
+    Channels of types other than MEG, EEG and ECoG are not interpolated.
+
+    .. versionadded:: 1.13
+    """
+
+    @verbose
+    def __init__(
+        self,
+        info,
+        *,
+        mode="accurate",
+        origin="auto",
+        method=None,
+        exclude=(),
+        verbose=None,
+    ):
+        _validate_type(info, Info, "info")
+        _validate_type(method, (dict, str, None), "method")
+        _check_option("mode", mode, ("accurate", "fast"))
+        present = [
+            ch_type
+            for ch_type in _INTERPOLATOR_METHODS
+            if len(pick_types(info, exclude=(), **{ch_type: True}))
+        ]
+        if method is None:
+            method = _handle_default("interpolation_method")
+            method = {key: method[key] for key in present}
+        elif isinstance(method, str):
+            method = {key: method for key in present}
+        else:
+            method = {key: val for key, val in method.items() if key in present}
+        for key in method:
+            _check_option("method[key]", key, tuple(_INTERPOLATOR_METHODS))
+            _check_option(f"method['{key}']", method[key], _INTERPOLATOR_METHODS[key])
+        self.info = info
+        self.mode = mode
+        self.method = method
+        self.exclude = list(exclude)
+        self.origin = _check_origin(origin, info) if method else None
+        self._setups = dict()
+
+    def __repr__(self):  # noqa: D105
+        return f"<Interpolator | method : {self.method}, mode : {self.mode}>"
+
+    def _get_interpolators(self, bads):
+        """Get the (from, to, matrix) interpolations for a set of bads."""
+        interpolators = list()
+        for ch_type, ecog in (("eeg", False), ("ecog", True)):
+            if self.method.get(ch_type, "") == "spline":
+                interpolator = _make_eeg_interpolator(
+                    self.info, bads, self.origin, exclude=self.exclude, ecog=ecog
+                )
+                if interpolator is not None:
+                    interpolators.append(interpolator)
+        meg_mne = self.method.get("meg", "") == "MNE"
+        eeg_mne = self.method.get("eeg", "") == "MNE"
+        if meg_mne or eeg_mne:
+            interpolators.extend(
+                _make_meeg_interpolators(
+                    self.info,
+                    bads,
+                    self.mode,
+                    meg=meg_mne,
+                    eeg=eeg_mne,
+                    exclude=self.exclude,
+                    origin=self.origin,
+                    setups=self._setups,
+                )
+            )
+        return interpolators
+
+    @verbose
+    def apply(self, inst, bads=None, *, reset_bads=True, verbose=None):
+        """Interpolate bad channels in place.
+
+        Parameters
+        ----------
+        inst : instance of Raw | Epochs | Evoked
+            The data, with the same channels as the ``info`` of the
+            interpolator. Must be preloaded.
+        bads : list of str | list of list of str | None
+            The channels to interpolate. None (default) uses
+            ``inst.info['bads']``. For :class:`~mne.Epochs`, a list with one
+            list of channel names per epoch interpolates these channels (in
+            addition to ``inst.info['bads']``) in each epoch.
+        reset_bads : bool
+            If True (default), remove the channels that were interpolated in
+            all epochs from ``inst.info['bads']``.
+        %(verbose)s
+
+        Returns
+        -------
+        inst : instance of Raw | Epochs | Evoked
+            The modified instance.
+        """
+        from ..epochs import BaseEpochs
+        from ..evoked import Evoked
+        from ..io import BaseRaw
+
+        _validate_type(inst, (BaseRaw, BaseEpochs, Evoked), "inst")
+        _validate_type(bads, (list, tuple, None), "bads")
+        _check_preload(inst, "interpolation")
+        if inst.ch_names != self.info.ch_names:
+            raise ValueError(
+                "The channels of inst do not match those of the Interpolator info"
+            )
+        per_epoch = bads is not None and any(not isinstance(b, str) for b in bads)
+        if per_epoch:
+            if not isinstance(inst, BaseEpochs) or len(bads) != len(inst):
+                raise ValueError(
+                    "bads must be a list of str or, for Epochs, contain one list "
+                    f"of channel names per epoch ({len(inst)}), got {len(bads)}"
+                )
+            patterns = dict()
+            for ei, epoch_bads in enumerate(bads):
+                key = tuple(sorted(set(inst.info["bads"]).union(epoch_bads)))
+                patterns.setdefault(key, list()).append(ei)
+        else:
+            bads = inst.info["bads"] if bads is None else bads
+            patterns = {tuple(bads): None}
+        missing = sorted(set().union(*patterns) - set(inst.ch_names))
+        if missing:
+            raise ValueError(f"Channel{_pl(missing)} not found in inst: {missing}")
+        logger.info(f"Interpolating {len(patterns)} set{_pl(patterns)} of bad channels")
+        ch_names = np.array(inst.ch_names)
+        interpolated = None
+        for pattern, idx in patterns.items():
+            data = inst._data if idx is None else inst._data[idx]
+            these = set()
+            for goods_idx, bads_idx, interpolation in self._get_interpolators(pattern):
+                data[..., bads_idx, :] = np.matmul(
+                    interpolation, data[..., goods_idx, :]
+                )
+                these.update(ch_names[bads_idx])
+            if idx is not None:
+                inst._data[idx] = data
+            interpolated = these if interpolated is None else interpolated & these
+        if reset_bads:
+            inst.info["bads"] = [
+                ch for ch in inst.info["bads"] if ch not in interpolated
+            ]
+        return inst
@@ -2,6 +2,7 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from collections import OrderedDict
 from itertools import compress
 from pathlib import Path
 
@@ -13,16 +14,19 @@ import mne.channels.channels
 from mne import Epochs, create_info, pick_channels, pick_types, read_events
 from mne._fiff.constants import FIFF
 from mne._fiff.proj import _has_eeg_average_ref_proj
-from mne.channels import make_dig_montage, make_standard_montage
+from mne.channels import Interpolator, make_dig_montage, make_standard_montage
+from mne.channels import interpolation as _interpolation
 from mne.channels.interpolation import _make_interpolation_matrix
 from mne.datasets import testing
+from mne.epochs import EpochsArray
+from mne.evoked import EvokedArray
 from mne.io import RawArray, read_raw_ctf, read_raw_fif, read_raw_nirx
 from mne.preprocessing.nirs import (
     beer_lambert_law,
     optical_density,
     scalp_coupling_index,
 )
-from mne.utils import _record_warnings
+from mne.utils import _record_warnings, catch_logging
 
 base_dir = Path(__file__).parents[2] / "io" / "tests" / "data"
 raw_fname = base_dir / "test_raw.fif"
@@ -610,3 +614,83 @@ def test_interpolate_to_meg(monkeypatch):
         evoked_rt.interpolate_to("ctf151", **kwargs)
     with pytest.raises(ValueError, match="Invalid value"):
         evoked_rt.interpolate_to("foo", **kwargs)
+
+
+@pytest.mark.parametrize("method", ["spline", "MNE"])
+def test_interpolator(method, monkeypatch):
+    """Test Interpolator with per-epoch bad channels and cached matrices."""
+    monkeypatch.setattr(_interpolation, "_INTERPOLATION_CACHE", OrderedDict())
+    montage = make_standard_montage("biosemi32")
+    info = create_info(montage.ch_names, 100.0, "eeg")
+    info.set_montage(montage)
+    rng = np.random.default_rng(0)
+    epochs = EpochsArray(rng.normal(size=(6, 32, 20)), info)
+    epochs.set_eeg_reference(projection=True)
+    epochs.info["bads"] = ["Cz"]
+    # epoch bads are not in channel order to check the row order of mappings
+    bads = [["O2", "Fp1"], [], ["O2", "Fp1"], ["T8"], [], ["T8"]]
+    kwargs = dict(method=dict(eeg=method), origin=(0.0, 0.0, 0.04))
+    want = epochs.get_data()
+    for ei, epoch_bads in enumerate(bads):
+        epoch = epochs[ei]
+        epoch.info["bads"] = ["Cz"] + epoch_bads
+        epoch.interpolate_bads(**kwargs)
+        want[ei] = epoch.get_data()[0]
+        assert epoch.info["bads"] == []
+    interpolator = Interpolator(epochs.info, **kwargs)
+    assert method in repr(interpolator)
+    got = epochs.copy()
+    with catch_logging(verbose=True) as log:
+        assert interpolator.apply(got, bads) is got
+    assert "Interpolating 3 sets of bad channels" in log.getvalue()
+    assert_allclose(got.get_data(), want, rtol=0, atol=1e-12)
+    assert got.info["bads"] == []
+    assert np.isin(["Fp1", "O2", "T8"], got.ch_names).all()
+    # the same bad channels again are taken from the cache
+    got = epochs.copy()
+    with catch_logging(verbose="debug") as log:
+        interpolator.apply(got, bads, reset_bads=False)
+    assert "Using cached interpolation matrix" in log.getvalue()
+    assert_allclose(got.get_data(), want, rtol=0, atol=1e-12)
+    assert got.info["bads"] == ["Cz"]
+    # the cache is bounded
+    monkeypatch.setattr(_interpolation, "_INTERPOLATION_CACHE_SIZE", 2)
+    interpolator.apply(epochs.copy(), [["Fz"]] * len(epochs))
+    assert len(_interpolation._INTERPOLATION_CACHE) == 2
+    # one set of bads for all epochs, or from the info
+    got = epochs.copy()
+    interpolator.apply(got, ["Cz", "T8"])
+    assert_allclose(got.get_data()[3], want[3], rtol=0, atol=1e-12)
+    got = epochs.copy()
+    interpolator.apply(got)
+    assert_allclose(got.get_data()[1], want[1], rtol=0, atol=1e-12)
+    # errors
+    with pytest.raises(ValueError, match="one list of channel names per epoch"):
+        interpolator.apply(epochs.copy(), bads[:2])
+    with pytest.raises(ValueError, match="not found in inst"):
+        interpolator.apply(epochs.copy(), ["foo"])
+    with pytest.raises(ValueError, match="do not match"):
+        interpolator.apply(epochs.copy().drop_channels(["Fz"]))
+    with pytest.raises(ValueError, match="Invalid value"):
+        Interpolator(epochs.info, method=dict(eeg="nearest"))
+
+
+@pytest.mark.parametrize("method", ["spline", "MNE"])
+def test_interpolate_bads_order(method):
+    """Test that interpolate_bads does not depend on the order of bads."""
+    montage = make_standard_montage("biosemi32")
+    info = create_info(montage.ch_names, 100.0, "eeg")
+    info.set_montage(montage)
+    rng = np.random.default_rng(0)
+    evoked = EvokedArray(rng.normal(size=(32, 20)), info)
+    kwargs = dict(method=dict(eeg=method), origin=(0.0, 0.0, 0.04))
+    want = evoked.copy()
+    want.info["bads"] = ["Fp1", "Cz", "O2"]
+    want.interpolate_bads(**kwargs)
+    got = evoked.copy()
+    got.info["bads"] = ["O2", "Fp1", "Cz"]
+    got.interpolate_bads(**kwargs)
+    assert_allclose(got.data, want.data, rtol=0, atol=1e-12)
+    # the good channels are untouched
+    picks = np.isin(evoked.ch_names, ["Fp1", "Cz", "O2"], invert=True)
+    assert_allclose(got.data[picks], evoked.data[picks], rtol=0, atol=0)
@@ -1134,6 +1134,9 @@ def numba_conditional(monkeypatch, request):
             cluster_level, "_where_first", cluster_level._where_first_fallback
         )
         monkeypatch.setattr(numerics, "_arange_div", numerics._arange_div_fallback)
+        monkeypatch.setattr(
+            mne.surface, "_get_solids", mne.surface._get_solids_fallback
+        )
     if request.param == "Numba" and not has_numba:
         pytest.skip("Numba not installed")
     yield request.param
@@ -18,7 +18,6 @@ from glob import glob, iglob
 
 import numpy as np
 from scipy.optimize import leastsq
-from scipy.spatial.distance import cdist
 
 from ._fiff._digitization import _get_data_as_dict_from_dig
 from ._fiff.constants import FIFF
@@ -302,27 +301,14 @@ def _decimate_points(pts, res=10):
     tree = _DistanceQuery(mids, method="KDTree")
     _, mid_idx = tree.query(pts)
 
-    # then figure out which to actually use based on proximity
-    # (take advantage of sorting the mid_idx to get our mapping of
-    # pts to nearest voxel midpoint)
-    sort_idx = np.argsort(mid_idx)
-    bounds = np.cumsum(np.concatenate([[0], np.bincount(mid_idx, minlength=len(mids))]))
-    assert len(bounds) == len(mids) + 1
-    out = list()
-    for mi, mid in enumerate(mids):
-        # Now we do this:
-        #
-        #     use_pts = pts[mid_idx == mi]
-        #
-        # But it's faster for many points than making a big boolean indexer
-        # over and over (esp. since each point can only belong to a single
-        # voxel).
-        use_pts = pts[sort_idx[bounds[mi] : bounds[mi + 1]]]
-        if not len(use_pts):
-            out.append([np.inf] * 3)
-        else:
-            out.append(use_pts[np.argmin(cdist(use_pts, mid[np.newaxis])[:, 0])])
-    out = np.array(out, float).reshape(-1, 3)
+    # then figure out which to actually use based on proximity, i.e., for
+    # each voxel the point closest to its midpoint (sorting by voxel first and
+    # distance second, the first point of each voxel is the one to use)
+    dist = np.linalg.norm(pts - mids[mid_idx], axis=1)
+    order = np.lexsort((dist, mid_idx))
+    first = order[np.concatenate([[0], np.flatnonzero(np.diff(mid_idx[order])) + 1])]
+    out = np.full((len(mids), 3), np.inf)
+    out[mid_idx[first]] = pts[first]
     out = out[np.abs(out - mids).max(axis=1) < res / 2.0]
     # """
 
@@ -357,6 +343,8 @@ def _trans_from_params(param_info, params):
 
 
 _ALLOW_ANALITICAL = True
+# Voxel sizes of the decimated head surfaces used by coarse-to-fine ICP
+_ICP_RESOLUTIONS = (0.01, 0.005)
 
 
 # XXX this function should be moved out of coreg as used elsewhere
@@ -1459,6 +1447,18 @@ def _read_surface(filename, *, on_defects):
     return bem
 
 
+class _ScaledDistanceQuery:
+    """Distance queries against isotropically scaled points."""
+
+    def __init__(self, query, scale):
+        self._query = query
+        self._scale = scale
+
+    def query(self, xhs):
+        dist, idx = self._query.query(xhs / self._scale)
+        return dist * self._scale, idx
+
+
 @fill_doc
 class Coregistration:
     """Class for MRI<->head coregistration.
@@ -1526,6 +1526,8 @@ class Coregistration:
         self._eeg_weight = 1.0
         self._hpi_weight = 1.0
         self._extra_points_filter = None
+        self._processed_mri_points = dict()
+        self._nearest_tree_key = None
 
         self._setup_digs()
         self._setup_bem()
@@ -1803,8 +1805,19 @@ class Coregistration:
         return self
 
     def _update_nearest_calc(self):
-        self._nearest_calc = _DistanceQuery(
-            self._processed_high_res_mri_points * self._scale
+        # Nearest neighbors do not change with isotropic scaling, so the tree
+        # is only rebuilt when the (processed) MRI points actually change
+        scale = np.array(self._scale, float)
+        isotropic = not self._grow_hair and (scale == scale[0]).all()
+        key = (self._grow_hair,) if isotropic else (self._grow_hair, tuple(scale))
+        if self._nearest_tree_key != key:
+            points = self._processed_high_res_mri_points
+            if not isotropic:
+                points = points * scale
+            self._nearest_tree = _DistanceQuery(points)
+            self._nearest_tree_key = key
+        self._nearest_calc = _ScaledDistanceQuery(
+            self._nearest_tree, scale[0] if isotropic else 1.0
         )
 
     @property
@@ -1892,6 +1905,12 @@ class Coregistration:
         return self._get_processed_mri_points("high")
 
     def _get_processed_mri_points(self, res):
+        # these only change with the hair (and then scale), so cache them
+        key = (self._grow_hair, tuple(self._scale) if self._grow_hair else None)
+        if res in self._processed_mri_points:
+            last_key, points = self._processed_mri_points[res]
+            if last_key == key:
+                return points
         bem = self._bem_low_res if res == "low" else self._bem_high_res
         points = bem["rr"].copy()
         if self._grow_hair:
@@ -1899,6 +1918,8 @@ class Coregistration:
             scaled_hair_dist = 1e-3 * self._grow_hair / np.array(self._scale)
             hair = points[:, 2] > points[:, 1]
             points[hair] += bem["nn"][hair] * scaled_hair_dist
+        points.flags.writeable = False
+        self._processed_mri_points[res] = (key, points)
         return points
 
     @property
@@ -2003,17 +2024,32 @@ class Coregistration:
         self._log_dig_mri_distance("End  ")
         return self
 
-    def _setup_icp(self, n_scale_params):
+    def _setup_icp(self, n_scale_params, mri_points=None):
+        if mri_points is None:
+            mri_points = self._processed_high_res_mri_points
+
+            def nearest(kind):
+                return getattr(self, f"_nearest_transformed_high_res_mri_idx_{kind}")
+
+        else:  # e.g., a decimated head surface
+            nearest_calc = _DistanceQuery(mri_points * self._scale)
+            transformed = dict(
+                hsp=self._transformed_dig_extra,
+                eeg=self._transformed_dig_eeg,
+                hpi=self._transformed_dig_hpi,
+            )
+            for key in ("lpa", "nasion", "rpa"):
+                transformed[key] = apply_trans(self._head_mri_t, self._dig_dict[key])
+
+            def nearest(kind):
+                return nearest_calc.query(transformed[kind])[1]
+
         head_pts = [np.zeros((0, 3))]
         mri_pts = [np.zeros((0, 3))]
         weights = [np.zeros(0)]
         if self._has_dig_data and self._hsp_weight > 0:  # should be true
             head_pts.append(self._filtered_extra_points)
-            mri_pts.append(
-                self._processed_high_res_mri_points[
-                    self._nearest_transformed_high_res_mri_idx_hsp
-                ]
-            )
+            mri_pts.append(mri_points[nearest("hsp")])
             weights.append(np.full(len(head_pts[-1]), self._hsp_weight))
         for key in ("lpa", "nasion", "rpa"):
             if getattr(self, f"_has_{key}_data"):
@@ -2024,32 +2060,17 @@ class Coregistration:
                     mri_pts.append(p)
                 else:
                     assert self._icp_fid_match == "nearest"
-                    mri_pts.append(
-                        self._processed_high_res_mri_points[
-                            getattr(
-                                self,
-                                f"_nearest_transformed_high_res_mri_idx_{key}",
-                            )
-                        ]
-                    )
+                    mri_pts.append(mri_points[nearest(key)])
                 weights.append(
                     np.full(len(mri_pts[-1]), getattr(self, f"_{key}_weight"))
                 )
         if self._has_eeg_data and self._eeg_weight > 0:
             head_pts.append(self._dig_dict["dig_ch_pos_location"])
-            mri_pts.append(
-                self._processed_high_res_mri_points[
-                    self._nearest_transformed_high_res_mri_idx_eeg
-                ]
-            )
+            mri_pts.append(mri_points[nearest("eeg")])
             weights.append(np.full(len(mri_pts[-1]), self._eeg_weight))
         if self._has_hpi_data and self._hpi_weight > 0:
             head_pts.append(self._dig_dict["hpi"])
-            mri_pts.append(
-                self._processed_high_res_mri_points[
-                    self._nearest_transformed_high_res_mri_idx_hpi
-                ]
-            )
+            mri_pts.append(mri_points[nearest("hpi")])
             weights.append(np.full(len(mri_pts[-1]), self._hpi_weight))
         head_pts = np.concatenate(head_pts)
         mri_pts = np.concatenate(mri_pts)
@@ -2089,6 +2110,8 @@ class Coregistration:
         hpi_weight=1.0,
         callback=None,
         verbose=None,
+        *,
+        coarse_to_fine=False,
     ):
         """Find MRI scaling, translation, and rotation to match HSP.
 
@@ -2113,6 +2136,15 @@ class Coregistration:
             updates. It will be passed the keyword arguments ``iteration``
             and ``n_iterations``.
         %(verbose)s
+        coarse_to_fine : bool
+            If True, first match to versions of the head surface decimated to
+            one point per 10 mm and then per 5 mm voxel, each until
+            convergence, before refining with the full-resolution surface.
+            This usually reduces the number of (costlier) full-resolution
+            iterations. The iterations of all stages count towards
+            ``n_iterations``.
+
+            .. versionadded:: 1.13
 
         Returns
         -------
@@ -2133,34 +2165,46 @@ class Coregistration:
         est = self._parameters
         est = est[: [6, 7, None, 9][n_scale_params]]
 
+        # Surfaces to match to, the last stage is always the full surface
+        stages = [None]
+        if coarse_to_fine:
+            points = self._processed_high_res_mri_points
+            stages = [_decimate_points(points, res) for res in _ICP_RESOLUTIONS]
+            stages.append(None)
+
         # Do the fits, assigning and evaluating at each step
-        for iteration in range(n_iterations):
-            head_pts, mri_pts, weights = self._setup_icp(n_scale_params)
-            est = fit_matched_points(
-                mri_pts,
-                head_pts,
-                scale=n_scale_params,
-                x0=est,
-                out="params",
-                weights=weights,
-            )
-            if n_scale_params == 0:
-                self._update_params(rot=est[:3], tra=est[3:6])
-            elif n_scale_params == 1:
-                est = np.array(list(est) + [est[-1]] * 2)
-                self._update_params(rot=est[:3], tra=est[3:6], sca=est[6:9])
-            else:
-                self._update_params(rot=est[:3], tra=est[3:6], sca=est[6:9])
-            angle, move, scale = self._changes
-            self._log_dig_mri_distance(f"  ICP {iteration + 1:2d} ")
-            if callback is not None:
-                callback(iteration, n_iterations)
-            if (
-                angle <= self._icp_angle
-                and move <= self._icp_distance
-                and all(scale <= self._icp_scale)
-            ):
-                break
+        iteration = 0
+        for si, mri_points in enumerate(stages):
+            # leave at least one iteration for the full-resolution surface
+            stage_iterations = n_iterations - (si < len(stages) - 1)
+            while iteration < stage_iterations:
+                head_pts, mri_pts, weights = self._setup_icp(n_scale_params, mri_points)
+                est = fit_matched_points(
+                    mri_pts,
+                    head_pts,
+                    scale=n_scale_params,
+                    x0=est,
+                    out="params",
+                    weights=weights,
+                )
+                if n_scale_params == 0:
+                    self._update_params(rot=est[:3], tra=est[3:6])
+                elif n_scale_params == 1:
+                    est = np.array(list(est) + [est[-1]] * 2)
+                    self._update_params(rot=est[:3], tra=est[3:6], sca=est[6:9])
+                else:
+                    self._update_params(rot=est[:3], tra=est[3:6], sca=est[6:9])
+                angle, move, scale = self._changes
+                self._log_dig_mri_distance(f"  ICP {iteration + 1:2d} ")
+                if callback is not None:
+                    callback(iteration, n_iterations)
+                iteration += 1
+                if (
+                    angle <= self._icp_angle
+                    and move <= self._icp_distance
+                    and all(scale <= self._icp_scale)
+                ):
+                    break
         self._log_dig_mri_distance("End      ")
         return self
 
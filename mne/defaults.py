@@ -267,7 +267,7 @@ DEFAULTS = dict(
     ),
     report_coreg=dict(dig=True, meg=("helmet", "sensors"), show_axes=True),
     noise_std=dict(grad=5e-13, mag=20e-15, eeg=0.2e-6),
-    eloreta_options=dict(eps=1e-6, max_iter=20, force_equal=False),
+    eloreta_options=dict(eps=1e-6, max_iter=20, force_equal=False, anderson=0),
     depth_mne=dict(
         exp=0.8,
         limit=10.0,
@@ -20,7 +20,7 @@ from ._freesurfer import _get_aseg, head_to_mni, head_to_mri, read_freesurfer_lu
 from .bem import ConductorModel, _bem_find_surface, _bem_surf_name, _fit_sphere
 from .cov import _ensure_cov, compute_whitener
 from .evoked import _aspect_rev, _read_evoked, _write_evokeds
-from .fixes import _safe_svd
+from .fixes import _reshape_view, _safe_svd
 from .forward._compute_forward import _compute_forwards_meeg, _prep_field_computation
 from .forward._make_forward import (
     _get_trans,
@@ -926,6 +926,9 @@ def _write_dipole_bdip(fname, dip):
 # #############################################################################
 # Fitting
 
+# Number of guess-component × time-point products scored at once
+_GUESS_BLOCK_SIZE = 2**22
+
 
 def _dipole_forwards(*, sensors, fwd_data, whitener, rr, n_jobs=None):
     """Compute the forward solution and do other nice stuff."""
@@ -1063,27 +1066,34 @@ def _fit_dipoles(
     n_jobs,
     rank,
     rhoend,
+    warm_start,
+    optimizer,
 ):
     """Fit a single dipole to the given whitened, projected data."""
-    parallel, p_fun, n_jobs = parallel_func(fun, n_jobs)
-    # parallel over time points
+    parallel, p_fun, n_jobs = parallel_func(_fit_dipole_chunk, n_jobs)
+    # parallel over contiguous chunks of time points, so that within each
+    # chunk a fit can be warm-started from the previous time point
+    chunks = np.array_split(np.arange(len(times)), min(n_jobs, len(times)))
     res = parallel(
         p_fun(
+            fun,
             min_dist_to_inner_skull,
-            B,
-            t,
+            data[:, chunk],
+            times[chunk],
             guess_rrs,
             guess_data,
             sensors=sensors,
             fwd_data=fwd_data,
             whitener=whitener,
-            fmin_cobyla=fmin_cobyla,
             ori=ori,
             rank=rank,
             rhoend=rhoend,
+            warm_start=warm_start,
+            optimizer=optimizer,
         )
-        for B, t in zip(data.T, times)
+        for chunk in chunks
     )
+    res = [r for chunk_res in res for r in chunk_res]
     pos = np.array([r[0] for r in res])
     amp = np.array([r[1] for r in res])
     ori = np.array([r[2] for r in res])
@@ -1100,10 +1110,77 @@ def _fit_dipoles(
     return pos, amp, ori, gof, conf, khi2, nfree, residual_noproj
 
 
-'''Simplex code in case we ever want/need it for testing
-
-def _make_tetra_simplex():
-    """Make the initial tetrahedron"""
+def _fit_dipole_chunk(
+    fun,
+    min_dist_to_inner_skull,
+    data,
+    times,
+    guess_rrs,
+    guess_data,
+    *,
+    whitener,
+    warm_start,
+    optimizer,
+    **kwargs,
+):
+    """Fit a contiguous chunk of time points."""
+    if fun is _fit_dipole:
+        # score all guesses for all time points at once
+        guess_idx, guess_err = _best_guesses(guess_data, np.dot(whitener, data))
+    res = list()
+    rd_prev = None
+    for ti, (B, t) in enumerate(zip(data.T, times)):
+        extra = dict()
+        if fun is _fit_dipole:
+            extra.update(
+                guess_idx=guess_idx[ti],
+                guess_err=guess_err[ti],
+                optimizer=optimizer,
+                rd_prev=rd_prev,
+            )
+        res.append(
+            fun(
+                min_dist_to_inner_skull,
+                B,
+                t,
+                guess_rrs,
+                guess_data,
+                whitener=whitener,
+                fmin_cobyla=fmin_cobyla,
+                **kwargs,
+                **extra,
+            )
+        )
+        if warm_start and res[-1][3] > 0:
+            rd_prev = res[-1][0]
+    return res
+
+
+def _best_guesses(guess_data, B):
+    """Find the best-fitting guess for each time point (find_best_guess)."""
+    # stack the (truncated) right singular vectors of all guesses
+    vv = guess_data["fwd_vv"]
+    B2 = np.sum(B * B, axis=0)
+    n_guess, n_comp, n_chan = vv.shape
+    vv = _reshape_view(vv, (n_guess * n_comp, n_chan))
+    idx = np.zeros(B.shape[1], int)
+    err = np.ones(B.shape[1])
+    n_per = max(_GUESS_BLOCK_SIZE // (n_guess * n_comp), 1)
+    for start in range(0, B.shape[1], n_per):
+        sl = slice(start, start + n_per)
+        one = np.dot(vv, B[:, sl])
+        one *= one
+        Bm2 = np.sum(_reshape_view(one, (n_guess, n_comp, -1)), axis=1)
+        this_idx = np.argmax(Bm2, axis=0)
+        idx[sl] = this_idx
+        # mne-c uses fitness=B2-Bm2, but ours (1-gof) is just a normalized version
+        with np.errstate(invalid="ignore", divide="ignore"):
+            err[sl] = 1.0 - Bm2[this_idx, np.arange(len(this_idx))] / B2[sl]
+    return idx, err
+
+
+def _make_tetra_simplex(size):
+    """Make the initial tetrahedron."""
     #
     # For this definition of a regular tetrahedron, see
     #
@@ -1113,84 +1190,76 @@ def _make_tetra_simplex():
     r = np.sqrt(6.0) / 12.0
     R = 3 * r
     d = x / 2.0
-    simplex = 1e-2 * np.array([[x, 0.0, -r],
-                               [-d, 0.5, -r],
-                               [-d, -0.5, -r],
-                               [0., 0., R]])
-    return simplex
-
-
-def try_(p, y, psum, ndim, fun, ihi, neval, fac):
-    """Helper to try a value"""
-    ptry = np.empty(ndim)
-    fac1 = (1.0 - fac) / ndim
-    fac2 = fac1 - fac
-    ptry = psum * fac1 - p[ihi] * fac2
-    ytry = fun(ptry)
-    neval += 1
-    if ytry < y[ihi]:
-        y[ihi] = ytry
-        psum[:] += ptry - p[ihi]
-        p[ihi] = ptry
-    return ytry, neval
-
-
-def _simplex_minimize(p, ftol, stol, fun, max_eval=1000):
-    """Minimization with the simplex algorithm
-
-    Modified from Numerical recipes"""
-    y = np.array([fun(s) for s in p])
-    ndim = p.shape[1]
-    assert p.shape[0] == ndim + 1
-    mpts = ndim + 1
-    neval = 0
-    psum = p.sum(axis=0)
-
-    loop = 1
-    while(True):
-        ilo = 1
-        if y[1] > y[2]:
-            ihi = 1
-            inhi = 2
-        else:
-            ihi = 2
-            inhi = 1
-        for i in range(mpts):
-            if y[i] < y[ilo]:
-                ilo = i
-            if y[i] > y[ihi]:
-                inhi = ihi
-                ihi = i
-            elif y[i] > y[inhi]:
-                if i != ihi:
-                    inhi = i
-
-        rtol = 2 * np.abs(y[ihi] - y[ilo]) / (np.abs(y[ihi]) + np.abs(y[ilo]))
-        if rtol < ftol:
+    simplex = np.array([[x, 0.0, -r], [-d, 0.5, -r], [-d, -0.5, -r], [0.0, 0.0, R]])
+    return size * simplex
+
+
+def _simplex_minimize(p, fun, stol, max_eval=1000):
+    """Minimize with the Nelder-Mead simplex algorithm.
+
+    Modified from Numerical recipes. ``fun`` evaluates multiple points at
+    once, which is used to evaluate the reflected and expanded points, as well
+    as the points of a shrunken simplex, together.
+    """
+    p = p.copy()
+    y = fun(p)
+    neval = len(p)
+    while True:
+        order = np.argsort(y, kind="stable")
+        p, y = p[order], y[order]
+        # Has the simplex collapsed?
+        if np.max(np.linalg.norm(p[1:] - p[0], axis=1)) < stol:
             break
         if neval >= max_eval:
-            raise RuntimeError('Maximum number of evaluations exceeded.')
-        if stol > 0:  # Has the simplex collapsed?
-            dsum = np.sqrt(np.sum((p[ilo] - p[ihi]) ** 2))
-            if loop > 5 and dsum < stol:
-                break
-
-        ytry, neval = try_(p, y, psum, ndim, fun, ihi, neval, -1.)
-        if ytry <= y[ilo]:
-            ytry, neval = try_(p, y, psum, ndim, fun, ihi, neval, 2.)
-        elif ytry >= y[inhi]:
-            ysave = y[ihi]
-            ytry, neval = try_(p, y, psum, ndim, fun, ihi, neval, 0.5)
-            if ytry >= ysave:
-                for i in range(mpts):
-                    if i != ilo:
-                        psum[:] = 0.5 * (p[i] + p[ilo])
-                        p[i] = psum
-                        y[i] = fun(psum)
-                neval += ndim
-                psum = p.sum(axis=0)
-        loop += 1
-'''
+            break
+        centroid = p[:-1].mean(axis=0)
+        p_try = centroid + np.array([[1.0], [2.0]]) * (centroid - p[-1])
+        y_refl, y_exp = fun(p_try)
+        neval += 2
+        if y_refl < y[0]:  # expand if that is even better
+            if y_exp < y_refl:
+                p[-1], y[-1] = p_try[1], y_exp
+            else:
+                p[-1], y[-1] = p_try[0], y_refl
+            continue
+        if y_refl < y[-2]:  # reflect
+            p[-1], y[-1] = p_try[0], y_refl
+            continue
+        # contract (outside if the reflection improved on the worst point)
+        if y_refl < y[-1]:
+            p_con = centroid + 0.5 * (p_try[0] - centroid)
+            y_ref = y_refl
+        else:
+            p_con = centroid + 0.5 * (p[-1] - centroid)
+            y_ref = y[-1]
+        y_con = fun(p_con[np.newaxis])[0]
+        neval += 1
+        if y_con < y_ref:
+            p[-1], y[-1] = p_con, y_con
+            continue
+        # shrink towards the best point
+        p[1:] = 0.5 * (p[1:] + p[0])
+        y[1:] = fun(p[1:])
+        neval += len(p) - 1
+    return p[0]
+
+
+def _fit_eval_batch(rds, B, B2, *, sensors, fwd_data, whitener, constraint):
+    """Calculate the residual sum of squares for multiple locations."""
+    cons = np.array([constraint(rd) for rd in rds])
+    good = cons >= 0
+    # Locations violating the constraint are worse than any fit inside
+    err = 1.0 - cons
+    if good.any():
+        fwd = _dipole_forwards(
+            sensors=sensors, fwd_data=fwd_data, whitener=whitener, rr=rds[good]
+        )[0]
+        _, sing, vv = np.linalg.svd(fwd.reshape(good.sum(), 3, -1), full_matrices=False)
+        one = np.einsum("ijk,k->ij", vv, B)
+        # only use the components that are not negligible (see _dipole_gof)
+        one[sing[:, 2] <= 0.2 * np.where(sing[:, 0] > 0, sing[:, 0], 1.0), 2] = 0.0
+        err[good] = 1.0 - np.sum(one * one, axis=1) / B2
+    return err
 
 
 def _fit_confidence(*, rd, Q, ori, whitener, fwd_data, sensors):
@@ -1216,24 +1285,19 @@ def _fit_confidence(*, rd, Q, ori, whitener, fwd_data, sensors):
     # Get spatial deltas in dipole coordinate directions
     deltas = (-1e-4, 1e-4)
     J = np.empty((whitener.shape[0], 6))
+    # Evaluate the forward at all displaced locations (and rd) at once
+    this_rrs = np.concatenate(
+        [rd[np.newaxis] + delta * direction for delta in deltas] + [rd[np.newaxis]]
+    )
+    fwds = _dipole_forwards(
+        sensors=sensors, fwd_data=fwd_data, whitener=whitener, rr=this_rrs
+    )[0]
+    fwds = fwds.reshape(len(this_rrs), 3, -1)
     for ii in range(3):
-        fwds = []
-        for delta in deltas:
-            this_r = rd[np.newaxis] + delta * direction[ii]
-            fwds.append(
-                np.dot(
-                    Q,
-                    _dipole_forwards(
-                        sensors=sensors, fwd_data=fwd_data, whitener=whitener, rr=this_r
-                    )[0],
-                )
-            )
-        J[:, ii] = np.diff(fwds, axis=0)[0] / np.diff(deltas)[0]
+        J[:, ii] = np.dot(Q, fwds[ii + 3] - fwds[ii]) / np.diff(deltas)[0]
     # Get current (Q) deltas in the dipole directions
     deltas = np.array([-0.01, 0.01]) * np.linalg.norm(Q)
-    this_fwd = _dipole_forwards(
-        sensors=sensors, fwd_data=fwd_data, whitener=whitener, rr=rd[np.newaxis]
-    )[0]
+    this_fwd = fwds[-1]
     for ii in range(3):
         fwds = []
         for delta in deltas:
@@ -1299,6 +1363,10 @@ def _fit_dipole(
     ori,
     rank,
     rhoend,
+    guess_idx,
+    guess_err,
+    optimizer="cobyla",
+    rd_prev=None,
 ):
     """Fit a single bit of data."""
     B = np.dot(whitener, B_orig)
@@ -1325,22 +1393,8 @@ def _fit_dipole(
         warn(f"Zero field found for time {t}")
         return np.zeros(3), 0, np.zeros(3), 0, B
 
-    idx = np.argmin(
-        [
-            _fit_eval(
-                guess_rrs[[fi], :],
-                B,
-                B2,
-                fwd_svd=fwd_svd,
-                fwd_data=None,
-                sensors=None,
-                whitener=None,
-                lwork=None,
-            )
-            for fi, fwd_svd in enumerate(guess_data["fwd_svd"])
-        ]
-    )
-    x0 = guess_rrs[idx]
+    x0 = guess_rrs[guess_idx]
+    rhobeg = 5e-2
     lwork = _svd_lwork((3, B.shape[0]))
     fun = partial(
         _fit_eval,
@@ -1352,19 +1406,40 @@ def _fit_dipole(
         sensors=sensors,
         fwd_svd=None,
     )
+    # Warm-start from the previous fit if it explains the data at least as
+    # well as the best guess, which allows for a smaller initial step
+    if rd_prev is not None and fun(rd_prev) <= guess_err:
+        x0 = rd_prev
+        rhobeg = 1e-2
 
     # Tested minimizers:
     #    Simplex, BFGS, CG, COBYLA, L-BFGS-B, Powell, SLSQP, TNC
     # Several were similar, but COBYLA won for having a handy constraint
     # function we can use to ensure we stay inside the inner skull /
-    # smallest sphere
-    rd_final = fmin_cobyla(
-        fun, x0, (constraint,), consargs=(), rhobeg=5e-2, rhoend=rhoend, disp=False
-    )
-
-    # simplex = _make_tetra_simplex() + x0
-    # _simplex_minimize(simplex, 1e-4, 2e-4, fun)
-    # rd_final = simplex[0]
+    # smallest sphere. Our simplex instead penalizes locations outside, and
+    # evaluates multiple locations in a single forward computation.
+    if optimizer == "cobyla":
+        rd_final = fmin_cobyla(
+            fun,
+            x0,
+            (constraint,),
+            consargs=(),
+            rhobeg=rhobeg,
+            rhoend=rhoend,
+            disp=False,
+        )
+    else:
+        fun_batch = partial(
+            _fit_eval_batch,
+            B=B,
+            B2=B2,
+            sensors=sensors,
+            fwd_data=fwd_data,
+            whitener=whitener,
+            constraint=constraint,
+        )
+        simplex = _make_tetra_simplex(rhobeg) + x0
+        rd_final = _simplex_minimize(simplex, fun_batch, rhoend)
 
     # Compute the dipole moment at the final point
     Q, gof, residual_noproj, n_comp = _fit_Q(
@@ -1458,6 +1533,9 @@ def fit_dipole(
     accuracy="normal",
     tol=5e-5,
     verbose=None,
+    *,
+    warm_start=False,
+    optimizer="cobyla",
 ):
     """Fit a dipole.
 
@@ -1506,10 +1584,30 @@ def fit_dipole(
         .. versionadded:: 0.24
     tol : float
         Final accuracy of the optimization (see ``rhoend`` argument of
-        :func:`scipy.optimize.fmin_cobyla`).
+        :func:`scipy.optimize.fmin_cobyla`). For ``optimizer="simplex"``,
+        the optimization stops once all simplex vertices are within ``tol``
+        (in meters) of the best one.
 
         .. versionadded:: 0.24
     %(verbose)s
+    warm_start : bool
+        If True, start the fit of each time point from the location fitted at
+        the previous time point (with a smaller initial step), as long as it
+        explains the data at least as well as the best location of the guess
+        grid. This is much faster for long, continuous recordings of slowly
+        moving sources such as phantom data. Time points are split into
+        ``n_jobs`` contiguous segments that are fitted in parallel, so warm
+        starts do not cross segment boundaries.
+
+        .. versionadded:: 1.13
+    optimizer : str
+        The optimizer to use for sequential fitting. Can be ``"cobyla"``
+        (default) to use :func:`scipy.optimize.fmin_cobyla`, or ``"simplex"``
+        to use a Nelder-Mead simplex whose candidate locations are evaluated in
+        batches, which is typically faster. Locations outside the inner skull
+        are penalized rather than strictly excluded by the simplex.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
@@ -1537,6 +1635,8 @@ def fit_dipole(
     evoked = evoked.copy()
     _validate_type(accuracy, str, "accuracy")
     _check_option("accuracy", accuracy, ("accurate", "normal"))
+    _validate_type(warm_start, bool, "warm_start")
+    _check_option("optimizer", optimizer, ("cobyla", "simplex"))
 
     # Determine if a list of projectors has an average EEG ref
     if _needs_eeg_average_ref_proj(evoked.info):
@@ -1743,9 +1843,16 @@ def fit_dipole(
         _safe_svd(fwd, full_matrices=False)
         for fwd in np.array_split(guess_fwd, len(guess_src["rr"]))
     ]
+    # stacked right singular vectors for scoring all guesses at once, with the
+    # weakest component dropped where it is negligible (see _dipole_gof)
+    guess_fwd_vv = np.array([vv for _, _, vv in guess_fwd_svd])
+    for vv, (_, sing, _) in zip(guess_fwd_vv, guess_fwd_svd):
+        if not sing[2] / (sing[0] if sing[0] > 0 else 1.0) > 0.2:
+            vv[2] = 0.0
     guess_data = dict(
         fwd=guess_fwd,
         fwd_svd=guess_fwd_svd,
+        fwd_vv=guess_fwd_vv,
         fwd_orig=guess_fwd_orig,
         scales=guess_fwd_scales,
     )
@@ -1771,6 +1878,8 @@ def fit_dipole(
         n_jobs=n_jobs,
         rank=rank,
         rhoend=tol,
+        warm_start=warm_start,
+        optimizer=optimizer,
     )
     assert len(out) == 8
     if fixed_position and ori is not None:
@@ -14,6 +14,7 @@
 from copy import deepcopy
 
 import numpy as np
+from scipy import sparse
 
 from .._fiff.constants import FIFF
 from ..bem import _import_openmeeg, _make_openmeeg_geometry
@@ -85,7 +86,7 @@ def _lin_field_coeff(surf, mult, rmags, cosmags, ws, bins, n_jobs):
         (?)
     """
     parallel, p_fun, n_jobs = parallel_func(
-        _do_lin_field_coeff, n_jobs, max_jobs=len(surf["tris"])
+        _do_lin_field_coeff, n_jobs, max_jobs=len(surf["tris"]), prefer="threads"
     )
     nas = np.array_split
     coeffs = parallel(
@@ -271,6 +272,9 @@ def _bem_specify_els(bem, els, mults):
 
 _MAG_FACTOR = 1e-7  # μ_0 / (4π)
 
+# Number of elements in the intermediate arrays of one block of sources
+_FWD_BLOCK_SIZE = 2**18
+
 # def _bem_inf_pot(rd, Q, rp):
 #     """The infinite medium potential in one direction. See Eq. (8) in
 #     Mosher, 1999"""
@@ -281,7 +285,6 @@ _MAG_FACTOR = 1e-7  # μ_0 / (4π)
 #     return np.sum(Q * diff, axis=1) / (diff2 * np.sqrt(diff2))
 
 
-@jit()
 def _bem_inf_pots(mri_rr, bem_rr, mri_Q=None):
     """Compute the infinite medium potential in all 3 directions.
 
@@ -291,8 +294,11 @@ def _bem_inf_pots(mri_rr, bem_rr, mri_Q=None):
         Chunk of 3D dipole positions in MRI coordinates
     bem_rr: ndarray, shape (n_BEM_vertices, 3)
         3D vertex positions for one BEM surface
-    mri_Q : ndarray, shape (3, 3)
-        3x3 head -> MRI transform. I.e., head_mri_t.dot(np.eye(3))
+    mri_Q : ndarray, shape (3, 3) | None
+        3x3 head -> MRI transform. I.e., head_mri_t.dot(np.eye(3)). If None,
+        the potentials are for dipoles along the MRI coordinate axes, and the
+        transform can be applied to the result of the product with the
+        solution instead (which is much cheaper).
 
     Returns
     -------
@@ -300,18 +306,13 @@ def _bem_inf_pots(mri_rr, bem_rr, mri_Q=None):
     """
     # NOTE: the (μ_0 / (4π) factor has been moved to _prep_field_communication
     # Get position difference vector between BEM vertex and dipole
-    diff = np.empty((len(mri_rr), 3, len(bem_rr)))
-    for ri in range(mri_rr.shape[0]):
-        rr = mri_rr[ri]
-        this_diff = bem_rr - rr
-        diff_norm = np.sum(this_diff * this_diff, axis=1)
-        diff_norm *= np.sqrt(diff_norm)
-        diff_norm[diff_norm == 0] = 1.0
-        if mri_Q is not None:
-            this_diff = np.dot(this_diff, mri_Q.T)
-        this_diff /= diff_norm.reshape(-1, 1)
-        diff[ri] = this_diff.T
-
+    diff = np.ascontiguousarray(bem_rr.T)[np.newaxis] - mri_rr[:, :, np.newaxis]
+    diff_norm = np.einsum("ijk,ijk->ik", diff, diff)
+    diff_norm *= np.sqrt(diff_norm)
+    diff_norm[diff_norm == 0] = 1.0
+    diff /= diff_norm[:, np.newaxis]
+    if mri_Q is not None:
+        diff = np.einsum("ij,kjl->kil", mri_Q, diff)
     return diff
 
 
@@ -375,7 +376,9 @@ def _bem_inf_fields(rr, rmag, cosmag):
 
 
 @fill_doc
-def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
+def _bem_pot_or_field(
+    rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type, dtype=np.float64
+):
     """Calculate the magnetic field or electric potential forward solution.
 
     The code is very similar between EEG and MEG potentials, so combine them.
@@ -399,6 +402,8 @@ def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_t
     %(n_jobs)s
     coil_type : str
         'meg' or 'eeg'
+    dtype : dtype
+        The floating point type used to compute the source blocks.
 
     Returns
     -------
@@ -407,32 +412,43 @@ def _bem_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_t
     """
     # Both MEG and EEG have the inifinite-medium potentials
     # This could be just vectorized, but eats too much memory, so instead we
-    # reduce memory by chunking within _do_inf_pots and parallelize, too:
-    parallel, p_fun, n_jobs = parallel_func(_do_inf_pots, n_jobs, max_jobs=len(rr))
-    nas = np.array_split
-    B = np.sum(
-        parallel(
-            p_fun(
-                mri_rr, sr.copy(), np.ascontiguousarray(mri_Q), np.array(sol)
-            )  # copy and contig
-            for sr, sol in zip(nas(bem_rr, n_jobs), nas(solution.T, n_jobs))
-        ),
-        axis=0,
+    # process blocks of sources in threads that share the (read-only) solution
+    sol = np.ascontiguousarray(solution.T, dtype=dtype)
+    bem_rr = bem_rr.astype(dtype)
+    mri_rr = mri_rr.astype(dtype)
+    B = np.empty((len(rr) * 3, sol.shape[1]))
+    parallel, p_fun, n_jobs = parallel_func(_do_inf_pots, n_jobs, prefer="threads")
+    bounds = _rr_bounds(len(rr), 3 * len(bem_rr), n_jobs)
+    out = parallel(
+        p_fun(mri_rr[start:stop], bem_rr, mri_Q, sol) for start, stop in bounds
     )
-    # The copy()s above should make it so the whole objects don't need to be
-    # pickled...
+    for (start, stop), this_B in zip(bounds, out):
+        B[3 * start : 3 * stop] = this_B
 
     # Only MEG coils are sensitive to the primary current distribution.
     if coil_type == "meg":
         # Primary current contribution (can be calc. in coil/dipole coords)
-        parallel, p_fun, n_jobs = parallel_func(_do_prim_curr, n_jobs)
-        pcc = np.concatenate(parallel(p_fun(r, coils) for r in nas(rr, n_jobs)), axis=0)
-        B += pcc
+        rmags, cosmags, ws, bins = _triage_coils(coils)
+        # sums the weighted integration points of each coil
+        weights = sparse.csr_array(
+            (ws.astype(dtype), (np.arange(len(bins)), bins)),
+            shape=(len(bins), bins[-1] + 1),
+        )
+        rmags = rmags.astype(dtype)
+        cosmags = cosmags.astype(dtype)
+        rr = rr.astype(dtype)
+        parallel, p_fun, n_jobs = parallel_func(_do_prim_curr, n_jobs, prefer="threads")
+        bounds = _rr_bounds(len(rr), 3 * len(rmags), n_jobs)
+        out = parallel(
+            p_fun(rr[start:stop], rmags, cosmags, weights) for start, stop in bounds
+        )
+        for (start, stop), pcc in zip(bounds, out):
+            B[3 * start : 3 * stop] += pcc
         B *= _MAG_FACTOR
     return B
 
 
-def _do_prim_curr(rr, coils):
+def _do_prim_curr(rr, rmags, cosmags, weights):
     """Calculate primary currents in a set of MEG coils.
 
     See Mosher et al., 1999 Section II for discussion of primary vs. volume
@@ -442,36 +458,32 @@ def _do_prim_curr(rr, coils):
     ----------
     rr : ndarray, shape (n_dipoles, 3)
         3D dipole source positions in head coordinates
-    coils : list of dict
-        List of MEG coils where each element contains coil specific information
+    rmags : ndarray, shape (n_integration_pts, 3)
+        3D positions of MEG coil integration points
+    cosmags : ndarray, shape (n_integration_pts, 3)
+        Direction of the MEG coil integration points
+    weights : sparse array, shape (n_integration_pts, n_MEG_sensors)
+        Weight of each integration point for each MEG coil
 
     Returns
     -------
-    pc : ndarray, shape (n_sources, n_MEG_sensors)
+    pc : ndarray, shape (n_sources * 3, n_MEG_sensors)
         Primary current for set of MEG coils due to all sources
     """
-    rmags, cosmags, ws, bins = _triage_coils(coils)
-    n_coils = bins[-1] + 1
-    del coils
-    pc = np.empty((len(rr) * 3, n_coils))
-    for start, stop in _rr_bounds(rr, chunk=1):
-        pp = _bem_inf_fields(rr[start:stop], rmags, cosmags)
-        pp *= ws
-        pp = _reshape_view(pp, (3 * (stop - start), -1))
-        pc[3 * start : 3 * stop] = [
-            bincount(bins, this_pp, bins[-1] + 1) for this_pp in pp
-        ]
-    return pc
+    pp = _bem_inf_fields(rr, rmags, cosmags)
+    return _reshape_view(pp, (3 * len(rr), -1)) @ weights
 
 
-def _rr_bounds(rr, chunk=200):
-    # chunk data nicely
-    bounds = np.concatenate([np.arange(0, len(rr), chunk), [len(rr)]])
-    return zip(bounds[:-1], bounds[1:])
+def _rr_bounds(n_rr, n_per_rr, n_jobs):
+    """Split sources into blocks with cache-sized intermediate arrays."""
+    n_blocks = -(-n_rr * n_per_rr // _FWD_BLOCK_SIZE)
+    n_blocks = min(max(n_blocks, n_jobs), n_rr)
+    bounds = np.linspace(0, n_rr, n_blocks + 1).round().astype(int)
+    return list(zip(bounds[:-1], bounds[1:]))
 
 
 def _do_inf_pots(mri_rr, bem_rr, mri_Q, sol):
-    """Calculate infinite potentials for MEG or EEG sensors using chunks.
+    """Calculate infinite potentials for MEG or EEG sensors for a block.
 
     Parameters
     ----------
@@ -481,7 +493,7 @@ def _do_inf_pots(mri_rr, bem_rr, mri_Q, sol):
         3D vertex positions for all surfaces in the BEM
     mri_Q :
         3x3 head -> MRI transform. I.e., head_mri_t.dot(np.eye(3))
-    sol : ndarray, shape (n_sensors_subset, n_BEM_vertices_subset)
+    sol : ndarray, shape (n_BEM_vertices, n_sensors)
         Comes from _bem_specify_coils
 
     Returns
@@ -490,27 +502,22 @@ def _do_inf_pots(mri_rr, bem_rr, mri_Q, sol):
         Forward solution for sensors due to volume currents
     """
     # Doing work of 'fwd_bem_pot_calc' in MNE-C
-    # The following code is equivalent to this, but saves memory
-    # v0s = _bem_inf_pots(rr, bem_rr, Q)  # n_rr x 3 x n_bem_rr
-    # v0s.shape = (len(rr) * 3, v0s.shape[2])
-    # B = np.dot(v0s, sol)
-
-    # We chunk the source mri_rr's in order to save memory
-    B = np.empty((len(mri_rr) * 3, sol.shape[1]))
-    for start, stop in _rr_bounds(mri_rr):
-        # v0 in Hämäläinen et al., 1989 == v_inf in Mosher, et al., 1999
-        v0s = _bem_inf_pots(mri_rr[start:stop], bem_rr, mri_Q)
-        v0s = v0s.reshape(-1, v0s.shape[2])
-        B[3 * start : 3 * stop] = np.dot(v0s, sol)
-    return B
+    # v0 in Hämäläinen et al., 1989 == v_inf in Mosher, et al., 1999
+    v0s = _bem_inf_pots(mri_rr, bem_rr)
+    B = _reshape_view(v0s, (-1, v0s.shape[2])) @ sol
+    # rotate the dipole orientations after the product (cheaper)
+    B = np.einsum("ij,kjl->kil", mri_Q, B.reshape(len(mri_rr), 3, -1))
+    return B.reshape(3 * len(mri_rr), -1)
 
 
 # #############################################################################
 # SPHERE COMPUTATION
 
 
-def _sphere_pot_or_field(rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type):
-    """Do potential or field for spherical model."""
+def _sphere_pot_or_field(
+    rr, mri_rr, mri_Q, coils, solution, bem_rr, n_jobs, coil_type, dtype=np.float64
+):
+    """Do potential or field for spherical model (always in double precision)."""
     fun = _eeg_spherepot_coil if coil_type == "eeg" else _sphere_field
     parallel, p_fun, n_jobs = parallel_func(fun, n_jobs, max_jobs=len(rr))
     B = np.concatenate(
@@ -785,8 +792,11 @@ def _prep_field_computation(*, sensors, bem, n_jobs, verbose=None):
 
 
 @fill_doc
-def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
+def _compute_forwards_meeg(
+    rr, *, sensors, fwd_data, n_jobs, silent=False, precision="double"
+):
     """Compute MEG and EEG forward solutions for all sensor types."""
+    dtype = dict(double=np.float64, single=np.float32)[precision]
     Bs = dict()
     # The dipole location and orientation must be transformed to mri coords
     mri_rr = None
@@ -818,6 +828,7 @@ def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
             bem_rr=bem_rr,
             n_jobs=n_jobs,
             coil_type=coil_type,
+            dtype=dtype,
         )
 
         # Compensate if needed (only done for MEG systems w/compensation)
@@ -830,7 +841,7 @@ def _compute_forwards_meeg(rr, *, sensors, fwd_data, n_jobs, silent=False):
 
 
 @verbose
-def _compute_forwards(rr, *, bem, sensors, n_jobs, verbose=None):
+def _compute_forwards(rr, *, bem, sensors, n_jobs, precision="double", verbose=None):
     """Compute the MEG and EEG forward solutions."""
     # Split calculation into two steps to save (potentially) a lot of time
     # when e.g. dipole fitting
@@ -842,7 +853,7 @@ def _compute_forwards(rr, *, bem, sensors, n_jobs, verbose=None):
         sensors = deepcopy(sensors)
         fwd_data = _prep_field_computation(sensors=sensors, bem=bem, n_jobs=n_jobs)
         Bs = _compute_forwards_meeg(
-            rr, sensors=sensors, fwd_data=fwd_data, n_jobs=n_jobs
+            rr, sensors=sensors, fwd_data=fwd_data, n_jobs=n_jobs, precision=precision
         )
     else:
         Bs = _compute_forwards_openmeeg(rr, bem=bem, sensors=sensors)
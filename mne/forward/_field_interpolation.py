@@ -38,7 +38,15 @@ def _setup_dots(mode, info, coils, ch_type):
     noise = make_ad_hoc_cov(info, dict(mag=20e-15, grad=5e-13, eeg=1e-6))
     n_coeff, interp = (50, "nearest") if mode == "fast" else (100, "linear")
     lut, n_fact = _get_legen_table(ch_type, False, n_coeff, verbose=False)
-    lut_fun = interp1d(np.linspace(-1, 1, lut.shape[0]), lut, interp, axis=0)
+    # avoid copying the (memory-mapped) table
+    lut_fun = interp1d(
+        np.linspace(-1, 1, lut.shape[0]),
+        lut,
+        interp,
+        axis=0,
+        copy=False,
+        assume_sorted=True,
+    )
     return int_rad, noise, lut_fun, n_fact
 
 
@@ -139,6 +147,12 @@ def _map_meg_or_eeg_channels(info_from, info_to, mode, *, origin, miss=None):
     mapping : array, shape (n_to, n_from)
         A mapping matrix.
     """
+    fmd = _setup_mapping_dots(info_from, info_to, mode, origin=origin)
+    return _compute_mapping_matrix(fmd, info_from)
+
+
+def _setup_mapping_dots(info_from, info_to, mode, *, origin):
+    """Compute the field mapping data (self and cross dot products)."""
     assert origin is not None  # should be assured elsewhere
 
     # no need to apply trans because both from and to coils are in device
@@ -213,12 +227,7 @@ def _map_meg_or_eeg_channels(info_from, info_to, mode, *, origin, miss=None):
         miss=miss,
         pinv_method=pinv_method,
     )
-
-    #
-    # Step 3. Compute the mapping matrix
-    #
-    mapping = _compute_mapping_matrix(fmd, info_from)
-    return mapping
+    return fmd
 
 
 def _as_meg_type_inst(inst, ch_type="grad", mode="fast"):
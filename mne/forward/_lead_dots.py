@@ -15,6 +15,11 @@ from ..fixes import _reshape_view
 from ..parallel import parallel_func
 from ..utils import _get_extra_data_path, _open_lock, fill_doc, logger, verbose
 
+# Memory-mapped Legendre tables, keyed by file name
+_LEGEN_TABLES = dict()
+# P_n, P_n', P_n', and P_n'' are used by the four MEG sums
+_MEG_LUT_COLS = [0, 1, 1, 2]
+
 ##############################################################################
 # FAST LEGENDRE (DERIVATIVE) POLYNOMIALS USING LOOKUP TABLE
 
@@ -76,17 +81,23 @@ def _get_legen_table(
         leg_fun = _get_legen
         extra_str = ""
         lut_shape = (n_interp + 1, n_coeff)
-    if not op.isfile(fname) or force_calc:
+    if force_calc:
         logger.info(f"Generating Legendre{extra_str} table...")
-        x_interp = np.linspace(-1, 1, n_interp + 1)
-        lut = leg_fun(x_interp, n_coeff).astype(np.float32)
-        if not force_calc:
-            with _open_lock(fname, "wb") as fid:
-                fid.write(lut.tobytes())
+        lut = _compute_legen_table(leg_fun, n_interp, n_coeff)
     else:
-        logger.info(f"Reading Legendre{extra_str} table...")
-        with _open_lock(fname, "rb", buffering=0) as fid:
-            lut = np.fromfile(fid, np.float32)
+        lut = _LEGEN_TABLES.get(fname)
+        if lut is None:
+            if not op.isfile(fname):
+                logger.info(f"Generating Legendre{extra_str} table...")
+                lut = _compute_legen_table(leg_fun, n_interp, n_coeff)
+                with _open_lock(fname, "wb") as fid:
+                    fid.write(lut.tobytes())
+            logger.info(f"Reading Legendre{extra_str} table...")
+            # Memory-map the table read-only so that it is paged in lazily and
+            # shared (through the OS page cache) by all workers using it
+            with _open_lock(fname, "rb", buffering=0) as fid:
+                lut = np.memmap(fid, np.float32, mode="r", shape=lut_shape)
+            _LEGEN_TABLES[fname] = lut
     lut = _reshape_view(lut, lut_shape)
 
     # we need this for the integration step
@@ -99,19 +110,25 @@ def _get_legen_table(
             n_facts.append(n_fact / (2.0 * n_fact + 1.0))
         n_facts.append(n_facts[0] / (n_fact + 1.0))
         n_facts.append(n_facts[0] * (n_fact + 1.0))
-        # skip the first set of coefficients because they are not used
-        lut = lut[:, 1:, [0, 1, 1, 2]]  # for multiplicative convenience later
-        # reshape this for convenience, too
+        # reshape this for convenience, the LUT columns used by each of the
+        # four sums are given by _MEG_LUT_COLS
         n_facts = np.array(n_facts)[[2, 0, 1, 1], :].T
         n_facts = np.ascontiguousarray(n_facts)
         n_fact = n_facts
     else:  # 'eeg'
         n_fact = (2.0 * n_fact + 1.0) * (2.0 * n_fact + 1.0) / n_fact
-        # skip the first set of coefficients because they are not used
-        lut = lut[:, 1:].copy()
+    # skip the first set of coefficients because they are not used (this is a
+    # view, so memory-mapped tables are not read into memory here)
+    lut = lut[:, 1:]
     return lut, n_fact
 
 
+def _compute_legen_table(leg_fun, n_interp, n_coeff):
+    """Compute a Legendre (derivative) table."""
+    x_interp = np.linspace(-1, 1, n_interp + 1)
+    return leg_fun(x_interp, n_coeff).astype(np.float32)
+
+
 def _comp_sum_eeg(beta, ctheta, lut_fun, n_fact):
     """Lead field dot products using Legendre polynomial (P_n) series."""
     # Compute the sum occurring in the evaluation.
@@ -159,26 +176,27 @@ def _comp_sums_meg(beta, ctheta, lut_fun, n_fact, volume_integral):
     #  * sums[:, 3]    n/((2n+1)(n+1)) beta^(n+1) P_n''
 
     # This is equivalent, but slower:
-    # sums = np.sum(bbeta[:, :, np.newaxis].T * n_fact * coeffs, axis=1)
-    # sums = np.rollaxis(sums, 2)
-    # or
-    # sums = np.einsum('ji,jk,ijk->ki', bbeta, n_fact, lut_fun(ctheta)))
+    # sums = np.einsum('ji,jk,ijk->ki', bbeta, n_fact,
+    #                  lut_fun(ctheta)[..., _MEG_LUT_COLS]))
+    # Instead we fold the LUT column selection into the coefficients so that
+    # the weighted sum becomes a single matrix product
+    n_fact_cols = np.zeros((n_fact.shape[0], 3, n_fact.shape[1]))
+    for ci, col in enumerate(_MEG_LUT_COLS):
+        n_fact_cols[:, col, ci] = n_fact[:, ci]
+    n_fact_cols = _reshape_view(n_fact_cols, (-1, n_fact.shape[1]))
     sums = np.empty((n_fact.shape[1], len(beta)))
     # beta can be e.g. 3 million elements, which ends up using lots of memory
     # so we split up the computations into ~50 MB blocks
     n_chunk = 50000000 // (8 * max(n_fact.shape) * 2)
     lims = np.concatenate([np.arange(0, beta.size, n_chunk), [beta.size]])
     for start, stop in zip(lims[:-1], lims[1:]):
-        bbeta = np.tile(beta[start:stop][np.newaxis], (n_fact.shape[0], 1))
-        bbeta[0] *= beta[start:stop]
-        np.cumprod(bbeta, axis=0, out=bbeta)  # run inplace
-        np.einsum(
-            "ji,jk,ijk->ki",
-            bbeta,
-            n_fact,
-            lut_fun(ctheta[start:stop]),
-            out=sums[:, start:stop],
-        )
+        bbeta = np.tile(beta[start:stop][:, np.newaxis], (1, n_fact.shape[0]))
+        bbeta[:, 0] *= beta[start:stop]
+        np.cumprod(bbeta, axis=1, out=bbeta)  # run inplace
+        coeffs = lut_fun(ctheta[start:stop]).astype(np.float64, copy=False)
+        coeffs *= bbeta[:, :, np.newaxis]
+        coeffs = _reshape_view(coeffs, (stop - start, -1))
+        sums[:, start:stop] = (coeffs @ n_fact_cols).T
     return sums
 
 
@@ -187,46 +205,42 @@ def _comp_sums_meg(beta, ctheta, lut_fun, n_fact, volume_integral):
 
 _meg_const = 4e-14 * np.pi  # This is \mu_0^2/4\pi
 _eeg_const = 1.0 / (4.0 * np.pi)
+# Number of integration point pairs evaluated at once
+_DOTS_BLOCK_SIZE = 2**16
 
 
-def _fast_sphere_dot_r0(
+def _sphere_dot_kernel(
     r,
-    rr1_orig,
-    rr2s,
+    rr1,
     lr1,
-    lr2s,
     cosmags1,
-    cosmags2s,
-    w1,
-    w2s,
+    rr2,
+    lr2,
+    cosmags2,
     volume_integral,
     lut,
     n_fact,
     ch_type,
 ):
-    """Lead field dot product computation for M/EEG in the sphere model.
+    """Lead field dot products between two sets of integration points.
 
     Parameters
     ----------
     r : float
         The integration radius. It is used to calculate beta as:
         beta = (r * r) / (lr1 * lr2).
-    rr1 : array, shape (n_points x 3)
-        Normalized position vectors of integrations points in first sensor.
-    rr2s : list
-        Normalized position vector of integration points in second sensor.
-    lr1 : array, shape (n_points x 1)
-        Magnitude of position vector of integration points in first sensor.
-    lr2s : list
-        Magnitude of position vector of integration points in second sensor.
-    cosmags1 : array, shape (n_points x 1)
-        Direction of integration points in first sensor.
-    cosmags2s : list
-        Direction of integration points in second sensor.
-    w1 : array, shape (n_points x 1) | None
-        Weights of integration points in the first sensor.
-    w2s : list
-        Weights of integration points in the second sensor.
+    rr1 : array, shape (n_points1, 3)
+        Normalized position vectors of the first set of integration points.
+    lr1 : array, shape (n_points1,)
+        Magnitude of the position vectors of the first set of points.
+    cosmags1 : array, shape (n_points1, 3)
+        Direction of the first set of integration points.
+    rr2 : array, shape (n_points2, 3)
+        Normalized position vectors of the second set of integration points.
+    lr2 : array, shape (n_points2,)
+        Magnitude of the position vectors of the second set of points.
+    cosmags2 : array, shape (n_points2, 3)
+        Direction of the second set of integration points.
     volume_integral : bool
         If True, compute volume integral.
     lut : callable
@@ -238,49 +252,25 @@ def _fast_sphere_dot_r0(
 
     Returns
     -------
-    result : float
-        The integration sum.
+    result : array, shape (n_points1, n_points2)
+        The (unweighted) integration products for all pairs of points.
     """
-    if w1 is None:  # operating on surface, treat independently
-        out_shape = (len(rr2s), len(rr1_orig))
-        sum_axis = 1  # operate along second axis only at the end
-    else:
-        out_shape = (len(rr2s),)
-        sum_axis = None  # operate on flattened array at the end
-    out = np.empty(out_shape)
-    rr2 = np.concatenate(rr2s)
-    lr2 = np.concatenate(lr2s)
-    cosmags2 = np.concatenate(cosmags2s)
-
     # outer product, sum over coords
-    ct = np.einsum("ik,jk->ij", rr1_orig, rr2)
+    ct = rr1 @ rr2.T
     np.clip(ct, -1, 1, ct)
-
-    # expand axes
-    rr1 = rr1_orig[:, np.newaxis, :]  # (n_rr1, n_rr2, n_coord) e.g. 4x4x3
-    rr2 = rr2[np.newaxis, :, :]
     lr1lr2 = lr1[:, np.newaxis] * lr2[np.newaxis, :]
 
     beta = (r * r) / lr1lr2
     if ch_type == "meg":
-        sums = _comp_sums_meg(
-            beta.flatten(), ct.flatten(), lut, n_fact, volume_integral
-        )
+        sums = _comp_sums_meg(beta.ravel(), ct.ravel(), lut, n_fact, volume_integral)
         sums = _reshape_view(sums, ((4,) + beta.shape))
 
         # Accumulate the result, a little bit streamlined version
-        # cosmags1 = cosmags1[:, np.newaxis, :]
-        # cosmags2 = cosmags2[np.newaxis, :, :]
-        # n1c1 = np.sum(cosmags1 * rr1, axis=2)
-        # n1c2 = np.sum(cosmags1 * rr2, axis=2)
-        # n2c1 = np.sum(cosmags2 * rr1, axis=2)
-        # n2c2 = np.sum(cosmags2 * rr2, axis=2)
-        # n1n2 = np.sum(cosmags1 * cosmags2, axis=2)
-        n1c1 = np.einsum("ik,ijk->ij", cosmags1, rr1)
-        n1c2 = np.einsum("ik,ijk->ij", cosmags1, rr2)
-        n2c1 = np.einsum("jk,ijk->ij", cosmags2, rr1)
-        n2c2 = np.einsum("jk,ijk->ij", cosmags2, rr2)
-        n1n2 = np.einsum("ik,jk->ij", cosmags1, cosmags2)
+        n1c1 = np.sum(cosmags1 * rr1, axis=1)[:, np.newaxis]
+        n1c2 = cosmags1 @ rr2.T
+        n2c1 = rr1 @ cosmags2.T
+        n2c2 = np.sum(cosmags2 * rr2, axis=1)[np.newaxis]
+        n1n2 = cosmags1 @ cosmags2.T
         part1 = ct * n1c1 * n2c2
         part2 = n1c1 * n2c1 + n1c2 * n2c2
 
@@ -296,20 +286,64 @@ def _fast_sphere_dot_r0(
         if volume_integral:
             result *= r
     else:  # 'eeg'
-        result = _comp_sum_eeg(beta.flatten(), ct.flatten(), lut, n_fact)
+        result = _comp_sum_eeg(beta.ravel(), ct.ravel(), lut, n_fact)
         result = _reshape_view(result, beta.shape)
         # Give it a finishing touch!
         result *= _eeg_const
         result /= lr1lr2
-        # now we add them all up with weights
-    offset = 0
-    result *= np.concatenate(w2s)
-    if w1 is not None:
-        result *= w1[:, np.newaxis]
-    for ii, w2 in enumerate(w2s):
-        out[ii] = np.sum(result[:, offset : offset + len(w2)], axis=sum_axis)
-        offset += len(w2)
-    return out
+    return result
+
+
+def _concatenate_coils(coils, r0):
+    """Concatenate the integration points of coils, relative to r0."""
+    rmags = np.concatenate([coil["rmag"] for coil in coils]) - r0
+    # convert to normalized distances from expansion center
+    rlens = np.linalg.norm(rmags, axis=1)
+    rmags /= rlens[:, np.newaxis]
+    cosmags = np.concatenate([coil["cosmag"] for coil in coils])
+    ws = np.concatenate([coil["w"] for coil in coils])
+    offsets = np.cumsum([0] + [len(coil["w"]) for coil in coils])
+    return rmags, rlens, cosmags, ws, offsets
+
+
+def _point_blocks(offsets, n_other):
+    """Split coils into blocks with a bounded number of point pairs."""
+    n_per = max(_DOTS_BLOCK_SIZE // max(n_other, 1), 1)
+    blocks = list()
+    start = 0
+    while start < len(offsets) - 1:
+        stop = np.searchsorted(offsets, offsets[start] + n_per, side="right") - 1
+        stop = max(stop, start + 1)
+        blocks.append((start, stop))
+        start = stop
+    return blocks
+
+
+def _coil_dots_block(intrad, pts1, pts2, sl1, sl2, volume, lut, n_fact, ch_type):
+    """Compute the weighted and coil-summed products for one block."""
+    rmags1, rlens1, cosmags1, ws1, offsets1 = pts1
+    rmags2, rlens2, cosmags2, ws2, offsets2 = pts2
+    p1 = slice(offsets1[sl1.start], offsets1[sl1.stop])
+    p2 = slice(offsets2[sl2.start], offsets2[sl2.stop])
+    result = _sphere_dot_kernel(
+        intrad,
+        rmags1[p1],
+        rlens1[p1],
+        cosmags1[p1],
+        rmags2[p2],
+        rlens2[p2],
+        cosmags2[p2],
+        volume,
+        lut,
+        n_fact,
+        ch_type,
+    )
+    # now we add them all up with weights
+    result *= ws2[p2]
+    result = np.add.reduceat(result, offsets2[sl2] - p2.start, axis=1)
+    result *= ws1[p1, np.newaxis]
+    result = np.add.reduceat(result, offsets1[sl1] - p1.start, axis=0)
+    return result
 
 
 @fill_doc
@@ -339,53 +373,45 @@ def _do_self_dots(intrad, volume, coils, r0, ch_type, lut, n_fact, n_jobs):
     -------
     products : array, shape (n_coils, n_coils)
         The integration products.
+
+    Notes
+    -----
+    All integration points are evaluated together in blocks of bounded size
+    (in threads), and only the lower triangle of the symmetric result is
+    computed.
     """
     if ch_type == "eeg":
         intrad = intrad * 0.7
-    # convert to normalized distances from expansion center
-    rmags = [coil["rmag"] - r0[np.newaxis, :] for coil in coils]
-    rlens = [np.sqrt(np.sum(r * r, axis=1)) for r in rmags]
-    rmags = [r / rl[:, np.newaxis] for r, rl in zip(rmags, rlens)]
-    cosmags = [coil["cosmag"] for coil in coils]
-    ws = [coil["w"] for coil in coils]
-    parallel, p_fun, n_jobs = parallel_func(_do_self_dots_subset, n_jobs)
+    pts = _concatenate_coils(coils, r0)
+    offsets = pts[-1]
+    parallel, p_fun, n_jobs = parallel_func(_coil_dots_block, n_jobs, prefer="threads")
+    blocks = _point_blocks(offsets, offsets[-1])
     prods = parallel(
-        p_fun(intrad, rmags, rlens, cosmags, ws, volume, lut, n_fact, ch_type, idx)
-        for idx in np.array_split(np.arange(len(rmags)), n_jobs)
-    )
-    products = np.sum(prods, axis=0)
-    return products
-
-
-def _do_self_dots_subset(
-    intrad, rmags, rlens, cosmags, ws, volume, lut, n_fact, ch_type, idx
-):
-    """Parallelize."""
-    # all possible combinations of two magnetometers
-    products = np.zeros((len(rmags), len(rmags)))
-    for ci1 in idx:
-        ci2 = ci1 + 1
-        res = _fast_sphere_dot_r0(
+        p_fun(
             intrad,
-            rmags[ci1],
-            rmags[:ci2],
-            rlens[ci1],
-            rlens[:ci2],
-            cosmags[ci1],
-            cosmags[:ci2],
-            ws[ci1],
-            ws[:ci2],
+            pts,
+            pts,
+            slice(start, stop),
+            slice(0, stop),
             volume,
             lut,
             n_fact,
             ch_type,
         )
-        products[ci1, :ci2] = res
-        products[:ci2, ci1] = res
+        for start, stop in blocks
+    )
+    products = np.zeros((len(coils), len(coils)))
+    for (start, stop), prod in zip(blocks, prods):
+        products[start:stop, :stop] = prod
+    # all possible combinations of two coils
+    products = np.tril(products) + np.tril(products, -1).T
     return products
 
 
-def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, lut, n_fact):
+@fill_doc
+def _do_cross_dots(
+    intrad, volume, coils1, coils2, r0, ch_type, lut, n_fact, n_jobs=None
+):
     """Compute lead field dot product integrations between two coil sets.
 
     The code is a direct translation of MNE-C code found in
@@ -410,6 +436,7 @@ def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, lut, n_fact):
         Look-up table for evaluating Legendre polynomials.
     n_fact : array
         Coefficients in the integration sum.
+    %(n_jobs)s
 
     Returns
     -------
@@ -418,39 +445,25 @@ def _do_cross_dots(intrad, volume, coils1, coils2, r0, ch_type, lut, n_fact):
     """
     if ch_type == "eeg":
         intrad = intrad * 0.7
-    rmags1 = [coil["rmag"] - r0[np.newaxis, :] for coil in coils1]
-    rmags2 = [coil["rmag"] - r0[np.newaxis, :] for coil in coils2]
-
-    rlens1 = [np.sqrt(np.sum(r * r, axis=1)) for r in rmags1]
-    rlens2 = [np.sqrt(np.sum(r * r, axis=1)) for r in rmags2]
-
-    rmags1 = [r / rl[:, np.newaxis] for r, rl in zip(rmags1, rlens1)]
-    rmags2 = [r / rl[:, np.newaxis] for r, rl in zip(rmags2, rlens2)]
-
-    ws1 = [coil["w"] for coil in coils1]
-    ws2 = [coil["w"] for coil in coils2]
-
-    cosmags1 = [coil["cosmag"] for coil in coils1]
-    cosmags2 = [coil["cosmag"] for coil in coils2]
-
-    products = np.zeros((len(rmags1), len(rmags2)))
-    for ci1 in range(len(coils1)):
-        res = _fast_sphere_dot_r0(
+    pts1 = _concatenate_coils(coils1, r0)
+    pts2 = _concatenate_coils(coils2, r0)
+    parallel, p_fun, n_jobs = parallel_func(_coil_dots_block, n_jobs, prefer="threads")
+    all2 = slice(0, len(coils2))
+    prods = parallel(
+        p_fun(
             intrad,
-            rmags1[ci1],
-            rmags2,
-            rlens1[ci1],
-            rlens2,
-            cosmags1[ci1],
-            cosmags2,
-            ws1[ci1],
-            ws2,
+            pts1,
+            pts2,
+            slice(start, stop),
+            all2,
             volume,
             lut,
             n_fact,
             ch_type,
         )
-        products[ci1, :] = res
+        for start, stop in _point_blocks(pts1[-1], pts2[-1][-1])
+    )
+    products = np.concatenate(prods, axis=0)
     return products
 
 
@@ -485,122 +498,39 @@ def _do_surface_dots(
 
     Returns
     -------
-    products : array, shape (n_coils, n_coils)
+    products : array, shape (n_vertices, n_coils)
         The integration products.
     """
-    # convert to normalized distances from expansion center
-    rmags = [coil["rmag"] - r0[np.newaxis, :] for coil in coils]
-    rlens = [np.sqrt(np.sum(r * r, axis=1)) for r in rmags]
-    rmags = [r / rl[:, np.newaxis] for r, rl in zip(rmags, rlens)]
-    cosmags = [coil["cosmag"] for coil in coils]
-    ws = [coil["w"] for coil in coils]
-    rref = None
-    refl = None
-    # virt_ref = False
+    pts = _concatenate_coils(coils, r0)
     if ch_type == "eeg":
         intrad = intrad * 0.7
-        # The virtual ref code is untested and unused, so it is
-        # commented out for now
-        # if virt_ref:
-        #     rref = virt_ref[np.newaxis, :] - r0[np.newaxis, :]
-        #     refl = np.sqrt(np.sum(rref * rref, axis=1))
-        #     rref /= refl[:, np.newaxis]
+        # The virtual ref code is untested and unused, so it is not
+        # implemented here
 
+    # each surface location is a single unweighted "coil"
     rsurf = surf["rr"][sel] - r0[np.newaxis, :]
-    lsurf = np.sqrt(np.sum(rsurf * rsurf, axis=1))
+    lsurf = np.linalg.norm(rsurf, axis=1)
     rsurf /= lsurf[:, np.newaxis]
     this_nn = surf["nn"][sel]
+    n_surf = len(rsurf)
+    pts_surf = (rsurf, lsurf, this_nn, np.ones(n_surf), np.arange(n_surf + 1))
 
-    # loop over the coils
-    parallel, p_fun, n_jobs = parallel_func(_do_surface_dots_subset, n_jobs)
+    # loop over blocks of surface locations
+    parallel, p_fun, n_jobs = parallel_func(_coil_dots_block, n_jobs, prefer="threads")
+    all_coils = slice(0, len(coils))
     prods = parallel(
         p_fun(
             intrad,
-            rsurf,
-            rmags,
-            rref,
-            refl,
-            lsurf,
-            rlens,
-            this_nn,
-            cosmags,
-            ws,
+            pts_surf,
+            pts,
+            slice(start, stop),
+            all_coils,
             volume,
             lut,
             n_fact,
             ch_type,
-            idx,
         )
-        for idx in np.array_split(np.arange(len(rmags)), n_jobs)
+        for start, stop in _point_blocks(pts_surf[-1], pts[-1][-1])
     )
-    products = np.sum(prods, axis=0)
-    return products
-
-
-def _do_surface_dots_subset(
-    intrad,
-    rsurf,
-    rmags,
-    rref,
-    refl,
-    lsurf,
-    rlens,
-    this_nn,
-    cosmags,
-    ws,
-    volume,
-    lut,
-    n_fact,
-    ch_type,
-    idx,
-):
-    """Parallelize.
-
-    Parameters
-    ----------
-    refl : array | None
-        If ch_type is 'eeg', the magnitude of position vector of the
-        virtual reference (never used).
-    lsurf : array
-        Magnitude of position vector of the surface points.
-    rlens : list of arrays of length n_coils
-        Magnitude of position vector.
-    this_nn : array, shape (n_vertices, 3)
-        Surface normals.
-    cosmags : list of array.
-        Direction of the integration points in the coils.
-    ws : list of array
-        Integration weights of the coils.
-    volume : bool
-        If True, compute volume integral.
-    lut : callable
-        Look-up table for evaluating Legendre polynomials.
-    n_fact : array
-        Coefficients in the integration sum.
-    ch_type : str
-        'meg' or 'eeg'
-    idx : array, shape (n_coils x 1)
-        Index of coil.
-
-    Returns
-    -------
-    products : array, shape (n_coils, n_coils)
-        The integration products.
-    """
-    products = _fast_sphere_dot_r0(
-        intrad,
-        rsurf,
-        rmags,
-        lsurf,
-        rlens,
-        this_nn,
-        cosmags,
-        None,
-        ws,
-        volume,
-        lut,
-        n_fact,
-        ch_type,
-    ).T
-    assert rref is None  # guaranteed by our code path
+    products = np.concatenate(prods, axis=0)
     return products
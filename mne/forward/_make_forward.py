@@ -5,8 +5,10 @@
 # The computations in this code were primarily derived from Matti Hämäläinen's
 # C code.
 
+import json
 import os
 import os.path as op
+import time
 from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
@@ -39,10 +41,14 @@ from ..transforms import (
 )
 from ..utils import (
     _check_fname,
+    _check_option,
     _on_missing,
     _pl,
     _validate_type,
+    get_config,
     logger,
+    object_hash,
+    sizeof_fmt,
     verbose,
     warn,
 )
@@ -626,6 +632,7 @@ def make_forward_solution(
     ignore_ref=False,
     n_jobs=None,
     on_inside="raise",
+    precision="double",
     verbose=None,
 ):
     """Calculate a forward solution for a subject.
@@ -663,6 +670,17 @@ def make_forward_solution(
         respectively.
 
         .. versionadded:: 1.10
+    precision : 'double' | 'single'
+        The floating point precision used to compute the fields and potentials
+        of the sources with the ``'mne'`` BEM solver. ``'double'`` (default)
+        uses float64 throughout. ``'single'`` computes each block of sources
+        in float32, which roughly halves the computation time for large
+        source spaces. The relative error of the gain matrix is then about
+        ``1e-6``, well below the discretization error of the BEM itself. The
+        returned forward solution is float64 in both cases. Sphere models and
+        the OpenMEEG solver always use double precision.
+
+        .. versionadded:: 1.13
     %(verbose)s
 
     Returns
@@ -689,6 +707,19 @@ def make_forward_solution(
 
     .. versionchanged:: 1.2
        Added support for OpenMEEG-based forward solution calculations.
+
+    If the ``MNE_FORWARD_CACHE_DIR`` configuration value is set to a
+    directory (see :func:`mne.set_config`), the gain of each sensor for each
+    source is cached there. Caching is disabled by default. Cached entries are
+    keyed on the sensor geometry in head coordinates, the source positions,
+    the conductor model, and the head<->MRI transformation. Only the sensors
+    and sources missing from the cache are computed, so e.g. changing the bad
+    channels or using a run with the same ``dev_head_t`` reuses the previous
+    computations. When the cache grows beyond ``MNE_FORWARD_CACHE_SIZE``
+    megabytes (default 1024), the least recently used entries are removed.
+
+    .. versionadded:: 1.13
+       Caching of forward solutions.
     """
     # Currently not (sup)ported:
     # 1. --grad option (gradients of the field, not used much)
@@ -697,6 +728,7 @@ def make_forward_solution(
 
     # read the transformation from MRI to HEAD coordinates
     # (could also be HEAD to MRI)
+    _check_option("precision", precision, ("double", "single"))
     mri_head_t, trans = _get_trans(trans)
     if isinstance(bem, ConductorModel):
         bem_extra = "instance of ConductorModel"
@@ -744,7 +776,22 @@ def make_forward_solution(
     del (src, mri_head_t, trans, info_extra, bem_extra, mindist, meg, eeg, ignore_ref)
 
     # Time to do the heavy lifting: MEG first, then EEG
-    fwds = _compute_forwards(rr, bem=bem, sensors=sensors, n_jobs=n_jobs)
+    cache_dir = get_config("MNE_FORWARD_CACHE_DIR", None)
+    if cache_dir is None or len(rr) == 0:
+        fwds = _compute_forwards(
+            rr, bem=bem, sensors=sensors, n_jobs=n_jobs, precision=precision
+        )
+    else:
+        max_size = float(get_config("MNE_FORWARD_CACHE_SIZE", 1024)) * 1024**2
+        fwds = _compute_forwards_cached(
+            rr,
+            bem=bem,
+            sensors=sensors,
+            n_jobs=n_jobs,
+            precision=precision,
+            cache_dir=Path(cache_dir),
+            max_size=max_size,
+        )
 
     # merge forwards
     fwds = {
@@ -764,6 +811,228 @@ def make_forward_solution(
     return fwd
 
 
+_FWD_CACHE_INDEX = "index.json"
+
+
+def _forward_model_key(bem, precision):
+    """Hash the conductor model (and transformation) of a forward solution."""
+    if bem["is_sphere"]:
+        model = bem
+    else:
+        model = dict(
+            surfs=[
+                dict(
+                    id=surf["id"], rr=surf["rr"], tris=surf["tris"], sigma=surf["sigma"]
+                )
+                for surf in bem["surfs"]
+            ],
+            solution=bem["solution"],
+            solver=bem.get("solver", "mne"),
+            head_mri_t=bem["head_mri_t"]["trans"],
+        )
+    return object_hash(dict(model=model, precision=precision))
+
+
+def _coil_key(coil):
+    """Hash the geometry of an MEG coil or EEG electrode."""
+    key = object_hash(
+        dict(
+            rmag=coil["rmag"],
+            cosmag=coil["cosmag"],
+            w=coil["w"],
+            coord_frame=coil["coord_frame"],
+        )
+    )
+    return f"{key:032x}"
+
+
+def _compute_forwards_cached(
+    rr, *, bem, sensors, n_jobs, precision, cache_dir, max_size
+):
+    """Compute the forward solutions, reusing cached gain blocks."""
+    model = f"{_forward_model_key(bem, precision):032x}"
+    index = _read_forward_cache_index(cache_dir)
+    used, added = set(), dict()
+    rr_idx = {r.tobytes(): ri for ri, r in enumerate(rr)}
+    Bs = dict()
+    for coil_type, sens in sensors.items():
+        coils = sens["defs"]
+        coil_keys = [_coil_key(coil) for coil in coils]
+        coil_idx = {key: ci for ci, key in enumerate(coil_keys)}
+        B = np.empty((3 * len(rr), len(coils)))
+        have = np.zeros((len(rr), len(coils)), bool)
+        # only open the blocks that share sensors with this request, most
+        # recently used first
+        for name, entry in sorted(index.items(), key=lambda item: -item[1]["used"]):
+            if have.all():
+                break
+            if not name.startswith(
+                f"{model}/{coil_type}-"
+            ) or coil_idx.keys().isdisjoint(entry["coil_keys"]):
+                continue
+            try:
+                _read_forward_block(cache_dir / name, B, have, rr_idx, coil_idx)
+            except Exception as exp:
+                logger.info(f"    Could not read cached forward {name} ({exp})")
+            else:
+                used.add(name)
+        logger.info(
+            f"Found {have.sum()}/{have.size} {coil_type.upper()} sensor-source "
+            f"pair{_pl(have.size)} in the forward cache"
+        )
+        # Sensors that are new are computed for all sources, then any missing
+        # sources are computed for the remaining sensors that lack them
+        missing = ~have
+        new_coils = np.where(missing.all(axis=0))[0]
+        old_coils = np.where(missing.any(axis=0) & ~missing.all(axis=0))[0]
+        new_rr = np.where(missing[:, old_coils].any(axis=1))[0]
+        for rr_sel, coil_sel in (
+            (np.arange(len(rr)), new_coils),
+            (new_rr, old_coils),
+        ):
+            if len(rr_sel) == 0 or len(coil_sel) == 0:
+                continue
+            these_coils = [coils[ci] for ci in coil_sel]
+            these_sensors = {
+                coil_type: dict(
+                    defs=these_coils,
+                    ch_names=[coil["chname"] for coil in these_coils],
+                )
+            }
+            this_B = _compute_forwards(
+                rr[rr_sel],
+                bem=bem,
+                sensors=these_sensors,
+                n_jobs=n_jobs,
+                precision=precision,
+            )[coil_type]
+            B[np.ix_((3 * rr_sel[:, np.newaxis] + np.arange(3)).ravel(), coil_sel)] = (
+                this_B
+            )
+            added.update(
+                _write_forward_block(
+                    cache_dir,
+                    model,
+                    coil_type,
+                    [coil_keys[ci] for ci in coil_sel],
+                    rr[rr_sel],
+                    this_B,
+                    max_size=max_size,
+                )
+            )
+
+        # Compensate if needed (only done for MEG systems w/compensation)
+        compensator = sens.get("compensator", None)
+        post_picks = sens.get("post_picks", None)
+        if compensator is not None:
+            B = B @ compensator.T
+        if post_picks is not None:
+            B = B[:, post_picks]
+        Bs[coil_type] = B
+    _update_forward_cache_index(cache_dir, used=used, added=added, max_size=max_size)
+    return Bs
+
+
+def _read_forward_block(fname, B, have, rr_idx, coil_idx):
+    """Fill the entries of B that are available from a cached block."""
+    with np.load(fname, allow_pickle=False) as npz:
+        cols = [
+            (ci, coil_idx[key])
+            for ci, key in enumerate(npz["coil_keys"])
+            if key in coil_idx
+        ]
+        if not cols:
+            return
+        rows = [
+            (ri, rr_idx[r.tobytes()])
+            for ri, r in enumerate(npz["rr"])
+            if r.tobytes() in rr_idx
+        ]
+        if not rows:
+            return
+        (cols_from, cols_to), (rows_from, rows_to) = np.array(cols).T, np.array(rows).T
+        if have[np.ix_(rows_to, cols_to)].all():
+            return
+        data = npz["data"]
+    rows_from = (3 * rows_from[:, np.newaxis] + np.arange(3)).ravel()
+    rows_to3 = (3 * rows_to[:, np.newaxis] + np.arange(3)).ravel()
+    B[np.ix_(rows_to3, cols_to)] = data[np.ix_(rows_from, cols_from)]
+    have[np.ix_(rows_to, cols_to)] = True
+
+
+def _write_forward_block(cache_dir, model, coil_type, coil_keys, rr, data, *, max_size):
+    """Write a block of a forward solution to the cache.
+
+    Returns the index entry of the block as a dict (empty if not written).
+    """
+    key = object_hash(dict(coil_keys=coil_keys, rr=rr))
+    name = f"{model}/{coil_type}-{key:032x}-fwd.npz"
+    fname = cache_dir / name
+    if data.nbytes + rr.nbytes > max_size:
+        logger.info(f"    Forward block too large to cache ({sizeof_fmt(data.nbytes)})")
+        return dict()
+    # write to a temporary file first so that concurrent runs never see a
+    # partially written file
+    tmp_fname = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+    try:
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_fname, "wb") as fid:
+            np.savez(fid, coil_keys=np.array(coil_keys), rr=rr, data=data)
+        os.replace(tmp_fname, fname)
+    except Exception as exp:
+        logger.info(f"    Could not cache forward solution in {cache_dir} ({exp})")
+        if tmp_fname.exists():
+            tmp_fname.unlink()
+        return dict()
+    entry = dict(coil_keys=coil_keys, size=fname.stat().st_size, used=time.time())
+    return {name: entry}
+
+
+def _read_forward_cache_index(cache_dir):
+    """Read the index of the forward cache (a dict of blocks)."""
+    try:
+        with open(cache_dir / _FWD_CACHE_INDEX) as fid:
+            return json.load(fid)["blocks"]
+    except Exception:  # missing or unreadable, blocks will be cleaned up
+        return dict()
+
+
+def _update_forward_cache_index(cache_dir, *, used, added, max_size):
+    """Add and touch blocks in the forward cache index and limit its size."""
+    if not used and not added:
+        return
+    try:
+        # re-read so that entries added by concurrent runs are kept
+        index = _read_forward_cache_index(cache_dir)
+        index.update(added)
+        now = time.time()
+        for name in used.intersection(index):
+            index[name]["used"] = now
+        # remove entries without a file and files without an entry
+        on_disk = {
+            f"{fname.parent.name}/{fname.name}"
+            for fname in cache_dir.glob("*/*-fwd.npz")
+        }
+        for name in set(index) - on_disk:
+            del index[name]
+        for name in on_disk - set(index):
+            (cache_dir / name).unlink(missing_ok=True)
+        # evict the least recently used blocks
+        size = sum(entry["size"] for entry in index.values())
+        for name in sorted(index, key=lambda name: index[name]["used"]):
+            if size <= max_size:
+                break
+            size -= index.pop(name)["size"]
+            (cache_dir / name).unlink(missing_ok=True)
+        fname = cache_dir / _FWD_CACHE_INDEX
+        tmp_fname = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+        with open(tmp_fname, "w") as fid:
+            json.dump(dict(blocks=index), fid)
+        os.replace(tmp_fname, fname)
+    except Exception as exp:
+        logger.info(f"    Could not update the forward cache index ({exp})")
+
+
 @verbose
 def make_forward_dipole(
     dipole, bem, info, trans=None, n_jobs=None, *, on_inside="raise", verbose=None
@@ -20,12 +20,14 @@ import mne
 from mne import Epochs, make_fixed_length_events, pick_types, read_evokeds
 from mne.datasets import testing
 from mne.fixes import _reshape_view
-from mne.forward import _make_surface_mapping, make_field_map
+from mne.forward import _lead_dots, _make_surface_mapping, make_field_map
 from mne.forward._field_interpolation import _setup_dots
 from mne.forward._lead_dots import (
     _comp_sum_eeg,
     _comp_sums_meg,
     _do_cross_dots,
+    _do_self_dots,
+    _do_surface_dots,
     _get_legen_table,
 )
 from mne.forward._make_forward import _create_meg_coils
@@ -36,6 +38,8 @@ base_dir = op.join(op.dirname(__file__), "..", "..", "io", "tests", "data")
 raw_fname = op.join(base_dir, "test_raw.fif")
 evoked_fname = op.join(base_dir, "test-ave.fif")
 raw_ctf_fname = op.join(base_dir, "test_ctf_raw.fif")
+bti_fname = op.join(base_dir, "..", "..", "bti", "tests", "data")
+bti_fname = op.join(bti_fname, "exported4D_linux_raw.fif")
 
 data_path = testing.data_path(download=False)
 trans_fname = op.join(data_path, "MEG", "sample", "sample_audvis_trunc-trans.fif")
@@ -128,6 +132,52 @@ def test_legendre_table():
         assert_allclose(n_fact1, n_fact2)
 
 
+def test_legendre_table_memmap():
+    """Test that Legendre tables are memory-mapped and shared."""
+    for ch_type in ("eeg", "meg"):
+        lut1, _ = _get_legen_table(ch_type, n_coeff=25)
+        lut2, _ = _get_legen_table(ch_type, n_coeff=25)
+        assert isinstance(lut1, np.memmap)
+        assert not lut1.flags.writeable
+        assert np.shares_memory(lut1, lut2)
+        lut3, _ = _get_legen_table(ch_type, n_coeff=25, force_calc=True)
+        assert_array_equal(lut1, lut3)
+
+
+def test_lead_dots_blocks(monkeypatch):
+    """Test blockwise evaluation of the lead field dot products."""
+    info = mne.io.read_info(bti_fname)
+    info = mne.pick_info(info, pick_types(info, meg=True)[::8])
+    coils = _create_meg_coils(info["chs"], "normal", info["dev_head_t"])
+    surf = get_meg_helmet_surf(info)
+    sel = np.arange(0, len(surf["rr"]), 10)
+    r0 = np.array([0.0, 0.0, 0.04])
+    int_rad, _, lut_fun, n_fact = _setup_dots("fast", info, coils, "meg")
+    args = (int_rad, False)
+    kwargs = dict(r0=r0, ch_type="meg", lut=lut_fun, n_fact=n_fact)
+    self_dots = _do_self_dots(*args, coils, n_jobs=None, **kwargs)
+    assert_allclose(self_dots, self_dots.T, rtol=0, atol=0)
+    cross_dots = _do_cross_dots(*args, coils, coils, **kwargs)
+    assert_allclose(self_dots, cross_dots, rtol=1e-12)
+    surface_dots = _do_surface_dots(*args, coils, surf, sel, n_jobs=None, **kwargs)
+    assert surface_dots.shape == (len(sel), len(coils))
+    # many small blocks in multiple threads give the same result
+    monkeypatch.setattr(_lead_dots, "_DOTS_BLOCK_SIZE", 7)
+    assert_allclose(
+        _do_self_dots(*args, coils, n_jobs=2, **kwargs), self_dots, rtol=1e-12
+    )
+    assert_allclose(
+        _do_cross_dots(*args, coils[::2], coils, n_jobs=2, **kwargs),
+        cross_dots[::2],
+        rtol=1e-12,
+    )
+    assert_allclose(
+        _do_surface_dots(*args, coils, surf, sel, n_jobs=2, **kwargs),
+        surface_dots,
+        rtol=1e-12,
+    )
+
+
 @testing.requires_testing_data
 def test_make_field_map_eeg():
     """Test interpolation of EEG field onto head."""
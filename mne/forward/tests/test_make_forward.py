@@ -2,6 +2,8 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import json
+import re
 from itertools import product
 from pathlib import Path
 
@@ -31,7 +33,13 @@ from mne.bem import make_bem_solution, read_bem_surfaces
 from mne.channels import make_standard_montage
 from mne.datasets import testing
 from mne.dipole import Dipole, fit_dipole
-from mne.forward import Forward, _do_forward_solution, use_coil_def
+from mne.forward import (
+    Forward,
+    _compute_forward,
+    _do_forward_solution,
+    _make_forward,
+    use_coil_def,
+)
 from mne.forward._compute_forward import _magnetic_dipole_field_vec
 from mne.forward._make_forward import (
     _create_meg_coils,
@@ -48,6 +56,7 @@ from mne.source_space._source_space import (
     write_source_spaces,
 )
 from mne.surface import _get_ico_surface
+from mne.tests.test_bem import _make_ellipsoid_bem_surfaces
 from mne.transforms import Transform, apply_trans, invert_transform
 from mne.utils import (
     _record_warnings,
@@ -947,3 +956,147 @@ def test_make_forward_iterative():
         fwd_data.append(fm.compute(ss)["sol"]["data"])
     fwd_data = np.concatenate(fwd_data, axis=1)
     assert_allclose(fwd_data, fwd["sol"]["data"])
+
+
+def _make_ellipsoid_forward_kwargs(n_ico=1, radius=0.06):
+    """Make MEG and EEG forward inputs that do not need testing data."""
+    bem = make_bem_solution(_make_ellipsoid_bem_surfaces(), verbose=False)
+    rr = _get_ico_surface(n_ico)["rr"]
+    rr /= np.linalg.norm(rr, axis=1, keepdims=True)
+    info = create_info(2 * len(rr), 1000.0, ["mag"] * len(rr) + ["eeg"] * len(rr))
+    info["dev_head_t"] = Transform("meg", "head", np.eye(4))
+    for ii, ch in enumerate(info["chs"]):
+        pos = rr[ii % len(rr)] * (0.12 if ii < len(rr) else 0.1)
+        ch["loc"][:] = 0.0
+        ch["loc"][:12] = np.concatenate((pos, np.eye(3).ravel()))
+    trans = Transform("head", "mri", np.eye(4))
+    src = setup_volume_source_space(pos=15.0, sphere=(0.0, 0.0, 0.0, radius))
+    return dict(info=info, trans=trans, src=src, bem=bem, verbose=False)
+
+
+def test_make_forward_solution_blocks_precision(monkeypatch):
+    """Test blocked, threaded and single precision BEM field computations."""
+    kwargs = _make_ellipsoid_forward_kwargs()
+    n_meg = len(kwargs["info"]["ch_names"]) // 2
+    fwd = make_forward_solution(**kwargs)
+    data = fwd["sol"]["data"]
+    assert np.isfinite(data).all()
+    # small blocks in parallel threads
+    monkeypatch.setattr(_compute_forward, "_FWD_BLOCK_SIZE", 1000)
+    fwd_blocks = make_forward_solution(n_jobs=2, **kwargs)
+    assert_allclose(
+        fwd_blocks["sol"]["data"], data, rtol=1e-10, atol=1e-10 * abs(data).max()
+    )
+    # single precision
+    fwd_single = make_forward_solution(precision="single", **kwargs)
+    assert fwd_single["sol"]["data"].dtype == np.float64
+    for picks in (slice(None, n_meg), slice(n_meg, None)):
+        want, got = data[picks], fwd_single["sol"]["data"][picks]
+        err = np.linalg.norm(got - want, axis=0) / np.linalg.norm(want, axis=0)
+        assert_array_less(err, 1e-4)
+        assert 0 < np.median(err) < 1e-5
+    with pytest.raises(ValueError, match="Invalid value for the 'precision'"):
+        make_forward_solution(precision="half", **kwargs)
+
+
+def test_make_forward_solution_cache(tmp_path, monkeypatch):
+    """Test the forward solution cache."""
+    monkeypatch.delenv("MNE_FORWARD_CACHE_DIR", raising=False)
+    monkeypatch.delenv("MNE_FORWARD_CACHE_SIZE", raising=False)
+    kwargs = _make_ellipsoid_forward_kwargs()
+    info = kwargs["info"]
+    # caching is opt-in, and not enabled by the joblib cache directory
+    monkeypatch.setenv("MNE_CACHE_DIR", str(tmp_path))
+    want = make_forward_solution(**kwargs)["sol"]["data"]
+    assert not list(tmp_path.rglob("*-fwd.npz"))
+    cache_dir = tmp_path / "forward"
+    monkeypatch.setenv("MNE_FORWARD_CACHE_DIR", str(cache_dir))
+    n_read = list()
+    read_forward_block = _make_forward._read_forward_block
+
+    def _read_block(fname, *args):
+        n_read.append(fname)
+        return read_forward_block(fname, *args)
+
+    monkeypatch.setattr(_make_forward, "_read_forward_block", _read_block)
+
+    def _n_files():
+        return len(list(cache_dir.glob("*/*-fwd.npz")))
+
+    def _n_found(log):
+        return re.findall(r"Found (\d+)/(\d+) (MEG|EEG)", log.getvalue())
+
+    fwd = make_forward_solution(**kwargs)
+    assert_allclose(fwd["sol"]["data"], want, rtol=1e-10, atol=1e-10 * abs(want).max())
+    assert _n_files() == 2  # one MEG and one EEG block
+    with open(cache_dir / "index.json") as fid:
+        assert len(json.load(fid)["blocks"]) == 2
+    # everything is reused, also for a subset of channels
+    for this_info in (info, pick_info(info, np.arange(0, len(info["ch_names"]), 2))):
+        kwargs["info"] = this_info
+        with catch_logging() as log:
+            fwd = make_forward_solution(**{**kwargs, "verbose": True})
+        for n_found, n_total, _ in _n_found(log):
+            assert n_found == n_total != "0"
+        assert_allclose(fwd["sol"]["data"], want[:: 1 + (this_info is not info)])
+        assert fwd["info"]["ch_names"] == this_info["ch_names"]
+    assert _n_files() == 2
+    # moving one sensor only computes that sensor
+    info = info.copy()
+    info["chs"][0]["loc"][:3] *= 1.01
+    kwargs["info"] = info
+    with catch_logging() as log:
+        fwd = make_forward_solution(**{**kwargs, "verbose": True})
+    n_src = fwd["nsource"]
+    n_meg = len(info["ch_names"]) // 2
+    assert _n_found(log) == [
+        (str((n_meg - 1) * n_src), str(n_meg * n_src), "MEG"),
+        (str(n_meg * n_src), str(n_meg * n_src), "EEG"),
+    ]
+    assert _n_files() == 3
+    monkeypatch.delenv("MNE_FORWARD_CACHE_DIR")
+    want = make_forward_solution(**kwargs)["sol"]["data"]
+    assert_allclose(fwd["sol"]["data"], want, rtol=1e-10, atol=1e-10 * abs(want).max())
+    # a new head position does not open the cached MEG blocks
+    monkeypatch.setenv("MNE_FORWARD_CACHE_DIR", str(cache_dir))
+    info_moved = info.copy()
+    info_moved["dev_head_t"]["trans"][:3, 3] = [0.0, 0.0, 0.01]
+    n_read.clear()
+    with catch_logging() as log:
+        make_forward_solution(**{**kwargs, "info": info_moved, "verbose": True})
+    assert _n_found(log)[0][0] == "0"
+    assert [fname.name.split("-")[0] for fname in n_read] == ["eeg"]
+    assert _n_files() == 4
+    # a larger source space only computes the new sources
+    kwargs["src"] = _make_ellipsoid_forward_kwargs(radius=0.07)["src"]
+    monkeypatch.delenv("MNE_FORWARD_CACHE_DIR")
+    want = make_forward_solution(**kwargs)["sol"]["data"]
+    monkeypatch.setenv("MNE_FORWARD_CACHE_DIR", str(cache_dir))
+    with catch_logging() as log:
+        fwd = make_forward_solution(**{**kwargs, "verbose": True})
+    assert fwd["nsource"] > n_src
+    for n_found, n_total, _ in _n_found(log):
+        assert int(n_found) == int(n_total) * n_src // fwd["nsource"]
+    assert _n_files() == 6
+    assert_allclose(fwd["sol"]["data"], want, rtol=1e-10, atol=1e-10 * abs(want).max())
+    # the least recently used blocks are removed beyond the size limit
+    with open(cache_dir / "index.json") as fid:
+        blocks = json.load(fid)["blocks"]
+    assert set(blocks) == {
+        f"{fname.parent.name}/{fname.name}" for fname in cache_dir.glob("*/*-fwd.npz")
+    }
+    sizes = sorted(entry["size"] for entry in blocks.values())
+    monkeypatch.setenv("MNE_FORWARD_CACHE_SIZE", str(sum(sizes[-2:]) / 1024**2))
+    kwargs["info"] = pick_info(info, np.arange(1, len(info["ch_names"]), 2))
+    fwd_new = make_forward_solution(**kwargs)
+    assert_allclose(fwd_new["sol"]["data"], fwd["sol"]["data"][1::2])
+    assert 0 < _n_files() < 6
+    with open(cache_dir / "index.json") as fid:
+        blocks = json.load(fid)["blocks"]
+    assert sum(entry["size"] for entry in blocks.values()) <= sum(sizes[-2:])
+    assert len(blocks) == _n_files()
+    # blocks larger than the limit are not written
+    monkeypatch.setenv("MNE_FORWARD_CACHE_SIZE", "0")
+    kwargs["src"] = _make_ellipsoid_forward_kwargs(radius=0.05)["src"]
+    make_forward_solution(**kwargs)
+    assert _n_files() == 0
@@ -1,6 +1,7 @@
 __all__ = [
     "INVERSE_METHODS",
     "InverseOperator",
+    "InverseOperatorFactory",
     "apply_inverse",
     "apply_inverse_cov",
     "apply_inverse_epochs",
@@ -24,6 +25,7 @@ __all__ = [
 from .inverse import (
     INVERSE_METHODS,
     InverseOperator,
+    InverseOperatorFactory,
     apply_inverse,
     apply_inverse_cov,
     apply_inverse_epochs,
@@ -2,8 +2,6 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
-from functools import partial
-
 import numpy as np
 
 from ..defaults import _handle_default
@@ -24,13 +22,21 @@ from ..utils import eigh, logger, sqrtm_sym, warn
 # does not produce results that pass the eye test.
 
 
-def _compute_eloreta(inv, lambda2, options):
-    """Compute the eLORETA solution."""
+def _compute_eloreta(inv, lambda2, options, R_init=None):
+    """Compute the eLORETA solution.
+
+    If given, ``R_init`` are weights returned by a previous call (e.g., for a
+    different ``lambda2``) that are used as a warm start. The fitted weights
+    are returned.
+    """
     from .inverse import _compute_reginv, compute_rank_inverse
 
     options = _handle_default("eloreta_options", options)
     eps, max_iter = options["eps"], options["max_iter"]
     force_equal = bool(options["force_equal"])  # None means False
+    n_anderson = int(options["anderson"])
+    if n_anderson < 0:
+        raise ValueError(f"anderson must be non-negative, got {n_anderson}")
 
     # Reassemble the gain matrix (should be fast enough)
     if inv["eigen_leads_weighted"]:
@@ -73,25 +79,34 @@ def _compute_eloreta(inv, lambda2, options):
     # The following was adapted under BSD license by permission of Guido Nolte
     if force_equal or n_orient == 1:
         R_shape = (n_src * n_orient,)
-        R = np.ones(R_shape)
     else:
         R_shape = (n_src, n_orient, n_orient)
-        R = np.empty(R_shape)
-        R[:] = np.eye(n_orient)[np.newaxis]
-    R *= R_prior
-    _this_normalize_R = partial(
-        _normalize_R,
-        n_nzero=n_nzero,
-        force_equal=force_equal,
-        n_src=n_src,
-        n_orient=n_orient,
-    )
-    G_R_Gt = _this_normalize_R(G, R, G_3)
+    if R_init is not None and R_init.shape == R_shape:
+        logger.info("        Using warm-start weights")
+        R = R_init.copy()
+    else:
+        if force_equal or n_orient == 1:
+            R = np.ones(R_shape)
+        else:
+            R = np.empty(R_shape)
+            R[:] = np.eye(n_orient)[np.newaxis]
+        R *= R_prior
+    # The trace of G @ R @ G.T only needs the diagonal (blocks) of G.T @ G
+    if n_orient == 1 or force_equal:
+        GtG = np.einsum("ij,ij->j", G, G)
+    else:
+        GtG = np.matmul(G_3, G_3.swapaxes(-2, -1))
+    R /= np.sum(GtG * R) / n_nzero
     extra = " (this make take a while)" if n_orient == 3 else ""
-    logger.info(f"        Fitting up to {max_iter} iterations{extra}...")
+    accel = f" with Anderson acceleration (m={n_anderson})" if n_anderson else ""
+    logger.info(f"        Fitting up to {max_iter} iterations{accel}{extra}...")
+    # Previous iterates and their updates, for Anderson acceleration
+    Rs, R_news = list(), list()
     for kk in range(max_iter):
         # 1. Compute inverse of the weights (stabilized) and C
+        G_R_Gt = G @ _R_mult_Gt(R, G, G_3)
         s, u = eigh(G_R_Gt)
+        del G_R_Gt
         s = abs(s)
         sidx = np.argsort(s)[::-1][:n_nzero]
         s, u = s[sidx], u[:, sidx]
@@ -100,39 +115,53 @@ def _compute_eloreta(inv, lambda2, options):
         N = np.dot(u * s, u.T)
         del s
 
-        # Update the weights
-        R_last = R.copy()
+        # 2. Update the weights, computing all 3x3 blocks of G.T @ N @ G
+        # from a single matrix product
+        N_G = N @ G
         if n_orient == 1:
-            R[:] = 1.0 / np.sqrt((np.dot(N, G) * G).sum(0))
+            R_new = 1.0 / np.sqrt((N_G * G).sum(0))
         else:
-            M = np.matmul(np.matmul(G_3, N[np.newaxis]), G_3.swapaxes(-2, -1))
+            M = np.matmul(G_3, _get_G_3(N_G, n_orient).swapaxes(-2, -1))
             if force_equal:
                 _, s = sqrtm_sym(M, inv=True)
-                R[:] = np.repeat(1.0 / np.mean(s, axis=-1), 3)
+                R_new = np.repeat(1.0 / np.mean(s, axis=-1), 3)
             else:
-                R[:], _ = sqrtm_sym(M, inv=True)
-        R *= R_prior  # reapply our prior, eLORETA undoes it
-        G_R_Gt = _this_normalize_R(G, R, G_3)
+                R_new, _ = sqrtm_sym(M, inv=True)
+        del N_G
+        R_new *= R_prior  # reapply our prior, eLORETA undoes it
+        R_new /= np.sum(GtG * R_new) / n_nzero
 
         # Check for weight convergence
-        delta = np.linalg.norm(R.ravel() - R_last.ravel()) / np.linalg.norm(
-            R_last.ravel()
-        )
+        delta = np.linalg.norm(R_new.ravel() - R.ravel()) / np.linalg.norm(R.ravel())
         logger.debug(
-            f"            Iteration {kk + 1} / {max_iter} ...{extra} ({delta:0.1e})"
+            f"            Iteration {kk + 1} / {max_iter}: "
+            f"relative weight change {delta:0.1e}"
         )
         if delta < eps:
+            R = R_new
             logger.info(
                 f"        Converged on iteration {kk} ({delta:.2g} < {eps:.2g})"
             )
             break
+        if n_anderson:
+            R = _anderson_step(Rs, R_news, R, R_new, n_anderson)
+            R /= np.sum(GtG * R) / n_nzero
+        else:
+            R = R_new
     else:
-        warn(f"eLORETA weight fitting did not converge (>= {eps})")
-    del G_R_Gt
+        if max_iter:
+            warn(
+                f"eLORETA weight fitting did not converge (>= {eps}), the last "
+                f"relative weight change was {delta:0.1e}"
+            )
+        else:
+            warn(f"eLORETA weight fitting did not converge (>= {eps})")
+    del Rs, R_news, GtG
+    R_fit = R.copy()
     logger.info("        Updating inverse with weighted eigen leads")
     G /= source_std  # undo our biasing
     G_3 = _get_G_3(G, n_orient)
-    _this_normalize_R(G, R, G_3)
+    _normalize_R(G, R, G_3, n_nzero)
     del G_3
     if n_orient == 1 or force_equal:
         R_sqrt = np.sqrt(R)
@@ -156,17 +185,44 @@ def _compute_eloreta(inv, lambda2, options):
     # to work. So let's just set to nan for now.
     # It's not used downstream anyway now that we set
     # eigen_leads_weighted = True.
-    inv["source_cov"]["data"].fill(np.nan)
+    inv["source_cov"]["data"] = np.full_like(inv["source_cov"]["data"], np.nan)
     logger.info("[done]")
+    return R_fit
+
+
+def _anderson_step(Rs, R_news, R, R_new, n_anderson):
+    """Extrapolate the weights from the last fixed-point iterations."""
+    Rs.append(R.ravel())
+    R_news.append(R_new.ravel())
+    del Rs[: -(n_anderson + 1)], R_news[: -(n_anderson + 1)]
+    if len(Rs) < 2:
+        return R_new
+    # Type-II Anderson mixing: combine the updates with the weights that
+    # minimize the (linearized) residual of the combination
+    F = np.array(R_news) - np.array(Rs)
+    dF = np.diff(F, axis=0)
+    gamma = np.linalg.lstsq(dF.T, F[-1], rcond=None)[0]
+    R_acc = (R_news[-1] - gamma @ np.diff(R_news, axis=0)).reshape(R.shape)
+    # The weights must remain positive (definite), otherwise fall back to the
+    # plain update
+    if R_acc.ndim == 1:
+        positive = (R_acc > 0).all()
+    else:
+        positive = (np.linalg.eigvalsh(R_acc)[:, 0] > 0).all()
+    return R_acc if positive else R_new
 
 
-def _normalize_R(G, R, G_3, n_nzero, force_equal, n_src, n_orient):
-    """Normalize R so that lambda2 is consistent."""
-    if n_orient == 1 or force_equal:
-        R_Gt = R[:, np.newaxis] * G.T
+def _R_mult_Gt(R, G, G_3):
+    """Compute R @ G.T."""
+    if G_3 is None or R.ndim == 1:
+        return R[:, np.newaxis] * G.T
     else:
-        R_Gt = np.matmul(R, G_3).reshape(n_src * 3, -1)
-    G_R_Gt = G @ R_Gt
+        return np.matmul(R, G_3).reshape(G.shape[1], -1)
+
+
+def _normalize_R(G, R, G_3, n_nzero):
+    """Normalize R so that lambda2 is consistent."""
+    G_R_Gt = G @ _R_mult_Gt(R, G, G_3)
     norm = np.trace(G_R_Gt) / n_nzero
     G_R_Gt /= norm
     R /= norm
@@ -6,7 +6,6 @@ from copy import deepcopy
 from math import sqrt
 
 import numpy as np
-from scipy import linalg
 from scipy.stats import chi2
 
 from .._fiff.constants import FIFF
@@ -37,6 +36,7 @@ from .._fiff.write import (
     write_string,
 )
 from ..cov import Covariance, _read_cov, _write_cov, compute_whitener, prepare_noise_cov
+from ..defaults import _handle_default
 from ..epochs import BaseEpochs, EpochsArray
 from ..evoked import Evoked, EvokedArray
 from ..fixes import _reshape_view, _safe_svd
@@ -51,7 +51,7 @@ from ..forward import (
 from ..forward.forward import _triage_loose, write_forward_meas_info
 from ..html_templates import _get_html_template
 from ..io import BaseRaw
-from ..source_estimate import _get_src_type, _make_stc
+from ..source_estimate import _get_src_type, _make_stc, _rotate_vector_data
 from ..source_space._source_space import (
     _get_src_nn,
     _get_vertno,
@@ -69,9 +69,11 @@ from ..utils import (
     _check_fname,
     _check_option,
     _check_src_normal,
+    _pl,
     _validate_type,
     _verbose_safe_false,
     check_fname,
+    fill_doc,
     logger,
     repr_html,
     verbose,
@@ -699,52 +701,7 @@ def prepare_inverse_operator(
         _compute_eloreta(inv, lambda2, method_params)
     elif method != "MNE":
         logger.info(f"    Computing noise-normalization factors ({method})...")
-        # Here we have::
-        #
-        #     inv['reginv'] = sing / (sing ** 2 + lambda2)
-        #
-        # where ``sing`` are the singular values of the whitened gain matrix.
-        if method == "dSPM":
-            # dSPM normalization
-            noise_weight = inv["reginv"]
-        elif method == "sLORETA":
-            # sLORETA normalization is given by the square root of the
-            # diagonal entries of the resolution matrix R, which is
-            # the product of the inverse and forward operators as:
-            #
-            #     w = diag(diag(R)) ** 0.5
-            #
-            noise_weight = inv["reginv"] * np.sqrt(1.0 + inv["sing"] ** 2 / lambda2)
-
-        noise_norm = np.zeros(inv["eigen_leads"]["nrow"])
-        (nrm2,) = linalg.get_blas_funcs(("nrm2",), (noise_norm,))
-        if inv["eigen_leads_weighted"]:
-            for k in range(inv["eigen_leads"]["nrow"]):
-                one = inv["eigen_leads"]["data"][k, :] * noise_weight
-                noise_norm[k] = nrm2(one)
-        else:
-            for k in range(inv["eigen_leads"]["nrow"]):
-                one = (
-                    sqrt(inv["source_cov"]["data"][k])
-                    * inv["eigen_leads"]["data"][k, :]
-                    * noise_weight
-                )
-                noise_norm[k] = nrm2(one)
-
-        #
-        #   Compute the final result
-        #
-        if inv["source_ori"] == FIFF.FIFFV_MNE_FREE_ORI:
-            #
-            #   The three-component case is a little bit more involved
-            #   The variances at three consecutive entries must be squared and
-            #   added together
-            #
-            #   Even in this case return only one noise-normalization factor
-            #   per source location
-            #
-            noise_norm = combine_xyz(noise_norm[:, None]).ravel()
-        inv["noisenorm"] = 1.0 / np.abs(noise_norm)
+        inv["noisenorm"] = _compute_noise_norm(inv, lambda2, method)
         logger.info("[done]")
     else:
         inv["noisenorm"] = []
@@ -752,6 +709,50 @@ def prepare_inverse_operator(
     return InverseOperator(inv)
 
 
+def _compute_noise_norm(inv, lambda2, method):
+    """Compute the dSPM or sLORETA noise-normalization factors."""
+    # Here we have::
+    #
+    #     inv['reginv'] = sing / (sing ** 2 + lambda2)
+    #
+    # where ``sing`` are the singular values of the whitened gain matrix.
+    if method == "dSPM":
+        # dSPM normalization
+        noise_weight = inv["reginv"]
+    else:
+        assert method == "sLORETA"
+        # sLORETA normalization is given by the square root of the
+        # diagonal entries of the resolution matrix R, which is
+        # the product of the inverse and forward operators as:
+        #
+        #     w = diag(diag(R)) ** 0.5
+        #
+        noise_weight = inv["reginv"] * np.sqrt(1.0 + inv["sing"] ** 2 / lambda2)
+
+    # Row norms of the weighted eigenleads, without a (n_sources, n_eig)
+    # temporary
+    eigen_leads = inv["eigen_leads"]["data"]
+    noise_norm = np.einsum("ij,ij,j->i", eigen_leads, eigen_leads, noise_weight**2)
+    if not inv["eigen_leads_weighted"]:
+        noise_norm *= inv["source_cov"]["data"]
+    np.sqrt(noise_norm, out=noise_norm)
+
+    #
+    #   Compute the final result
+    #
+    if inv["source_ori"] == FIFF.FIFFV_MNE_FREE_ORI:
+        #
+        #   The three-component case is a little bit more involved
+        #   The variances at three consecutive entries must be squared and
+        #   added together
+        #
+        #   Even in this case return only one noise-normalization factor
+        #   per source location
+        #
+        noise_norm = combine_xyz(noise_norm[:, None]).ravel()
+    return 1.0 / np.abs(noise_norm)
+
+
 @verbose
 def _assemble_kernel(inv, label, method, pick_ori, use_cps=True, verbose=None):
     """Assemble the kernel.
@@ -987,6 +988,15 @@ def apply_inverse(
             location equal. The default is None, which means ``True`` for
             loose-orientation inverses and ``False`` for free- and
             fixed-orientation inverses. See below.
+        'anderson' : int
+            The number of previous iterations used for Anderson acceleration
+            of the weight fitting (default 0, no acceleration). Values of 3–5
+            typically reduce the number of iterations needed.
+
+            .. versionadded:: 1.13
+
+    The relative change of the weights is logged for each iteration, which
+    can be used to choose ``'eps'`` and ``'max_iter'``.
 
     The eLORETA paper :footcite:`Pascual-Marqui2011` defines how to compute
     inverses for fixed- and
@@ -1280,6 +1290,10 @@ def apply_inverse_raw(
     return stc
 
 
+# Number of source-space values (n_sources * n_times * n_epochs) computed at once
+_BATCH_SIZE = 2**23
+
+
 def _apply_inverse_epochs_gen(
     epochs,
     inverse_operator,
@@ -1291,9 +1305,15 @@ def _apply_inverse_epochs_gen(
     prepared=False,
     method_params=None,
     use_cps=True,
+    return_array=False,
+    dtype=None,
     verbose=None,
 ):
-    """Generate inverse solutions for epochs. Used in apply_inverse_epochs."""
+    """Generate inverse solutions for epochs. Used in apply_inverse_epochs.
+
+    If ``return_array``, arrays of shape (n_epochs, n_sources[, 3], n_times)
+    are generated for blocks of epochs instead of one source estimate per epoch.
+    """
     _validate_type(epochs, BaseEpochs, "epochs")
     _check_reference(epochs, inverse_operator["info"]["ch_names"])
     _check_option("method", method, INVERSE_METHODS)
@@ -1328,33 +1348,94 @@ def _apply_inverse_epochs_gen(
     if not is_free_ori and noise_norm is not None:
         # premultiply kernel with noise normalization
         K *= noise_norm
+    if dtype is not None:
+        K = K.astype(dtype, copy=False)
+        if source_nn is not None:
+            source_nn = source_nn.astype(dtype, copy=False)
 
     subject = _subject_from_inverse(inverse_operator)
+    src_type = _get_src_type(inverse_operator["src"], vertno)
     try:
         total = f" / {len(epochs)}"  # len not always defined
     except RuntimeError:
         total = f" / {len(epochs.events)} (at most)"
+    # Linear inverse with fewer channels than sources: delay the computation
+    lazy = not is_free_ori and len(sel) < K.shape[1] and not return_array
+    # Otherwise stack epochs to apply the kernel with a single matrix product
+    # per batch rather than one small product per epoch
+    n_batch = 1 if lazy else max(_BATCH_SIZE // (K.shape[0] * len(epochs.times)), 1)
+    kwargs = dict(
+        K=K,
+        noise_norm=noise_norm,
+        is_free_ori=is_free_ori,
+        lazy=lazy,
+        pick_ori=pick_ori,
+        vertno=vertno,
+        tmin=tmin,
+        tstep=tstep,
+        subject=subject,
+        source_nn=source_nn,
+        src_type=src_type,
+        return_array=return_array,
+    )
+    batch = list()
     for k, e in enumerate(epochs):
         logger.info("Processing epoch : %d%s", k + 1, total)
-        if is_free_ori:
-            # Compute solution and combine current components (non-linear)
-            sol = np.dot(K, e[sel])  # apply imaging kernel
+        batch.append(e[sel])
+        if len(batch) == n_batch:
+            yield from _apply_inverse_epochs_batch(batch, **kwargs)
+            batch = list()
+    if batch:
+        yield from _apply_inverse_epochs_batch(batch, **kwargs)
+
+    logger.info("[done]")
+
 
+def _apply_inverse_epochs_batch(
+    batch,
+    K,
+    noise_norm,
+    is_free_ori,
+    lazy,
+    pick_ori,
+    vertno,
+    tmin,
+    tstep,
+    subject,
+    source_nn,
+    src_type,
+    return_array,
+):
+    """Apply the imaging kernel to a list of epoch data arrays."""
+    if lazy:
+        sols = [(K, data.astype(K.dtype, copy=False)) for data in batch]
+    else:
+        n_epochs = len(batch)
+        n_times = batch[0].shape[1]
+        # (n_sel, n_epochs * n_times) so that a single GEMM does all epochs
+        data = np.stack(batch, axis=1).reshape(len(batch[0]), -1)
+        sol = np.dot(K, data.astype(K.dtype, copy=False))  # apply imaging kernel
+        if is_free_ori:
+            # Combine current components (non-linear)
             if pick_ori != "vector":
                 logger.info("combining the current components...")
                 sol = combine_xyz(sol)
 
             if noise_norm is not None:
                 sol *= noise_norm
-        else:
-            # Linear inverse: do computation here or delayed
-            if len(sel) < K.shape[1]:
-                sol = (K, e[sel])
-            else:
-                sol = np.dot(K, e[sel])
-
-        src_type = _get_src_type(inverse_operator["src"], vertno)
-        stc = _make_stc(
+        if return_array:
+            if pick_ori == "vector":
+                n_vertices = sum(len(v) for v in vertno)
+                sol = _rotate_vector_data(sol, source_nn, n_vertices)
+            sol = sol.reshape(sol.shape[:-1] + (n_epochs, n_times))
+            yield np.moveaxis(sol, -2, 0)
+            return
+        # copy each epoch so that a kept stc does not keep the whole batch alive
+        sols = [
+            sol[:, ii * n_times : (ii + 1) * n_times].copy() for ii in range(n_epochs)
+        ]
+    for sol in sols:
+        yield _make_stc(
             sol,
             vertno,
             tmin=tmin,
@@ -1365,10 +1446,6 @@ def _apply_inverse_epochs_gen(
             src_type=src_type,
         )
 
-        yield stc
-
-    logger.info("[done]")
-
 
 @verbose
 def apply_inverse_epochs(
@@ -1384,6 +1461,9 @@ def apply_inverse_epochs(
     method_params=None,
     use_cps=True,
     verbose=None,
+    *,
+    return_array=False,
+    dtype=None,
 ):
     """Apply inverse operator to Epochs.
 
@@ -1417,11 +1497,26 @@ def apply_inverse_epochs(
 
         .. versionadded:: 0.20
     %(verbose)s
+    return_array : bool
+        If True, return the source time courses of all epochs as a single
+        array instead of one source estimate per epoch. This avoids the
+        per-epoch overhead when the data are processed further as an array,
+        e.g. for decoding. Cannot be used with ``return_generator=True``.
+
+        .. versionadded:: 1.13
+    dtype : None | dtype
+        The floating point type used to apply the inverse kernel, e.g.
+        ``np.float32`` to halve the memory use and speed up the computation.
+        None (default) uses ``np.float64``.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
-    stcs : list of (SourceEstimate | VectorSourceEstimate | VolSourceEstimate)
-        The source estimates for all epochs.
+    stcs : list of (SourceEstimate | VectorSourceEstimate | VolSourceEstimate) | ndarray
+        The source estimates for all epochs. If ``return_array=True``, an
+        array of shape ``(n_epochs, n_sources, n_times)``, or
+        ``(n_epochs, n_sources, 3, n_times)`` for ``pick_ori="vector"``.
 
     See Also
     --------
@@ -1430,6 +1525,9 @@ def apply_inverse_epochs(
     apply_inverse_tfr_epochs : Apply inverse operator to epochs tfr object.
     apply_inverse_cov : Apply inverse operator to a covariance object.
     """
+    _validate_type(return_array, bool, "return_array")
+    if return_array and return_generator:
+        raise ValueError("return_array=True cannot be used with return_generator=True")
     stcs = _apply_inverse_epochs_gen(
         epochs,
         inverse_operator,
@@ -1442,9 +1540,13 @@ def apply_inverse_epochs(
         prepared=prepared,
         method_params=method_params,
         use_cps=use_cps,
+        return_array=return_array,
+        dtype=dtype,
     )
 
-    if not return_generator:
+    if return_array:
+        stcs = np.concatenate(list(stcs), axis=0)
+    elif not return_generator:
         # return a list
         stcs = [stc for stc in stcs]
 
@@ -2087,6 +2189,210 @@ def make_inverse_operator(
     return InverseOperator(inv)
 
 
+@fill_doc
+class InverseOperatorFactory:
+    """Make inverse operators and kernels that share one SVD.
+
+    The forward preparation (orientation conversion, depth and orientation
+    priors, whitening) and the SVD of the whitened and weighted gain matrix
+    only depend on the arguments given here. They are computed once, and
+    operators prepared for any ``nave``, ``lambda2`` and ``method`` only
+    recompute the regularized inverse of the singular values and the
+    noise-normalization factors.
+
+    Parameters
+    ----------
+    %(info_not_none)s
+        Specifies the channels to include. Bad channels (in ``info['bads']``)
+        are not used.
+    forward : instance of Forward
+        Forward operator.
+    noise_cov : instance of Covariance
+        The noise covariance matrix.
+    %(loose)s
+    %(depth)s
+    fixed : bool | 'auto'
+        Use fixed source orientations normal to the cortical mantle. If True,
+        the loose parameter must be ``"auto"`` or ``0``. If ``'auto'``, the loose value
+        is used.
+    %(rank_none)s
+    %(use_cps)s
+    %(verbose)s
+
+    Attributes
+    ----------
+    inverse_operator : instance of InverseOperator
+        The (unprepared) inverse operator, as returned by
+        :func:`make_inverse_operator`.
+
+    See Also
+    --------
+    make_inverse_operator
+    prepare_inverse_operator
+
+    Notes
+    -----
+    For ``'MNE'``, ``'dSPM'`` and ``'sLORETA'``, the weights are closed-form
+    functions of the singular values. For ``'eLORETA'``, the iterative weight
+    fit is warm-started from the weights fitted for the closest ``lambda2``
+    already prepared, which usually needs far fewer iterations. Prepared
+    operators are cached per ``(nave, lambda2, method, method_params)`` and
+    share all ``lambda2``-independent arrays with each other, so they must not
+    be modified in place.
+
+    .. versionadded:: 1.13
+    """
+
+    @verbose
+    def __init__(
+        self,
+        info,
+        forward,
+        noise_cov,
+        loose="auto",
+        depth=0.8,
+        fixed="auto",
+        rank=None,
+        use_cps=True,
+        verbose=None,
+    ):
+        self.inverse_operator = make_inverse_operator(
+            info,
+            forward,
+            noise_cov,
+            loose=loose,
+            depth=depth,
+            fixed=fixed,
+            rank=rank,
+            use_cps=use_cps,
+        )
+        self._use_cps = use_cps
+        self._scaled = dict()  # nave -> operator with scaling, proj, whitener
+        self._prepared = dict()  # (nave, lambda2, method, ...) -> operator
+        self._eloreta_R = dict()  # force_equal -> {lambda2: fitted weights}
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"<InverseOperatorFactory | {self.inverse_operator['nsource']} "
+            f"sources, {len(self._prepared)} prepared operator"
+            f"{_pl(self._prepared)}>"
+        )
+
+    @verbose
+    def prepare(
+        self, nave, lambda2, method="dSPM", method_params=None, *, verbose=None
+    ):
+        """Prepare the inverse operator for a given regularization.
+
+        Parameters
+        ----------
+        nave : int
+            Number of averages (scales the noise covariance).
+        lambda2 : float
+            The regularization parameter.
+        method : "MNE" | "dSPM" | "sLORETA" | "eLORETA"
+            Use minimum norm, dSPM (default), sLORETA, or eLORETA.
+        method_params : dict | None
+            Additional options for eLORETA. See Notes of :func:`apply_inverse`.
+        %(verbose)s
+
+        Returns
+        -------
+        inv : instance of InverseOperator
+            The prepared inverse operator, equivalent to the output of
+            :func:`prepare_inverse_operator`. It can be passed to the
+            ``apply_inverse*`` functions with ``prepared=True``.
+        """
+        _check_option("method", method, INVERSE_METHODS)
+        lambda2 = float(lambda2)
+        if method == "eLORETA":
+            method_params = _handle_default("eloreta_options", method_params)
+            key = (nave, lambda2, method, tuple(sorted(method_params.items())))
+        else:
+            key = (nave, lambda2, method)
+        if key not in self._prepared:
+            if nave not in self._scaled:
+                self._scaled[nave] = prepare_inverse_operator(
+                    self.inverse_operator, nave, lambda2, "MNE", copy="non-src"
+                )
+            logger.info(f"    Regularizing with lambda2 = {lambda2:g} ({method})")
+            inv = InverseOperator(self._scaled[nave])  # shallow copy
+            inv["reginv"] = _compute_reginv(inv, lambda2)
+            inv["noisenorm"] = []
+            if method == "eLORETA":
+                self._prepare_eloreta(inv, lambda2, method_params)
+            elif method != "MNE":
+                inv["noisenorm"] = _compute_noise_norm(inv, lambda2, method)
+            self._prepared[key] = inv
+        return self._prepared[key]
+
+    def _prepare_eloreta(self, inv, lambda2, method_params):
+        # eLORETA replaces these entries, do not touch the shared ones
+        for key in ("eigen_leads", "eigen_fields", "source_cov"):
+            inv[key] = inv[key].copy()
+        fits = self._eloreta_R.setdefault(bool(method_params["force_equal"]), {})
+        R_init = None
+        if fits:
+            log_l2 = np.log(lambda2 + 1e-30)
+            closest = min(fits, key=lambda l2: abs(np.log(l2 + 1e-30) - log_l2))
+            R_init = fits[closest]
+        fits[lambda2] = _compute_eloreta(inv, lambda2, method_params, R_init=R_init)
+
+    @verbose
+    def get_kernel(
+        self,
+        nave,
+        lambda2,
+        method="dSPM",
+        pick_ori=None,
+        label=None,
+        method_params=None,
+        *,
+        verbose=None,
+    ):
+        """Get the noise-normalized inverse kernel.
+
+        Parameters
+        ----------
+        nave : int
+            Number of averages (scales the noise covariance).
+        lambda2 : float
+            The regularization parameter.
+        method : "MNE" | "dSPM" | "sLORETA" | "eLORETA"
+            Use minimum norm, dSPM (default), sLORETA, or eLORETA.
+        pick_ori : None | "normal" | "vector"
+            If ``"normal"``, only the rows for the component normal to the
+            cortex are returned (loose-orientation operators only). Otherwise,
+            the rows for all source components are returned.
+        label : Label | None
+            Restricts the kernel to the sources in a given label. If None,
+            all sources are used.
+        method_params : dict | None
+            Additional options for eLORETA. See Notes of :func:`apply_inverse`.
+        %(verbose)s
+
+        Returns
+        -------
+        kernel : array, shape (n_sources, n_channels)
+            The kernel, including the noise normalization. For
+            free-orientation operators with ``pick_ori`` other than
+            ``'normal'``, there are three consecutive rows (x, y, z) per
+            source location.
+        vertices : list of array
+            The vertex numbers corresponding to the rows of the kernel.
+        """
+        inv = self.prepare(nave, lambda2, method, method_params)
+        _check_ori(pick_ori, inv["source_ori"], inv["src"])
+        K, noise_norm, vertno, _ = _assemble_kernel(
+            inv, label, method, pick_ori, self._use_cps
+        )
+        if noise_norm is not None:
+            if len(noise_norm) != len(K):
+                noise_norm = noise_norm.repeat(3, axis=0)
+            K *= noise_norm
+        return K, vertno
+
+
 def _compute_reginv(inv, lambda2):
     """Safely compute reginv from sing."""
     sing = np.array(inv["sing"], dtype=np.float64)
@@ -23,7 +23,13 @@ from .inverse import apply_inverse
 
 @verbose
 def make_inverse_resolution_matrix(
-    forward, inverse_operator, method="dSPM", lambda2=1.0 / 9.0, verbose=None
+    forward,
+    inverse_operator,
+    method="dSPM",
+    lambda2=1.0 / 9.0,
+    verbose=None,
+    *,
+    factored=False,
 ):
     """Compute resolution matrix for linear inverse operator.
 
@@ -38,17 +44,30 @@ def make_inverse_resolution_matrix(
     lambda2 : float
         The regularisation parameter.
     %(verbose)s
+    factored : bool
+        If True, do not form the resolution matrix, but return its factors
+        ``(invmat, leadfield)``, whose product is the resolution matrix. This
+        takes much less memory when there are many more sources than
+        channels, and can be passed as ``resmat`` to
+        :func:`get_point_spread`, :func:`get_cross_talk` and
+        :func:`resolution_metrics`, which then only compute the parts of the
+        resolution matrix they need.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
-    resmat: array, shape (n_orient_inv * n_dipoles, n_orient_fwd * n_dipoles)
+    resmat: array, shape (n_orient_inv * n_dipoles, n_orient_fwd * n_dipoles) | tuple of array
         Resolution matrix (inverse operator times forward operator).
         The result of applying the inverse operator to the forward operator.
         If source orientations are not fixed, all source components will be
         computed (i.e. for n_orient_inv > 1 or n_orient_fwd > 1).
         The columns of the resolution matrix are the point-spread functions
         (PSFs) and the rows are the cross-talk functions (CTFs).
-    """
+        If ``factored=True``, the tuple ``(invmat, leadfield)`` with shapes
+        ``(n_orient_inv * n_dipoles, n_channels)`` and
+        ``(n_channels, n_orient_fwd * n_dipoles)``.
+    """  # noqa: E501
     # make sure forward and inverse operator match
     inv = inverse_operator
     fwd = _convert_forward_match_inv(forward, inv)
@@ -63,6 +82,12 @@ def make_inverse_resolution_matrix(
     # get leadfield matrix from forward solution
     leadfield = fwd["sol"]["data"]
     invmat = _get_matrix_from_inverse_operator(inv, fwd, method=method, lambda2=lambda2)
+    if factored:
+        logger.info(
+            f"Dimensions of factored resolution matrix: {invmat.shape[0]} by "
+            f"{leadfield.shape[1]} (rank <= {leadfield.shape[0]})."
+        )
+        return invmat, leadfield
     resmat = invmat.dot(leadfield)
     logger.info(
         f"Dimensions of resolution matrix: {resmat.shape[0]} by {resmat.shape[1]}."
@@ -113,7 +138,7 @@ def _get_psf_ctf(
     else:
         nn = np.repeat(np.eye(3, 3)[np.newaxis], n_verts, 0)
 
-    n_r, n_c = resmat.shape
+    n_r, n_c = _resmat_shape(resmat)
     if ((n_verts != n_r) and (n_r / 3 != n_verts)) or (
         (n_verts != n_c) and (n_c / 3 != n_verts)
     ):
@@ -125,7 +150,6 @@ def _get_psf_ctf(
 
     # the following will operate on columns of funcs
     if func == "ctf":
-        resmat = resmat.T
         n_r, n_c = n_c, n_r
 
     # Functions and variances per label
@@ -146,7 +170,7 @@ def _get_psf_ctf(
         # get relevant PSFs or CTFs for specified vertices
         if isinstance(verts, int):
             verts = [verts]  # to keep array dimensions
-        funcs = resmat[:, verts]
+        funcs = _get_resmat_columns(resmat, verts, func)
 
         # normalise PSFs/CTFs if requested
         if norm is not None:
@@ -196,6 +220,35 @@ def _get_psf_ctf(
         return stcs
 
 
+def _resmat_shape(resmat):
+    """Get the shape of a dense or factored resolution matrix."""
+    if isinstance(resmat, tuple):
+        invmat, leadfield = resmat
+        if invmat.shape[1] != leadfield.shape[0]:
+            raise ValueError(
+                "The factors of the resolution matrix must have matching inner "
+                f"dimensions, got {invmat.shape} and {leadfield.shape}"
+            )
+        return invmat.shape[0], leadfield.shape[1]
+    return resmat.shape
+
+
+def _get_resmat_columns(resmat, idx, func):
+    """Get PSFs (columns) or CTFs (rows, as columns) of the resolution matrix.
+
+    For a factored resolution matrix, only the requested functions are
+    computed.
+    """
+    if isinstance(resmat, tuple):
+        invmat, leadfield = resmat
+        if func == "psf":
+            return invmat @ leadfield[:, idx]
+        return (invmat[idx] @ leadfield).T
+    if func == "psf":
+        return resmat[:, idx]
+    return resmat[idx].T
+
+
 def _check_get_psf_ctf_params(mode, n_comp, return_pca_vars):
     """Check input parameters of _get_psf_ctf() for consistency."""
     _validate_type(mode, (str, None), "mode")
@@ -239,7 +292,7 @@ def _vertices_for_get_psf_ctf(idx, src):
     # check if list of list or just list
     else:
         if isinstance(idx[0], list):  # if list of list of integers
-            verts = idx
+            verts = list(idx)  # do not modify the input
         else:  # if list of integers
             verts = [idx]
 
@@ -320,8 +373,11 @@ def get_point_spread(
 
     Parameters
     ----------
-    resmat : array, shape (n_dipoles, n_dipoles)
-        Forward Operator.
+    resmat : array, shape (n_dipoles, n_dipoles) | tuple of array
+        The resolution matrix, or its factors ``(invmat, leadfield)`` as
+        returned by :func:`make_inverse_resolution_matrix` with
+        ``factored=True``, in which case only the requested functions are
+        computed.
     src : instance of SourceSpaces | instance of InverseOperator | instance of Forward
         Source space used to compute resolution matrix.
         Must be an InverseOperator if ``vector=True`` and a surface
@@ -369,8 +425,11 @@ def get_cross_talk(
 
     Parameters
     ----------
-    resmat : array, shape (n_dipoles, n_dipoles)
-        Forward Operator.
+    resmat : array, shape (n_dipoles, n_dipoles) | tuple of array
+        The resolution matrix, or its factors ``(invmat, leadfield)`` as
+        returned by :func:`make_inverse_resolution_matrix` with
+        ``factored=True``, in which case only the requested functions are
+        computed.
     src : instance of SourceSpaces | instance of InverseOperator | instance of Forward
         Source space used to compute resolution matrix.
         Must be an InverseOperator if ``vector=True`` and a surface
@@ -9,9 +9,14 @@ Metrics can be computed for point-spread and cross-talk functions (PSFs/CTFs).
 """
 
 import numpy as np
+from scipy.spatial.distance import cdist
 
 from ..source_estimate import SourceEstimate
 from ..utils import _check_option, logger, verbose
+from .resolution_matrix import _get_resmat_columns, _resmat_shape
+
+# Number of resolution matrix elements to compute and process at once
+_BLOCK_SIZE = 2**22
 
 
 @verbose
@@ -22,13 +27,18 @@ def resolution_metrics(
 
     Parameters
     ----------
-    resmat : array, shape (n_orient * n_vertices, n_vertices)
+    resmat : array, shape (n_orient * n_vertices, n_vertices) | tuple of array
         The resolution matrix.
         If not a square matrix and if the number of rows is a multiple of
         number of columns (e.g. free or loose orientations), then the Euclidean
         length per source location is computed (e.g. if inverse operator with
         free orientations was applied to forward solution with fixed
         orientations).
+        Can also be the factors ``(invmat, leadfield)`` of the resolution
+        matrix as returned by
+        :func:`~mne.minimum_norm.make_inverse_resolution_matrix` with
+        ``factored=True``, in which case the resolution matrix is never formed
+        but processed in blocks of PSFs or CTFs.
     src : instance of SourceSpaces
         Source space object from forward or inverse operator.
     function : 'psf' | 'ctf'
@@ -70,6 +80,10 @@ def resolution_metrics(
     -----
     For details, see :footcite:`MolinsEtAl2008,HaukEtAl2019`.
 
+    All metrics are computed on blocks of PSFs or CTFs, which for a factored
+    resolution matrix bounds the memory use independently of the number of
+    sources.
+
     .. versionadded:: 0.20
 
     References
@@ -115,8 +129,8 @@ def _localisation_error(resmat, src, function, metric):
 
     Parameters
     ----------
-    resmat : array, shape (n_orient * n_locations, n_locations)
-        The resolution matrix.
+    resmat : array, shape (n_orient * n_locations, n_locations) | tuple
+        The resolution matrix, or its factors.
         If not a square matrix and if the number of rows is a multiple of
         number of columns (i.e. n_orient>1), then the Euclidean length per
         source location is computed (e.g. if inverse operator with free
@@ -139,32 +153,20 @@ def _localisation_error(resmat, src, function, metric):
     locerr : array, shape (n_locations,)
         Localisation error per location (in cm).
     """
-    # ensure resolution matrix is square
-    # combine rows (Euclidean length) if necessary
-    resmat = _rectify_resolution_matrix(resmat)
     locations = _get_src_locations(src)  # locs used in forw. and inv. operator
     locations = 100.0 * locations  # convert to cm (more common)
-    # we want to use absolute values, but doing abs() mases a copy and this
-    # can be quite expensive in memory. So let's just use abs() in place below.
-
-    # The code below will operate on columns, so transpose if you want CTFs
-    if function == "ctf":
-        resmat = resmat.T
-
-    # Euclidean distance between true location and maximum
-    if metric == "peak_err":
-        resmax = [abs(col).argmax() for col in resmat.T]  # max inds along cols
-        maxloc = locations[resmax, :]  # locations of maxima
-        diffloc = locations - maxloc  # diff btw true locs and maxima locs
-        locerr = np.linalg.norm(diffloc, axis=1)  # Euclidean distance
-
-    # centre of gravity
-    elif metric == "cog_err":
-        locerr = np.empty(locations.shape[0])  # initialise result array
-        for ii, rr in enumerate(locations):
-            resvec = abs(resmat[:, ii].T)  # corresponding column of resmat
-            cog = resvec.dot(locations) / np.sum(resvec)  # centre of gravity
-            locerr[ii] = np.sqrt(np.sum((rr - cog) ** 2))  # Euclidean distance
+
+    # combine rows (Euclidean length) if necessary
+    locerr = np.empty(locations.shape[0])  # initialise result array
+    for sl, funcs in _iter_resmat_blocks(resmat, function, rectify=True):
+        np.abs(funcs, out=funcs)
+        # Euclidean distance between true location and maximum
+        if metric == "peak_err":
+            est = locations[funcs.argmax(axis=0)]  # locations of maxima
+        # centre of gravity
+        elif metric == "cog_err":
+            est = (funcs.T @ locations) / funcs.sum(axis=0)[:, np.newaxis]
+        locerr[sl] = np.linalg.norm(locations[sl] - est, axis=1)
 
     return locerr
 
@@ -174,12 +176,8 @@ def _spatial_extent(resmat, src, function, metric, threshold=0.5):
 
     Parameters
     ----------
-    resmat : array, shape (n_orient * n_dipoles, n_dipoles)
-        The resolution matrix.
-        If not a square matrix and if the number of rows is a multiple of
-        number of columns (i.e. n_orient>1), then the Euclidean length per
-        source location is computed (e.g. if inverse operator with free
-        orientations was applied to forward solution with fixed orientations).
+    resmat : array, shape (n_orient * n_dipoles, n_dipoles) | tuple
+        The resolution matrix, or its factors.
     src : Source Space
         Source space object from forward or inverse operator.
     function : 'psf' | 'ctf'
@@ -202,33 +200,23 @@ def _spatial_extent(resmat, src, function, metric, threshold=0.5):
     locations = _get_src_locations(src)  # locs used in forw. and inv. operator
     locations = 100.0 * locations  # convert to cm (more common)
 
-    # The code below will operate on columns, so transpose if you want CTFs
-    if function == "ctf":
-        resmat = resmat.T
-
-    width = np.empty(resmat.shape[1])  # initialise output array
-
-    # spatial deviation as in Molins et al.
-    if metric == "sd_ext":
-        for ii in range(locations.shape[0]):
-            diffloc = locations - locations[ii, :]  # locs w/r/t true source
-            locerr = np.sum(diffloc**2, 1)  # squared Eucl dists to true source
-            resvec = abs(resmat[:, ii]) ** 2  # pick current row
+    width = np.empty(_resmat_shape(resmat)[function == "psf"])
+    for sl, funcs in _iter_resmat_blocks(resmat, function):
+        # squared Eucl dists to true sources
+        locerr = cdist(locations, locations[sl], "sqeuclidean")
+        # spatial deviation as in Molins et al.
+        if metric == "sd_ext":
+            funcs *= funcs
             # spatial deviation (Molins et al, NI 2008, eq. 12)
-            width[ii] = np.sqrt(np.sum(np.multiply(locerr, resvec)) / np.sum(resvec))
-
-    # maximum radius to 50% of max amplitude
-    elif metric == "maxrad_ext":
-        for ii, resvec in enumerate(resmat.T):  # iterate over columns
-            resvec = abs(resvec)  # operate on absolute values
-            amps = resvec.max()
-            # indices of elements with values larger than fraction threshold
-            # of peak amplitude
-            thresh_idx = np.where(resvec > threshold * amps)
-            # get distances for those indices from true source position
-            locs_thresh = locations[thresh_idx, :] - locations[ii, :]
-            # get maximum distance
-            width[ii] = np.sqrt(np.sum(locs_thresh**2, 1).max())
+            width[sl] = np.sqrt(np.sum(locerr * funcs, 0) / np.sum(funcs, 0))
+
+        # maximum radius to 50% of max amplitude
+        elif metric == "maxrad_ext":
+            np.abs(funcs, out=funcs)  # operate on absolute values
+            # maximum distance of the elements with values larger than
+            # fraction threshold of peak amplitude
+            mask = funcs > threshold * funcs.max(axis=0)
+            width[sl] = np.sqrt(np.where(mask, locerr, 0.0).max(axis=0))
 
     return width
 
@@ -238,12 +226,8 @@ def _relative_amplitude(resmat, src, function, metric):
 
     Parameters
     ----------
-    resmat : array, shape (n_orient * n_dipoles, n_dipoles)
-        The resolution matrix.
-        If not a square matrix and if the number of rows is a multiple of
-        number of columns (i.e. n_orient>1), then the Euclidean length per
-        source location is computed (e.g. if inverse operator with free
-        orientations was applied to forward solution with fixed orientations).
+    resmat : array, shape (n_orient * n_dipoles, n_dipoles) | tuple
+        The resolution matrix, or its factors.
     src : Source Space
         Source space object from forward or inverse operator.
     function : 'psf' | 'ctf'
@@ -260,27 +244,57 @@ def _relative_amplitude(resmat, src, function, metric):
     relamp : array, shape (n_dipoles,)
         Relative amplitude metric per location.
     """
-    # The code below will operate on columns, so transpose if you want CTFs
-    if function == "ctf":
-        resmat = resmat.T
-
-    # Ratio between amplitude at peak and global peak maximum
-    if metric == "peak_amp":
-        # maximum amplitudes per column
-        maxamps = np.array([abs(col).max() for col in resmat.T])
-        maxmaxamps = maxamps.max()  # global absolute maximum
-        relamp = maxamps / maxmaxamps
-
-    # ratio between sums of absolute amplitudes
-    elif metric == "sum_amp":
-        # sum of amplitudes per column
-        sumamps = np.array([abs(col).sum() for col in resmat.T])
-        sumampsmax = sumamps.max()  # maximum of summed amplitudes
-        relamp = sumamps / sumampsmax
+    relamp = np.empty(_resmat_shape(resmat)[function == "psf"])
+    for sl, funcs in _iter_resmat_blocks(resmat, function):
+        np.abs(funcs, out=funcs)
+        # Ratio between amplitude at peak and global peak maximum
+        if metric == "peak_amp":
+            relamp[sl] = funcs.max(axis=0)  # maximum amplitudes per column
+        # ratio between sums of absolute amplitudes
+        elif metric == "sum_amp":
+            relamp[sl] = funcs.sum(axis=0)  # sum of amplitudes per column
+    relamp /= relamp.max()  # relative to global maximum
 
     return relamp
 
 
+def _iter_resmat_blocks(resmat, function, rectify=False):
+    """Iterate over blocks of PSFs (columns) or CTFs (rows) of resmat.
+
+    Yields the slice of the functions in each block and the functions as
+    columns of a new array. If ``rectify``, the components of each source
+    location are combined (Euclidean length), as in
+    :func:`_rectify_resolution_matrix`.
+    """
+    shape = _resmat_shape(resmat)
+    n_orient = _get_n_orient(shape) if rectify else 1
+    if n_orient > 1:
+        logger.info(
+            "Rectifying resolution matrix from (%d, %d) to (%d, %d).",
+            *shape,
+            shape[1],
+            shape[1],
+        )
+    n_funcs = shape[1] if function == "psf" else shape[0] // n_orient
+    n_block = max(_BLOCK_SIZE // max(shape), 1)
+    for start in range(0, n_funcs, n_block):
+        sl = slice(start, min(start + n_block, n_funcs))
+        if function == "psf":
+            funcs = _get_resmat_columns(resmat, sl, function)
+            if n_orient > 1:
+                funcs = funcs.reshape(-1, n_orient, funcs.shape[1])
+                funcs = np.linalg.norm(funcs, axis=1)
+        else:
+            rows = slice(sl.start * n_orient, sl.stop * n_orient)
+            funcs = _get_resmat_columns(resmat, rows, function)
+            if n_orient > 1:
+                funcs = funcs.reshape(funcs.shape[0], -1, n_orient)
+                funcs = np.linalg.norm(funcs, axis=2)
+        if n_orient == 1 and not isinstance(resmat, tuple):
+            funcs = funcs.copy()  # we operate in place, never modify resmat
+        yield sl, funcs
+
+
 def _get_src_locations(src):
     """Get source positions from src object."""
     # vertices used in forward and inverse operator
@@ -308,19 +322,7 @@ def _rectify_resolution_matrix(resmat):
     """
     shape = resmat.shape
     if not shape[0] == shape[1]:
-        if shape[0] < shape[1]:
-            raise ValueError(
-                f"Number of target sources ({shape[0]}) cannot be lower "
-                f"than number of input sources ({shape[1]})"
-            )
-
-        if np.mod(shape[0], shape[1]):  # if ratio not integer
-            raise ValueError(
-                f"Number of target sources ({shape[0]}) must be a "
-                f"multiple of the number of input sources ({shape[1]})"
-            )
-
-        ns = shape[0] // shape[1]  # number of source components per vertex
+        ns = _get_n_orient(shape)  # number of source components per vertex
 
         # Combine rows of resolution matrix
         resmatl = [
@@ -339,3 +341,20 @@ def _rectify_resolution_matrix(resmat):
         )
 
     return resmat
+
+
+def _get_n_orient(shape):
+    """Get the number of source components per location from resmat shape."""
+    if shape[0] < shape[1]:
+        raise ValueError(
+            f"Number of target sources ({shape[0]}) cannot be lower "
+            f"than number of input sources ({shape[1]})"
+        )
+
+    if np.mod(shape[0], shape[1]):  # if ratio not integer
+        raise ValueError(
+            f"Number of target sources ({shape[0]}) must be a "
+            f"multiple of the number of input sources ({shape[1]})"
+        )
+
+    return shape[0] // shape[1]
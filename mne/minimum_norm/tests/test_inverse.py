@@ -3,6 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 import copy
+import itertools
 import re
 from pathlib import Path
 
@@ -48,6 +49,7 @@ from mne.io import read_info, read_raw_fif
 from mne.label import label_sign_flip, read_label
 from mne.minimum_norm import (
     INVERSE_METHODS,
+    InverseOperatorFactory,
     apply_inverse,
     apply_inverse_cov,
     apply_inverse_epochs,
@@ -59,6 +61,7 @@ from mne.minimum_norm import (
     read_inverse_operator,
     write_inverse_operator,
 )
+from mne.minimum_norm.inverse import _pick_channels_inverse_operator
 from mne.source_estimate import VolSourceEstimate, read_source_estimate
 from mne.source_space._source_space import _get_src_nn
 from mne.surface import _normal_orth
@@ -1764,3 +1767,144 @@ def test_make_inverse_no_meg(tmp_path):
     assert invs[1]["info"]["dev_head_t"] is not None
     invs[1]["info"]["dev_head_t"] = None  # for comparison
     _compare(invs[0], invs[1])
+
+
+def _make_sphere_inverse_epochs(n_epochs=5, n_times=20):
+    """Make a small EEG inverse and epochs that do not need testing data."""
+    montage = make_standard_montage("spherical_1020")
+    info = create_info(montage.ch_names, 100.0, "eeg").set_montage(montage)
+    sphere = make_sphere_model("auto", "auto", info, verbose=False)
+    src = setup_volume_source_space(pos=20.0, sphere=sphere, verbose=False)
+    fwd = make_forward_solution(info, None, src, sphere, verbose=False)
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((n_epochs, len(info.ch_names), n_times)) * 1e-6
+    epochs = EpochsArray(data, info, verbose=False)
+    epochs.set_eeg_reference(projection=True, verbose=False)
+    cov = make_ad_hoc_cov(epochs.info, verbose=False)
+    inv = make_inverse_operator(epochs.info, fwd, cov, loose=1.0, verbose=False)
+    return inv, epochs, fwd, cov
+
+
+@pytest.mark.parametrize("pick_ori", [None, "vector"])
+@pytest.mark.parametrize("method", ["MNE", "dSPM"])
+def test_apply_inverse_epochs_batched(pick_ori, method, monkeypatch):
+    """Test that batched application matches per-evoked application."""
+    import mne.minimum_norm.inverse as inverse
+
+    inv, epochs, _, _ = _make_sphere_inverse_epochs()
+    stcs = dict()
+    for batch_size in (1, 2**23):  # one epoch per batch, all epochs at once
+        monkeypatch.setattr(inverse, "_BATCH_SIZE", batch_size)
+        stcs[batch_size] = apply_inverse_epochs(
+            epochs, inv, lambda2, method, pick_ori=pick_ori, verbose=False
+        )
+    for stc, stc_one, evoked in zip(*stcs.values(), epochs.iter_evoked()):
+        want = apply_inverse(
+            evoked, inv, lambda2, method, pick_ori=pick_ori, verbose=False
+        )
+        assert_allclose(stc.data, want.data, rtol=1e-7)
+        assert_allclose(stc.data, stc_one.data, rtol=1e-7)
+        assert stc.data.flags["C_CONTIGUOUS"]
+        assert stc.data.base is None  # does not keep the batch alive
+    assert len(stcs[1]) == len(epochs)
+    # all epochs as one array
+    want = np.array([stc.data for stc in stcs[1]])
+    for batch_size in (1, 2**23):
+        monkeypatch.setattr(inverse, "_BATCH_SIZE", batch_size)
+        data = apply_inverse_epochs(
+            epochs, inv, lambda2, method, pick_ori=pick_ori, return_array=True
+        )
+        assert_allclose(data, want, rtol=1e-7)
+    data = apply_inverse_epochs(
+        epochs,
+        inv,
+        lambda2,
+        method,
+        pick_ori=pick_ori,
+        return_array=True,
+        dtype=np.float32,
+    )
+    assert data.dtype == np.float32
+    assert_allclose(data, want, rtol=1e-4, atol=1e-4 * np.abs(want).max())
+    with pytest.raises(ValueError, match="cannot be used with return_generator"):
+        apply_inverse_epochs(
+            epochs, inv, lambda2, return_generator=True, return_array=True
+        )
+
+
+def test_inverse_operator_factory():
+    """Test that the factory matches making and preparing each operator."""
+    _, epochs, fwd, cov = _make_sphere_inverse_epochs()
+    factory = InverseOperatorFactory(epochs.info, fwd, cov, loose=1.0, verbose=False)
+    inv = make_inverse_operator(epochs.info, fwd, cov, loose=1.0, verbose=False)
+    assert_allclose(factory.inverse_operator["sing"], inv["sing"])
+    evoked = epochs.average()
+    for nave, this_lambda2, method in itertools.product(
+        (1, 3), (lambda2, 1e-2), ("MNE", "dSPM", "sLORETA")
+    ):
+        want = prepare_inverse_operator(inv, nave, this_lambda2, method)
+        got = factory.prepare(nave, this_lambda2, method)
+        assert factory.prepare(nave, this_lambda2, method) is got
+        for key in ("reginv", "noisenorm", "whitener", "proj"):
+            assert_allclose(got[key], want[key], rtol=1e-10, err_msg=key)
+        K, vertno = factory.get_kernel(nave, this_lambda2, method, pick_ori="vector")
+        assert_array_equal(vertno[0], inv["src"][0]["vertno"])
+        evoked.nave = nave
+        stc = apply_inverse(
+            evoked, got, this_lambda2, method, pick_ori="vector", prepared=True
+        )
+        stc_want = apply_inverse(evoked, inv, this_lambda2, method, pick_ori="vector")
+        assert_allclose(stc.data, stc_want.data, rtol=1e-7)
+        sel = _pick_channels_inverse_operator(evoked.ch_names, got)
+        assert_allclose(
+            (K @ evoked.data[sel]).reshape(stc.data.shape), stc.data, rtol=1e-7
+        )
+    assert "12 prepared operators" in repr(factory)
+    with pytest.raises(ValueError, match="Invalid value for the 'method'"):
+        factory.prepare(1, lambda2, "foo")
+
+
+def test_eloreta_warm_start_anderson():
+    """Test eLORETA warm starts and Anderson acceleration."""
+    _, epochs, fwd, cov = _make_sphere_inverse_epochs()
+    evoked = epochs.average()
+    inv = make_inverse_operator(epochs.info, fwd, cov, loose=1.0, verbose=False)
+    factory = InverseOperatorFactory(epochs.info, fwd, cov, loose=1.0, verbose=False)
+    for this_lambda2 in (1.0 / 9.0, 1.0 / 3.0):
+        kwargs = dict(method="eLORETA", pick_ori="vector")
+        want = apply_inverse(evoked, inv, this_lambda2, **kwargs, verbose=False)
+        with catch_logging() as log:
+            prepared = factory.prepare(
+                evoked.nave, this_lambda2, "eLORETA", verbose="debug"
+            )
+        log = log.getvalue()
+        assert ("warm-start" in log) == (this_lambda2 != 1.0 / 9.0)
+        n_iter = log.count("relative weight change")
+        assert 0 < n_iter
+        stc = apply_inverse(
+            evoked, prepared, this_lambda2, **kwargs, prepared=True, verbose=False
+        )
+        assert_allclose(
+            stc.data, want.data, rtol=1e-3, atol=1e-3 * np.abs(want.data).max()
+        )
+        # the shared (unprepared) operator must be left untouched
+        assert not np.isnan(factory._scaled[evoked.nave]["source_cov"]["data"]).any()
+    with catch_logging() as log:
+        stc_cold = apply_inverse(evoked, inv, lambda2, **kwargs, verbose="debug")
+    n_cold = log.getvalue().count("relative weight change")
+    with catch_logging() as log:
+        stc_acc = apply_inverse(
+            evoked,
+            inv,
+            lambda2,
+            **kwargs,
+            method_params=dict(anderson=3),
+            verbose="debug",
+        )
+    n_acc = log.getvalue().count("relative weight change")
+    assert n_acc <= n_cold
+    assert_allclose(
+        stc_acc.data, stc_cold.data, rtol=1e-3, atol=1e-3 * np.abs(stc_cold.data).max()
+    )
+    with pytest.raises(ValueError, match="must be non-negative"):
+        apply_inverse(evoked, inv, lambda2, **kwargs, method_params=dict(anderson=-1))
@@ -261,3 +261,31 @@ def test_resolution_matrix_fixed():
     assert_array_equal(stc_psf_label.data, stc_psf_label2[0].data)
     assert_array_equal(stc_psf_label.data, stc_psf_label2[1].data)
     assert_array_equal(stc_psf_label.data, stc_psf_idx.data)
+
+
+def test_resolution_matrix_factored():
+    """Test PSFs and CTFs from a factored resolution matrix."""
+    montage = mne.channels.make_standard_montage("spherical_1020")
+    info = mne.create_info(montage.ch_names, 1000.0, "eeg").set_montage(montage)
+    sphere = mne.make_sphere_model("auto", "auto", info, verbose=False)
+    src = mne.setup_volume_source_space(pos=20.0, sphere=sphere, verbose=False)
+    fwd = mne.make_forward_solution(info, None, src, sphere, verbose=False)
+    evoked = mne.EvokedArray(np.zeros((len(info.ch_names), 1)), info)
+    info = evoked.set_eeg_reference(projection=True, verbose=False).info
+    cov = mne.make_ad_hoc_cov(info, verbose=False)
+    inv = mne.minimum_norm.make_inverse_operator(info, fwd, cov, verbose=False)
+    resmat = make_inverse_resolution_matrix(fwd, inv, method="MNE", verbose=False)
+    factors = make_inverse_resolution_matrix(
+        fwd, inv, method="MNE", factored=True, verbose=False
+    )
+    assert isinstance(factors, tuple)
+    assert_allclose(factors[0] @ factors[1], resmat)
+    idx = [[0, 2], [1, 3, 5]]
+    for func in (get_point_spread, get_cross_talk):
+        for mode in (None, "svd"):
+            want = func(resmat, fwd, idx, mode=mode, norm="norm", verbose=False)
+            got = func(factors, fwd, idx, mode=mode, norm="norm", verbose=False)
+            for stc, stc_want in zip(got, want):
+                assert_allclose(np.abs(stc.data), np.abs(stc_want.data), atol=1e-12)
+    with pytest.raises(ValueError, match="matching inner dimensions"):
+        get_point_spread((factors[0], factors[1][:-1]), fwd, idx)
@@ -10,11 +10,19 @@ Peak localisation error of sLORETA for PSFs is zero.
 Currently only for fixed source orientations.
 """
 
+import itertools
+
 import numpy as np
 import pytest
-from numpy.testing import assert_, assert_array_almost_equal, assert_array_equal
+from numpy.testing import (
+    assert_,
+    assert_allclose,
+    assert_array_almost_equal,
+    assert_array_equal,
+)
 
 import mne
+from mne._fiff.constants import FIFF
 from mne.datasets import testing
 from mne.minimum_norm.resolution_matrix import make_inverse_resolution_matrix
 from mne.minimum_norm.spatial_resolution import (
@@ -152,3 +160,67 @@ def test_resolution_metrics_surface():
     r2 = _rectify_resolution_matrix(r1)
 
     assert_array_equal(r2, np.sqrt(2) * np.ones((4, 4)))
+
+
+@pytest.mark.parametrize("n_orient", [1, 3])
+def test_resolution_metrics_factored(n_orient, monkeypatch):
+    """Test resolution metrics computed in blocks from a factored matrix."""
+    from mne.minimum_norm import spatial_resolution
+
+    rng = np.random.default_rng(0)
+    src = list()
+    for hemi_id in (FIFF.FIFFV_MNE_SURF_LEFT_HEMI, FIFF.FIFFV_MNE_SURF_RIGHT_HEMI):
+        src.append(
+            dict(
+                type="surf",
+                id=hemi_id,
+                np=30,
+                rr=rng.standard_normal((30, 3)) * 0.05,
+                nn=np.tile([0.0, 0.0, 1.0], (30, 1)),
+                vertno=np.sort(rng.choice(30, 20, replace=False)),
+                nuse=20,
+                coord_frame=FIFF.FIFFV_COORD_MRI,
+            )
+        )
+    src = mne.SourceSpaces(src)
+    locations = 100 * np.concatenate([s["rr"][s["vertno"]] for s in src])
+    n_src, n_chan = 40, 10
+    factors = (
+        rng.standard_normal((n_orient * n_src, n_chan)),
+        rng.standard_normal((n_chan, n_src)),
+    )
+    resmat = factors[0] @ factors[1]
+    metrics = ("peak_err", "cog_err")
+    if n_orient == 1:
+        metrics += ("sd_ext", "maxrad_ext", "peak_amp", "sum_amp")
+    for function, metric in itertools.product(("psf", "ctf"), metrics):
+        monkeypatch.setattr(spatial_resolution, "_BLOCK_SIZE", 2**22)
+        want = resolution_metrics(resmat, src, function=function, metric=metric)
+        # several blocks of functions
+        monkeypatch.setattr(spatial_resolution, "_BLOCK_SIZE", 7 * n_orient * n_src)
+        for this_resmat in (resmat, factors):
+            got = resolution_metrics(this_resmat, src, function=function, metric=metric)
+            assert_allclose(got.data, want.data, rtol=1e-10, err_msg=metric)
+        assert (want.data >= 0).all()
+        if metric == "sd_ext":  # compare to the definition
+            funcs = resmat if function == "psf" else resmat.T
+            dist = np.linalg.norm(locations[:, np.newaxis] - locations, axis=-1)
+            sd = np.sqrt((dist**2 * funcs**2).sum(0) / (funcs**2).sum(0))
+            assert_allclose(want.data[:, 0], sd, rtol=1e-10)
+        elif metric == "maxrad_ext":  # largest distance above half the peak
+            funcs = np.abs(resmat if function == "psf" else resmat.T)
+            maxrad = [
+                np.linalg.norm(locations[func > 0.5 * func.max()] - loc, axis=1).max()
+                for func, loc in zip(funcs.T, locations)
+            ]
+            assert_allclose(want.data[:, 0], maxrad, rtol=1e-10)
+    # rectification matches the dense version
+    if n_orient == 3:
+        rect = _rectify_resolution_matrix(resmat)
+        for function in ("psf", "ctf"):
+            funcs = rect if function == "psf" else rect.T
+            want = np.linalg.norm(
+                locations - locations[np.abs(funcs).argmax(0)], axis=1
+            )
+            got = resolution_metrics(factors, src, function=function)
+            assert_allclose(got.data[:, 0], want)
@@ -2,7 +2,7 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
-import copy
+import os
 import os.path as op
 import warnings
 
@@ -33,7 +33,9 @@ from .utils import (
     check_version,
     fill_doc,
     get_subjects_dir,
+    hashfunc,
     logger,
+    object_hash,
     use_log_level,
     verbose,
     warn,
@@ -60,6 +62,8 @@ def compute_source_morph(
     src_to=None,
     precompute=False,
     verbose=None,
+    *,
+    n_jobs=None,
 ):
     """Create a SourceMorph from one subject to another.
 
@@ -151,6 +155,11 @@ def compute_source_morph(
 
         .. versionadded:: 0.22
     %(verbose)s
+    %(n_jobs)s
+        The two hemispheres of a surface morph are computed in parallel
+        threads, and so are the volumes warped when ``precompute=True``.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
@@ -177,6 +186,11 @@ def compute_source_morph(
     comparisons between hemispheres, use of the symmetric ``fsaverage_sym``
     model is recommended to minimize bias :footcite:`GreveEtAl2013`.
 
+    Surface morph matrices are cached in ``subjects_dir/morph-maps/cache``.
+    The cache files are keyed on the content of the spherical surfaces of
+    both subjects and on the source and destination vertices and ``smooth``,
+    so a cached matrix is only reused when it would be recomputed identically.
+
     .. versionadded:: 0.17.0
 
     .. versionadded:: 0.21.0
@@ -287,6 +301,7 @@ def compute_source_morph(
                 smooth=smooth,
                 warn=warn,
                 xhemi=xhemi,
+                n_jobs=n_jobs,
             )
             n_verts = sum(len(v) for v in vertices_to_surf)
             assert morph_mat.shape[0] == n_verts
@@ -317,7 +332,7 @@ def compute_source_morph(
         None,
     )
     if precompute:
-        morph.compute_vol_morph_mat()
+        morph.compute_vol_morph_mat(n_jobs=n_jobs)
     logger.info("[done]")
     return morph
 
@@ -366,6 +381,10 @@ _SOURCE_MORPH_ATTRIBUTES = [  # used in writing
 ]
 
 
+# number of voxels (times volumes) to warp per block in SourceMorph._morph_vols
+_VOL_BLOCK_SIZE = 2**24
+
+
 @fill_doc
 class SourceMorph:
     """Morph source space data from one subject to another.
@@ -509,14 +528,26 @@ class SourceMorph:
 
     @verbose
     def apply(
-        self, stc_from, output="stc", mri_resolution=False, mri_space=None, verbose=None
+        self,
+        stc_from,
+        output="stc",
+        mri_resolution=False,
+        mri_space=None,
+        verbose=None,
+        *,
+        n_jobs=None,
     ):
         """Morph source space data.
 
         Parameters
         ----------
-        stc_from : VolSourceEstimate | VolVectorSourceEstimate | SourceEstimate | VectorSourceEstimate
-            The source estimate to morph.
+        stc_from : VolSourceEstimate | VolVectorSourceEstimate | SourceEstimate | VectorSourceEstimate | list
+            The source estimate to morph. Can also be a list of source
+            estimates of the same type and with the same vertices, which are
+            morphed together with one matrix product.
+
+            .. versionchanged:: 1.13
+               Support for lists of source estimates.
         output : str
             Can be ``'stc'`` (default) or possibly ``'nifti1'``, or
             ``'nifti2'`` when working with a volume source space defined on a
@@ -530,51 +561,110 @@ class SourceMorph:
             Whether the image to world registration should be in mri space. The
             default (None) is mri_space=mri_resolution.
         %(verbose)s
+        %(n_jobs)s
+            Used to warp volumes in parallel threads when there is no
+            sparse volume morph matrix (see :meth:`compute_vol_morph_mat`).
+
+            .. versionadded:: 1.13
 
         Returns
         -------
-        stc_to : VolSourceEstimate | SourceEstimate | VectorSourceEstimate | Nifti1Image | Nifti2Image
-            The morphed source estimates.
+        stc_to : VolSourceEstimate | SourceEstimate | VectorSourceEstimate | Nifti1Image | Nifti2Image | list
+            The morphed source estimates (a list if ``stc_from`` is a list).
+
+        Notes
+        -----
+        Source estimates stored as ``(kernel, sens_data)``, e.g. from
+        :func:`mne.minimum_norm.apply_inverse_epochs`, are morphed by morphing
+        their kernel (once for all source estimates sharing the same kernel),
+        see also :meth:`fold_kernel`.
         """  # noqa: E501
         _validate_type(output, str, "output")
-        _validate_type(stc_from, _BaseSourceEstimate, "stc_from", "source estimate")
-        if isinstance(stc_from, _BaseSurfaceSourceEstimate):
+        return_list = isinstance(stc_from, list | tuple)
+        stcs_from = list(stc_from) if return_list else [stc_from]
+        if not len(stcs_from):
+            raise ValueError("stc_from must contain at least one source estimate")
+        for si, stc in enumerate(stcs_from):
+            name = f"stc_from[{si}]" if return_list else "stc_from"
+            _validate_type(stc, _BaseSourceEstimate, name, "source estimate")
+        if isinstance(stcs_from[0], _BaseSurfaceSourceEstimate):
             allowed_kinds = ("stc",)
             extra = "when stc is a surface source estimate"
         else:
             allowed_kinds = ("stc", "nifti1", "nifti2")
             extra = ""
         _check_option("output", output, allowed_kinds, extra)
-        stc = copy.deepcopy(stc_from)
 
         mri_space = mri_resolution if mri_space is None else mri_space
-        if stc.subject is None:
-            stc.subject = self.subject_from
-        if self.subject_from is None:
-            self.subject_from = stc.subject
-        if stc.subject != self.subject_from:
-            raise ValueError(
-                "stc_from.subject and "
-                "morph.subject_from "
-                f"must match. ({stc.subject} != {self.subject_from})"
-            )
-        out = _apply_morph_data(self, stc)
+        for stc in stcs_from:
+            if self.subject_from is None:
+                self.subject_from = stc.subject
+            if stc.subject is not None and stc.subject != self.subject_from:
+                raise ValueError(
+                    "stc_from.subject and "
+                    "morph.subject_from "
+                    f"must match. ({stc.subject} != {self.subject_from})"
+                )
+        out = _apply_morph_data(self, stcs_from, n_jobs=n_jobs)
         if output != "stc":  # convert to volume
-            out = _morphed_stc_as_volume(
-                self,
-                out,
-                mri_resolution=mri_resolution,
-                mri_space=mri_space,
-                output=output,
+            out = [
+                _morphed_stc_as_volume(
+                    self,
+                    stc,
+                    mri_resolution=mri_resolution,
+                    mri_space=mri_space,
+                    output=output,
+                )
+                for stc in out
+            ]
+        return out if return_list else out[0]
+
+    def fold_kernel(self, kernel):
+        """Fold the morph into an inverse kernel.
+
+        Parameters
+        ----------
+        kernel : ndarray, shape (n_sources, n_channels)
+            The inverse kernel, with one row per source vertex of the morph
+            (surface vertices first, followed by volume vertices).
+
+        Returns
+        -------
+        kernel_to : ndarray, shape (n_sources_to, n_channels)
+            The kernel that directly gives the morphed source estimate data
+            when applied to sensor data, i.e. ``morph_mat @ kernel``.
+
+        Notes
+        -----
+        .. versionadded:: 1.13
+        """
+        _check_option("morph.kind", self.kind, ("surface", "volume", "mixed"))
+        do_surf = self.kind in ("surface", "mixed")
+        do_vol = self.kind in ("volume", "mixed")
+        from_surf_stop = 0
+        if do_surf:
+            from_surf_stop = sum(len(v) for v in self.src_data["vertices_from"][:2])
+        n_from = from_surf_stop
+        if do_vol:
+            n_from += sum(len(v) for v in self._vol_vertices_from)
+        kernel = np.asarray(kernel)
+        if kernel.ndim != 2 or kernel.shape[0] != n_from:
+            raise ValueError(
+                f"kernel must have shape ({n_from}, n_channels), got {kernel.shape}"
             )
-        return out
+        return _morph_rows(self, kernel, do_surf, do_vol, from_surf_stop, "Channel")
 
     @verbose
-    def compute_vol_morph_mat(self, *, verbose=None):
+    def compute_vol_morph_mat(self, *, n_jobs=None, verbose=None):
         """Compute the sparse matrix representation of the volumetric morph.
 
         Parameters
         ----------
+        %(n_jobs)s
+            The volumes of each block of source vertices are warped in
+            parallel threads.
+
+            .. versionadded:: 1.13
         %(verbose)s
 
         Returns
@@ -602,10 +692,10 @@ class SourceMorph:
         if self.affine is None or self.vol_morph_mat is not None:
             return
         logger.info("Computing sparse volumetric morph matrix (will take some time...)")
-        self.vol_morph_mat = self._morph_vols(None, "Vertex")
+        self.vol_morph_mat = self._morph_vols(None, "Vertex", n_jobs=n_jobs)
         return self
 
-    def _morph_vols(self, vols, mesg, subselect=True):
+    def _morph_vols(self, vols, mesg, subselect=True, n_jobs=None):
         from dipy.align.reslice import reslice
 
         interp = self.src_data["interpolator"].tocsc()[
@@ -615,10 +705,7 @@ class SourceMorph:
         attrs = ("real", "imag") if np.iscomplexobj(vols) else ("real",)
         dtype = np.complex128 if len(attrs) == 2 else np.float64
         if vols is None:  # sparse -> sparse mode
-            img_to = (list(), list(), [0])  # data, indices, indptr
             assert subselect
-        else:  # dense -> dense mode
-            img_to = None
         if subselect:
             vol_verts = np.concatenate(self._vol_vertices_to)
         else:
@@ -651,83 +738,86 @@ class SourceMorph:
             @ self.pre_affine.affine
             @ self.pre_affine.domain_grid2world,
         )
-        resamp_0_1 = resamp_1 @ resamp_0
+        # all linear steps before the SDR morph, from source space to the
+        # mri_from resolution/space, as a single sparse matrix
+        resamp_0_1 = (resamp_1 @ resamp_0 @ interp).tocsc()
+        domain_shape = tuple(self.pre_affine.domain_shape)
+        to_vox_map = self.src_data["to_vox_map"]
+        do_reslice = False
+        if to_vox_map is not None:
+            to_zooms = np.diag(to_vox_map[1])[:3]
+            # There might be some sparse equivalent to this but not sure...
+            do_reslice = not np.allclose(self.zooms, to_zooms, atol=1e-3)
+
+        def _warp(img_real):
+            img_real = img_real.reshape(domain_shape, order="F")
+            if self.sdr_morph is not None:
+                img_real = self.sdr_morph.transform(img_real)
+            _debug_img(img_real, self.affine, "From-reslice-transform")
+            affine = self.affine
+            if do_reslice:
+                img_real, affine = reslice(img_real, self.affine, self.zooms, to_zooms)
+            return img_real, affine
+
+        # The transforms are identical for all volumes, so we apply the
+        # linear steps to blocks of volumes at once, and warp the volumes of
+        # a block in threads (dipy releases the GIL)
+        parallel, p_fun, _ = parallel_func(_warp, n_jobs, prefer="threads")
+        n_block = _VOL_BLOCK_SIZE // int(np.prod(domain_shape))
+        n_block = int(np.clip(n_block, 1, max(n_vols, 1)))
         resamp_2 = None
-        for ii in ProgressBar(list(range(n_vols)), mesg=mesg):
-            for attr in attrs:
-                # transform from source space to mri_from resolution/space
-                if vols is None:
-                    img_real = interp[:, [ii]]
-                else:
-                    img_real = interp @ getattr(vols[:, ii], attr)
-                _debug_img(img_real, from_affine, "From", src_shape)
-
-                img_real = resamp_0_1 @ img_real
-                if sparse.issparse(img_real):
-                    img_real = img_real.toarray()
-                img_real = img_real.reshape(self.pre_affine.domain_shape, order="F")
-                if self.sdr_morph is not None:
-                    img_real = self.sdr_morph.transform(img_real)
-                _debug_img(img_real, self.affine, "From-reslice-transform")
-
-                # subselect the correct cube if src_to is provided
-                if self.src_data["to_vox_map"] is not None:
-                    affine = self.affine
-                    to_zooms = np.diag(self.src_data["to_vox_map"][1])[:3]
-                    # There might be some sparse equivalent to this but
-                    # not sure...
-                    if not np.allclose(self.zooms, to_zooms, atol=1e-3):
-                        img_real, affine = reslice(
-                            img_real, self.affine, self.zooms, to_zooms
-                        )
-                    _debug_img(img_real, affine, "From-reslice-transform-src")
-                    if resamp_2 is None:
-                        resamp_2 = _grid_interp(
-                            img_real.shape,
-                            self.src_data["to_vox_map"][0],
-                            np.linalg.inv(affine) @ self.src_data["to_vox_map"][1],
-                        )
-                    # Equivalent to:
-                    # _resample_from_to(
-                    #     img_real, affine, self.src_data['to_vox_map'])
-                    img_real = resamp_2 @ img_real.ravel(order="F")
-                    _debug_img(
-                        img_real,
-                        self.src_data["to_vox_map"][1],
-                        "From-reslice-transform-src-subselect",
-                        self.src_data["to_vox_map"][0],
+        img_to = list() if vols is None else None
+        with ProgressBar(n_vols, mesg=mesg) as pb:
+            for start in range(0, n_vols, n_block):
+                sl = slice(start, min(start + n_block, n_vols))
+                for attr in attrs:
+                    # transform from source space to mri_from resolution/space
+                    if vols is None:
+                        imgs = resamp_0_1[:, sl].toarray()
+                    else:
+                        imgs = resamp_0_1 @ getattr(vols[:, sl], attr)
+                    imgs = np.asfortranarray(imgs)  # contiguous volumes
+                    out = parallel(p_fun(img_real) for img_real in imgs.T)
+                    img_shape, affine = out[0][0].shape, out[0][1]
+                    imgs = np.stack(
+                        [img_real.ravel(order="F") for img_real, _ in out], 1
                     )
-
-                # This can be used to help debug, but it really should just
-                # show the brain filling the volume:
-                # img_want = np.zeros(np.prod(img_real.shape))
-                # img_want[np.concatenate(self._vol_vertices_to)] = 1.
-                # img_want = np.reshape(
-                #     img_want, self.src_data['src_shape'][::-1], order='F')
-                # _debug_img(img_want, self.src_data['to_vox_map'][1],
-                #            'To mask')
-                # raise RuntimeError('Check')
-
-                # combine real and complex parts
-                img_real = img_real.ravel(order="F")[vol_verts]
-
-                # initialize output
-                if img_to is None and vols is not None:
-                    img_to = np.zeros((img_real.size, n_vols), dtype=dtype)
-
-                if vols is None:
-                    idx = np.where(img_real)[0]
-                    img_to[0].extend(img_real[idx])
-                    img_to[1].extend(idx)
-                    img_to[2].append(img_to[2][-1] + len(idx))
-                else:
-                    if attr == "real":
-                        img_to[:, ii] = img_to[:, ii] + img_real
+                    del out
+
+                    # subselect the correct cube if src_to is provided
+                    if to_vox_map is not None:
+                        if resamp_2 is None:
+                            resamp_2 = _grid_interp(
+                                img_shape,
+                                to_vox_map[0],
+                                np.linalg.inv(affine) @ to_vox_map[1],
+                            )
+                        # Equivalent to:
+                        # _resample_from_to(img_real, affine, to_vox_map)
+                        imgs = resamp_2 @ imgs
+
+                    # This can be used to help debug, but it really should just
+                    # show the brain filling the volume:
+                    # img_want = np.zeros(np.prod(img_real.shape))
+                    # img_want[np.concatenate(self._vol_vertices_to)] = 1.
+                    # img_want = np.reshape(
+                    #     img_want, self.src_data['src_shape'][::-1], order='F')
+                    # _debug_img(img_want, self.src_data['to_vox_map'][1],
+                    #            'To mask')
+                    # raise RuntimeError('Check')
+                    imgs = imgs[vol_verts]
+
+                    # combine real and complex parts
+                    if vols is None:
+                        img_to.append(sparse.csc_array(imgs))
                     else:
-                        img_to[:, ii] = img_to[:, ii] + 1j * img_real
+                        if img_to is None:
+                            img_to = np.zeros((imgs.shape[0], n_vols), dtype)
+                        img_to[:, sl] += imgs if attr == "real" else 1j * imgs
+                pb.update(sl.stop)
 
         if vols is None:
-            img_to = sparse.csc_array(img_to, shape=(len(vol_verts), n_vols)).tocsr()
+            img_to = sparse.hstack(img_to, format="csr")
 
         return img_to
 
@@ -1181,29 +1271,81 @@ def _compute_morph_matrix(
     subjects_dir=None,
     warn=True,
     xhemi=False,
+    n_jobs=None,
 ):
     """Compute morph matrix."""
     logger.info("Computing morph matrix...")
     subjects_dir = get_subjects_dir(subjects_dir, raise_error=True)
+    cache_fname = _get_morph_cache_fname(
+        subject_from,
+        subject_to,
+        vertices_from,
+        vertices_to,
+        smooth,
+        xhemi,
+        subjects_dir,
+    )
+    morpher = None
+    if cache_fname is not None and cache_fname.is_file():
+        try:
+            morpher, n_missing, n_vertices = _read_morph_cache(cache_fname)
+        except Exception as exp:
+            logger.info(f"    Could not read cached morph matrix ({exp})")
+        else:
+            logger.info(f"    Using cached morph matrix {cache_fname.name}")
+    if morpher is None:
+        morpher, n_missing, n_vertices = _compute_morph_matrix_hemis(
+            subject_from,
+            subject_to,
+            vertices_from,
+            vertices_to,
+            smooth,
+            subjects_dir,
+            xhemi,
+            n_jobs,
+        )
+        if cache_fname is not None:
+            _write_morph_cache(cache_fname, morpher, n_missing, n_vertices)
+    if warn:
+        for this_missing, this_vertices in zip(n_missing, n_vertices):
+            if this_missing:
+                warn_(
+                    f"{this_missing}/{this_vertices} vertices not included in "
+                    "smoothing, consider increasing the number of steps"
+                )
+    logger.info("[done]")
+    return morpher
 
+
+def _compute_morph_matrix_hemis(
+    subject_from,
+    subject_to,
+    vertices_from,
+    vertices_to,
+    smooth,
+    subjects_dir,
+    xhemi,
+    n_jobs,
+):
     tris = _get_subject_sphere_tris(subject_from, subjects_dir)
-    maps = read_morph_map(subject_from, subject_to, subjects_dir, xhemi)
-
-    # morph the data
-
-    morpher = []
-    for hemi_to in range(2):  # iterate over to / block-rows of CSR matrix
-        hemi_from = (1 - hemi_to) if xhemi else hemi_to
-        morpher.append(
-            _hemi_morph(
-                tris[hemi_from],
-                vertices_to[hemi_to],
-                vertices_from[hemi_from],
-                smooth,
-                maps[hemi_from],
-                warn,
-            )
+    maps = read_morph_map(subject_from, subject_to, subjects_dir, xhemi, n_jobs=n_jobs)
+
+    # morph the data, one hemisphere per thread
+    parallel, p_fun, _ = parallel_func(
+        _hemi_morph_mat, n_jobs, max_jobs=2, prefer="threads"
+    )
+    hemis_from = (1, 0) if xhemi else (0, 1)  # iterate over to / block-rows
+    out = parallel(
+        p_fun(
+            tris[hemi_from],
+            vertices_to[hemi_to],
+            vertices_from[hemi_from],
+            smooth,
+            maps[hemi_from],
         )
+        for hemi_to, hemi_from in enumerate(hemis_from)
+    )
+    morpher, n_missing, n_vertices = zip(*out)
 
     shape = (sum(len(v) for v in vertices_to), sum(len(v) for v in vertices_from))
     data = [m.data for m in morpher]
@@ -1220,18 +1362,87 @@ def _compute_morph_matrix(
     # this is equivalent to morpher = sparse_block_diag(morpher).tocsr(),
     # but works for xhemi mode
     morpher = sparse.csr_array((data, indices, indptr), shape=shape)
-    logger.info("[done]")
-    return morpher
+    return morpher, n_missing, n_vertices
+
+
+def _get_morph_cache_fname(
+    subject_from, subject_to, vertices_from, vertices_to, smooth, xhemi, subjects_dir
+):
+    """Get the content-addressed cache file name of a surface morph matrix."""
+    regs = ("sphere.reg", "sphere.left_right") if xhemi else ("sphere.reg",)
+    surfaces = list()
+    for subject in (subject_from, subject_to):
+        for hemi in ("lh", "rh"):
+            for reg in regs:
+                fname = subjects_dir / subject / "surf" / f"{hemi}.{reg}"
+                if not fname.is_file():
+                    return None  # the computation will raise a proper error
+                surfaces.append(hashfunc(fname))
+    key = object_hash(
+        dict(
+            surfaces=surfaces,
+            vertices_from=[np.asarray(v, np.int64) for v in vertices_from],
+            vertices_to=[np.asarray(v, np.int64) for v in vertices_to],
+            smooth=smooth,
+            xhemi=xhemi,
+        )
+    )
+    fname = f"{subject_from}-{subject_to}-{key:032x}-morph.npz"
+    return subjects_dir / "morph-maps" / "cache" / fname
+
+
+def _read_morph_cache(fname):
+    with np.load(fname, allow_pickle=False) as npz:
+        morpher = sparse.csr_array(
+            (npz["data"], npz["indices"], npz["indptr"]), shape=tuple(npz["shape"])
+        )
+        return morpher, tuple(npz["n_missing"]), tuple(npz["n_vertices"])
+
+
+def _write_morph_cache(fname, morpher, n_missing, n_vertices):
+    # write to a temporary file first so that concurrent runs never see a
+    # partially written file
+    tmp_fname = fname.with_name(f"{fname.name}.{os.getpid()}.tmp")
+    try:
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_fname, "wb") as fid:
+            np.savez(
+                fid,
+                data=morpher.data,
+                indices=morpher.indices,
+                indptr=morpher.indptr,
+                shape=np.array(morpher.shape),
+                n_missing=np.array(n_missing),
+                n_vertices=np.array(n_vertices),
+            )
+        os.replace(tmp_fname, fname)
+    except Exception as exp:
+        logger.info(f"    Could not cache morph matrix in {fname.parent} ({exp})")
+        if tmp_fname.exists():
+            tmp_fname.unlink()
 
 
 def _hemi_morph(tris, vertices_to, vertices_from, smooth, maps, warn):
+    mm, n_missing, n_vertices = _hemi_morph_mat(
+        tris, vertices_to, vertices_from, smooth, maps
+    )
+    if n_missing and warn:
+        warn_(
+            f"{n_missing}/{n_vertices} vertices not included in "
+            "smoothing, consider increasing the number of steps"
+        )
+    return mm
+
+
+def _hemi_morph_mat(tris, vertices_to, vertices_from, smooth, maps):
     _validate_type(smooth, (str, None, "int-like"), "smoothing steps")
     if len(vertices_from) == 0:
-        return sparse.csr_array((len(vertices_to), 0))
+        return sparse.csr_array((len(vertices_to), 0)), 0, 0
     e = mesh_edges(tris)
     e.data[e.data == 2] = 1
     n_vertices = e.shape[0]
     e += sparse.eye_array(n_vertices, format="csr")
+    n_missing = 0
     if isinstance(smooth, str):
         _check_option("smooth", smooth, ("nearest",), extra=" when used as a string.")
         mm = _surf_nearest(vertices_from, e).tocsr()
@@ -1246,11 +1457,6 @@ def _hemi_morph(tris, vertices_to, vertices_from, smooth, maps, warn):
         ).tocsr()
     else:
         mm, n_missing, n_iter = _surf_upsampling_mat(vertices_from, e, smooth)
-        if n_missing and warn:
-            warn_(
-                f"{n_missing}/{e.shape[0]} vertices not included in "
-                "smoothing, consider increasing the number of steps"
-            )
         logger.info(f"    {n_iter} smooth iterations done.")
     assert mm.shape == (n_vertices, len(vertices_from))
     if maps is not None:
@@ -1258,7 +1464,7 @@ def _hemi_morph(tris, vertices_to, vertices_from, smooth, maps, warn):
     else:  # to == from
         mm = mm[vertices_to]
     assert mm.shape == (len(vertices_to), len(vertices_from))
-    return mm
+    return mm, n_missing, n_vertices
 
 
 @verbose
@@ -1467,13 +1673,20 @@ def _check_vertices_match(v1, v2, name):
 _VOL_MAT_CHECK_RATIO = 1.0
 
 
-def _apply_morph_data(morph, stc_from):
-    """Morph a source estimate from one subject to another."""
-    if stc_from.subject is not None and stc_from.subject != morph.subject_from:
-        raise ValueError(
-            f"stc.subject ({stc_from.subject}) != morph.subject_from "
-            f"({morph.subject_from})"
-        )
+def _apply_morph_data(morph, stcs_from, n_jobs=None):
+    """Morph source estimates from one subject to another.
+
+    All source estimates are morphed with one matrix product. Those stored
+    as ``(kernel, sens_data)`` stay factored and only their kernel is morphed
+    (once per kernel).
+    """
+    stc_from = stcs_from[0]
+    for stc in stcs_from:
+        if stc.subject is not None and stc.subject != morph.subject_from:
+            raise ValueError(
+                f"stc.subject ({stc.subject}) != morph.subject_from "
+                f"({morph.subject_from})"
+            )
     _check_option("morph.kind", morph.kind, ("surface", "volume", "mixed"))
     if morph.kind == "surface":
         _validate_type(
@@ -1497,38 +1710,96 @@ def _apply_morph_data(morph, stc_from):
             "stc_from",
             "source estimate when using a mixed source morph",
         )
+    for si, stc in enumerate(stcs_from[1:], 1):
+        if type(stc) is not type(stc_from) or not all(
+            np.array_equal(v1, v2) for v1, v2 in zip(stc.vertices, stc_from.vertices)
+        ):
+            raise ValueError(
+                f"stc_from[{si}] does not have the same type and vertices as "
+                "stc_from[0], cannot morph them together"
+            )
 
     # figure out what to actually morph
     do_vol = not isinstance(stc_from, _BaseSurfaceSourceEstimate)
     do_surf = not isinstance(stc_from, _BaseVolSourceEstimate)
-
     vol_src_offset = 2 if do_surf else 0
+    if do_vol:
+        stc_from_vertices = stc_from.vertices[vol_src_offset:]
+        vertices_from = morph._vol_vertices_from
+        for ii, (v1, v2) in enumerate(zip(vertices_from, stc_from_vertices)):
+            _check_vertices_match(v1, v2, f"volume[{ii}]")
+    if do_surf:
+        for hemi, v1, v2 in zip(
+            ("left", "right"), morph.src_data["vertices_from"], stc_from.vertices[:2]
+        ):
+            _check_vertices_match(v1, v2, f"{hemi} hemisphere")
+    vertices_to = _get_morph_vertices_to(morph, do_surf, do_vol)
     from_surf_stop = sum(len(v) for v in stc_from.vertices[:vol_src_offset])
-    to_surf_stop = sum(len(v) for v in morph.vertices_to[:vol_src_offset])
-    from_vol_stop = stc_from.data.shape[0]
+
+    # stack all dense data (oris treated as times) to morph them at once
+    mesg = "Ori × Time" if stc_from._data_ndim == 3 else "Time"
+    dense = [stc for stc in stcs_from if not stc._factored]
+    data_to = list()
+    if len(dense):
+        data_from = [np.reshape(stc.data, (stc.data.shape[0], -1)) for stc in dense]
+        n_cols = np.cumsum([d.shape[1] for d in data_from])[:-1]
+        data_from = data_from[0] if len(dense) == 1 else np.hstack(data_from)
+        data_to = np.split(
+            _morph_rows(
+                morph, data_from, do_surf, do_vol, from_surf_stop, mesg, n_jobs
+            ),
+            n_cols,
+            axis=1,
+        )[::-1]
+    kernels_to = dict()
+    stcs_to = list()
+    klass = stc_from.__class__
+    for stc in stcs_from:
+        if stc._factored:
+            key = id(stc._kernel)
+            if key not in kernels_to:
+                kernels_to[key] = _morph_rows(
+                    morph,
+                    stc._kernel,
+                    do_surf,
+                    do_vol,
+                    from_surf_stop,
+                    "Channel",
+                    n_jobs,
+                )
+            data = (kernels_to[key], stc._sens_data)
+        else:
+            data = data_to.pop()
+            data = _reshape_view(data, (data.shape[0],) + stc.data.shape[1:])
+        stcs_to.append(klass(data, vertices_to, stc.tmin, stc.tstep, morph.subject_to))
+    return stcs_to
+
+
+def _get_morph_vertices_to(morph, do_surf, do_vol):
     vertices_to = morph.vertices_to
     if morph.kind == "mixed":
         vertices_to = vertices_to[0 if do_surf else 2 : None if do_vol else 2]
-    to_vol_stop = sum(len(v) for v in vertices_to)
+    return vertices_to
 
-    mesg = "Ori × Time" if stc_from.data.ndim == 3 else "Time"
-    data_from = np.reshape(stc_from.data, (stc_from.data.shape[0], -1))
-    n_times = data_from.shape[1]  # oris treated as times
-    data = np.empty((to_vol_stop, n_times), stc_from.data.dtype)
+
+def _morph_rows(morph, data_from, do_surf, do_vol, from_surf_stop, mesg, n_jobs=None):
+    """Morph the rows (sources) of a 2D array."""
+    vol_src_offset = 2 if do_surf else 0
+    to_surf_stop = sum(len(v) for v in morph.vertices_to[:vol_src_offset])
+    from_vol_stop = data_from.shape[0]
+    to_vol_stop = sum(len(v) for v in _get_morph_vertices_to(morph, do_surf, do_vol))
+    n_times = data_from.shape[1]
+    data = np.empty((to_vol_stop, n_times), data_from.dtype)
     to_used = np.zeros(data.shape[0], bool)
     from_used = np.zeros(data_from.shape[0], bool)
     if do_vol:
-        stc_from_vertices = stc_from.vertices[vol_src_offset:]
-        vertices_from = morph._vol_vertices_from
-        for ii, (v1, v2) in enumerate(zip(vertices_from, stc_from_vertices)):
-            _check_vertices_match(v1, v2, f"volume[{ii}]")
         from_sl = slice(from_surf_stop, from_vol_stop)
         assert not from_used[from_sl].any()
         from_used[from_sl] = True
         to_sl = slice(to_surf_stop, to_vol_stop)
         assert not to_used[to_sl].any()
         to_used[to_sl] = True
-        # Loop over time points to save memory
+        # Morph blocks of time points to save memory
         if morph.vol_morph_mat is None and n_times >= _VOL_MAT_CHECK_RATIO * (
             to_vol_stop - to_surf_stop
         ):
@@ -1538,18 +1809,14 @@ def _apply_morph_data(morph, stc_from):
                 "Consider (re-)saving your instance to disk to avoid "
                 "subsequent recomputation."
             )
-            morph.compute_vol_morph_mat()
+            morph.compute_vol_morph_mat(n_jobs=n_jobs)
         if morph.vol_morph_mat is None:
             logger.debug("Using individual volume morph")
-            data[to_sl, :] = morph._morph_vols(data_from[from_sl], mesg)
+            data[to_sl, :] = morph._morph_vols(data_from[from_sl], mesg, n_jobs=n_jobs)
         else:
             logger.debug("Using sparse volume morph matrix")
             data[to_sl, :] = morph.vol_morph_mat @ data_from[from_sl]
     if do_surf:
-        for hemi, v1, v2 in zip(
-            ("left", "right"), morph.src_data["vertices_from"], stc_from.vertices[:2]
-        ):
-            _check_vertices_match(v1, v2, f"{hemi} hemisphere")
         from_sl = slice(0, from_surf_stop)
         assert not from_used[from_sl].any()
         from_used[from_sl] = True
@@ -1559,7 +1826,4 @@ def _apply_morph_data(morph, stc_from):
         data[to_sl] = morph.morph_mat @ data_from[from_sl]
     assert to_used.all()
     assert from_used.all()
-    data = _reshape_view(data, (data.shape[0],) + stc_from.data.shape[1:])
-    klass = stc_from.__class__
-    stc_to = klass(data, vertices_to, stc_from.tmin, stc_from.tstep, morph.subject_to)
-    return stc_to
+    return data
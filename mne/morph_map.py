@@ -22,12 +22,13 @@ from ._fiff.write import (
     write_int,
     write_string,
 )
+from .parallel import parallel_func
 from .surface import (
     _compute_nearest,
     _find_nearest_tri_pts,
     _get_tri_supp_geom,
     _normalize_vectors,
-    _triangle_neighbors,
+    _triangle_neighbors_csr,
     read_surface,
 )
 from .utils import get_subjects_dir, logger, verbose, warn
@@ -35,7 +36,13 @@ from .utils import get_subjects_dir, logger, verbose, warn
 
 @verbose
 def read_morph_map(
-    subject_from, subject_to, subjects_dir=None, xhemi=False, verbose=None
+    subject_from,
+    subject_to,
+    subjects_dir=None,
+    xhemi=False,
+    verbose=None,
+    *,
+    n_jobs=None,
 ):
     """Read morph map.
 
@@ -56,6 +63,11 @@ def read_morph_map(
         ``subject_to == subject_from``. See notes of
         :func:`mne.compute_source_morph`.
     %(verbose)s
+    %(n_jobs)s
+        The maps of the hemispheres (and of both morph directions) are
+        computed in parallel threads if the morph map does not exist yet.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
@@ -100,13 +112,14 @@ def read_morph_map(
     logger.info(
         f'Morph map "{fname}" does not exist, creating it and saving it to disk'
     )
-    logger.info(log_msg % (subject_from, subject_to))
-    mmap_1 = _make_morph_map(subject_from, subject_to, subjects_dir, xhemi)
-    if subject_to == subject_from:
-        mmap_2 = None
-    else:
-        logger.info(log_msg % (subject_to, subject_from))
-        mmap_2 = _make_morph_map(subject_to, subject_from, subjects_dir, xhemi)
+    pairs = [(subject_from, subject_to)]
+    if subject_to != subject_from:
+        pairs.append((subject_to, subject_from))
+    for pair in pairs:
+        logger.info(log_msg % pair)
+    mmaps = _make_morph_maps(pairs, subjects_dir, xhemi, n_jobs)
+    mmap_1 = mmaps[0]
+    mmap_2 = mmaps[1] if len(mmaps) > 1 else None
     _write_morph_map(fname, subject_from, subject_to, mmap_1, mmap_2)
     return mmap_1
 
@@ -176,16 +189,16 @@ def _write_morph_map_(fid, subject_from, subject_to, mmap_1, mmap_2):
             end_block(fid, FIFF.FIFFB_MNE_MORPH_MAP)
 
 
-def _make_morph_map(subject_from, subject_to, subjects_dir, xhemi):
-    """Construct morph map from one subject to another.
+def _make_morph_maps(pairs, subjects_dir, xhemi, n_jobs):
+    """Construct morph maps for (subject_from, subject_to) pairs.
 
     Note that this is close, but not exactly like the C version.
     For example, parts are more accurate due to double precision,
     so expect some small morph-map differences!
 
-    Note: This seems easily parallelizable, but the overhead
-    of pickling all the data structures makes it less efficient
-    than just running on a single core :(
+    The hemispheres are computed in threads, as the overhead of pickling all
+    the data structures makes multiprocessing less efficient than just
+    running on a single core.
     """
     subjects_dir = get_subjects_dir(subjects_dir)
     if xhemi:
@@ -194,13 +207,19 @@ def _make_morph_map(subject_from, subject_to, subjects_dir, xhemi):
     else:
         reg = "%s.sphere.reg"
         hemis = (("lh", "lh"), ("rh", "rh"))
-
-    return [
-        _make_morph_map_hemi(
-            subject_from, subject_to, subjects_dir, reg % hemi_from, reg % hemi_to
-        )
+    jobs = [
+        (subject_from, subject_to, reg % hemi_from, reg % hemi_to)
+        for subject_from, subject_to in pairs
         for hemi_from, hemi_to in hemis
     ]
+    parallel, p_fun, _ = parallel_func(
+        _make_morph_map_hemi, n_jobs, max_jobs=len(jobs), prefer="threads"
+    )
+    maps = parallel(
+        p_fun(subject_from, subject_to, subjects_dir, reg_from, reg_to)
+        for subject_from, subject_to, reg_from, reg_to in jobs
+    )
+    return [maps[ii : ii + len(hemis)] for ii in range(0, len(maps), len(hemis))]
 
 
 def _make_morph_map_hemi(subject_from, subject_to, subjects_dir, reg_from, reg_to):
@@ -221,10 +240,13 @@ def _make_morph_map_hemi(subject_from, subject_to, subjects_dir, reg_from, reg_t
 
     # from surface: get nearest neighbors, find triangles for each vertex
     nn_pts_idx = _compute_nearest(from_rr, to_rr, method="KDTree")
-    from_pt_tris = _triangle_neighbors(from_tri, len(from_rr))
-    from_pt_tris = [from_pt_tris[pt_idx].astype(int) for pt_idx in nn_pts_idx]
-    from_pt_lens = np.cumsum([0] + [len(x) for x in from_pt_tris])
-    from_pt_tris = np.concatenate(from_pt_tris)
+    indptr, indices = _triangle_neighbors_csr(from_tri, len(from_rr))
+    starts = indptr[nn_pts_idx]
+    lens = indptr[nn_pts_idx + 1] - starts
+    from_pt_lens = np.concatenate([[0], np.cumsum(lens)])
+    from_pt_tris = indices[
+        np.repeat(starts - from_pt_lens[:-1], lens) + np.arange(from_pt_lens[-1])
+    ].astype(int)
     assert from_pt_tris.ndim == 1
     assert from_pt_lens[-1] == len(from_pt_tris)
 
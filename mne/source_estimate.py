@@ -5,6 +5,7 @@
 import contextlib
 import copy
 import os.path as op
+from collections import OrderedDict
 from types import GeneratorType
 
 import numpy as np
@@ -56,6 +57,7 @@ from .utils import (
     fill_doc,
     get_subjects_dir,
     logger,
+    object_hash,
     object_size,
     sizeof_fmt,
     verbose,
@@ -455,23 +457,28 @@ def _make_stc(
     # Rotate back for vector source estimates
     if vector:
         n_vertices = sum(len(v) for v in vertices)
-        assert data.shape[0] in (n_vertices, n_vertices * 3)
         if len(data) == n_vertices:
             assert src_type == "surface"  # should only be possible for this
-            assert source_nn.shape == (n_vertices, 3)
-            data = data[:, np.newaxis] * source_nn[:, :, np.newaxis]
-        else:
-            data = data.reshape((-1, 3, data.shape[-1]))
-            assert source_nn.shape in ((n_vertices, 3, 3), (n_vertices * 3, 3))
-            # This will be an identity transform for volumes, but let's keep
-            # the code simple and general and just do the matrix mult
-            data = np.matmul(
-                np.transpose(source_nn.reshape(n_vertices, 3, 3), axes=[0, 2, 1]), data
-            )
+        data = _rotate_vector_data(data, source_nn, n_vertices)
 
     return Klass(data=data, vertices=vertices, tmin=tmin, tstep=tstep, subject=subject)
 
 
+def _rotate_vector_data(data, source_nn, n_vertices):
+    """Rotate vector source data from source to head coordinates."""
+    assert data.shape[0] in (n_vertices, n_vertices * 3)
+    if len(data) == n_vertices:
+        assert source_nn.shape == (n_vertices, 3)
+        return data[:, np.newaxis] * source_nn[:, :, np.newaxis]
+    data = data.reshape((-1, 3, data.shape[-1]))
+    assert source_nn.shape in ((n_vertices, 3, 3), (n_vertices * 3, 3))
+    # This will be an identity transform for volumes, but let's keep
+    # the code simple and general and just do the matrix mult
+    return np.matmul(
+        np.transpose(source_nn.reshape(n_vertices, 3, 3), axes=[0, 2, 1]), data
+    )
+
+
 def _verify_source_estimate_compat(a, b):
     """Make sure two SourceEstimates are compatible for arith. operations."""
     compat = False
@@ -492,6 +499,21 @@ def _verify_source_estimate_compat(a, b):
         )
 
 
+def _is_scalar(a):
+    return not isinstance(a, _BaseSourceEstimate) and np.ndim(a) == 0
+
+
+def _shares_kernel(a, b):
+    """Check if two SourceEstimates can be combined as ``(kernel, sens_data)``."""
+    return (
+        a._factored
+        and b._factored
+        and a._sens_data.shape == b._sens_data.shape
+        and a._kernel.shape == b._kernel.shape
+        and (a._kernel is b._kernel or np.array_equal(a._kernel, b._kernel))
+    )
+
+
 class _BaseSourceEstimate(TimeMixin, FilterMixin):
     _data_ndim = 2
 
@@ -569,7 +591,8 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         s += ", tmax : %s (ms)" % (1e3 * self.times[-1])
         s += ", tstep : %s (ms)" % (1e3 * self.tstep)
         s += f", data shape : {self.shape}"
-        sz = sum(object_size(x) for x in (self.vertices + [self.data]))
+        arrays = [self._kernel, self._sens_data] if self._factored else [self.data]
+        sz = sum(object_size(x) for x in (self.vertices + arrays))
         s += f", ~{sizeof_fmt(sz)}"
         return f"<{type(self).__name__} | {s}>"
 
@@ -624,6 +647,7 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         See Also
         --------
         extract_label_time_course : Extract time courses for multiple STCs.
+        LabelExtractor : Extract time courses reusing the label preparation.
 
         Notes
         -----
@@ -709,8 +733,15 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         Notes
         -----
         Baseline correction can be done multiple times.
+
+        If the source estimate is stored as ``(kernel, sens_data)``, the
+        baseline is subtracted from the sensor data, which is equivalent as
+        the inverse kernel is linear.
         """
-        self.data = rescale(self.data, self.times, baseline, copy=False)
+        if self._factored:
+            self._sens_data = rescale(self._sens_data, self.times, baseline)
+        else:
+            self.data = rescale(self.data, self.times, baseline, copy=False)
         return self
 
     @verbose
@@ -839,6 +870,17 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
             self._kernel = None
             self._sens_data = None
 
+    @property
+    def _factored(self):
+        """Whether the data are (still) stored as ``(kernel, sens_data)``."""
+        return self._kernel is not None and self._sens_data is not None
+
+    def _get_rows(self, idx):
+        """Get the data of a subset of sources without computing all of them."""
+        if self._factored:
+            return np.dot(self._kernel[idx], self._sens_data)
+        return self.data[idx]
+
     @fill_doc
     def crop(self, tmin=None, tmax=None, include_tmax=True):
         """Restrict SourceEstimate to a time interval.
@@ -1014,9 +1056,13 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return stc
 
     def __iadd__(self, a):  # noqa: D105
-        self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
+            if _shares_kernel(self, a):
+                self._sens_data = self._sens_data + a._sens_data
+                return self
+        self._remove_kernel_sens_data_()
+        if isinstance(a, _BaseSourceEstimate):
             self.data += a.data
         else:
             self.data += a
@@ -1042,12 +1088,15 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         stc : SourceEstimate | VectorSourceEstimate
             The modified stc.
         """
-        data = self.data
-        tmax = self.tmin + self.tstep * data.shape[-1]
+        tmax = self.tmin + self.tstep * self.shape[-1]
         tmin = (self.tmin + tmax) / 2.0
         tstep = tmax - self.tmin
+        if self._factored:
+            data = (self._kernel, self._sens_data.sum(axis=-1, keepdims=True))
+        else:
+            data = self.data.sum(axis=-1, keepdims=True)
         sum_stc = self.__class__(
-            self.data.sum(axis=-1, keepdims=True),
+            data,
             vertices=self.vertices,
             tmin=tmin,
             tstep=tstep,
@@ -1062,9 +1111,13 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return stc
 
     def __isub__(self, a):  # noqa: D105
-        self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
+            if _shares_kernel(self, a):
+                self._sens_data = self._sens_data - a._sens_data
+                return self
+        self._remove_kernel_sens_data_()
+        if isinstance(a, _BaseSourceEstimate):
             self.data -= a.data
         else:
             self.data -= a
@@ -1083,6 +1136,9 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return self.__idiv__(a)
 
     def __idiv__(self, a):  # noqa: D105
+        if self._factored and _is_scalar(a):
+            self._sens_data = self._sens_data / a
+            return self
         self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
@@ -1098,6 +1154,9 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         return stc
 
     def __imul__(self, a):  # noqa: D105
+        if self._factored and _is_scalar(a):
+            self._sens_data = self._sens_data * a
+            return self
         self._remove_kernel_sens_data_()
         if isinstance(a, _BaseSourceEstimate):
             _verify_source_estimate_compat(self, a)
@@ -1131,7 +1190,9 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
     def __neg__(self):  # noqa: D105
         """Negate the source estimate."""
         stc = self.copy()
-        stc._remove_kernel_sens_data_()
+        if stc._factored:
+            stc._sens_data = -stc._sens_data
+            return stc
         stc.data *= -1
         return stc
 
@@ -1193,6 +1254,9 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
         func : callable
             Function that is applied to summarize the data. Needs to accept a
             numpy.array as first input and an ``axis`` keyword argument.
+            If it is :func:`numpy.mean` or :func:`numpy.sum` and the source
+            estimate is stored as ``(kernel, sens_data)``, the binning is done
+            on the sensor data.
 
         Returns
         -------
@@ -1206,14 +1270,20 @@ class _BaseSourceEstimate(TimeMixin, FilterMixin):
 
         times = np.arange(tstart, tstop + self.tstep, width)
         nt = len(times) - 1
-        data = np.empty(self.shape[:-1] + (nt,), dtype=self.data.dtype)
+        # linear summaries commute with the inverse kernel
+        factored = self._factored and func in (np.mean, np.sum)
+        in_data = self._sens_data if factored else self.data
+        data = np.empty(in_data.shape[:-1] + (nt,), dtype=in_data.dtype)
         for i in range(nt):
             idx = (self.times >= times[i]) & (self.times < times[i + 1])
-            data[..., i] = func(self.data[..., idx], axis=-1)
+            data[..., i] = func(in_data[..., idx], axis=-1)
 
         tmin = times[0] + width / 2.0
         stc = self.copy()
-        stc._data = data
+        if factored:
+            stc._sens_data = data
+        else:
+            stc._data = data
         stc.tmin = tmin
         stc.tstep = width
         return stc
@@ -2451,6 +2521,7 @@ class _BaseVolSourceEstimate(_BaseSourceEstimate):
         See Also
         --------
         extract_label_time_course : Extract time courses for multiple STCs.
+        LabelExtractor : Extract time courses reusing the label preparation.
 
         Notes
         -----
@@ -3043,23 +3114,38 @@ def _get_vol_mask(src):
     return mask
 
 
+# Spatial adjacency matrices keyed by a hash of the relevant source space
+# content, so that repeated calls (e.g. with different n_times) are cheap
+_SPATIAL_ADJACENCY_CACHE = OrderedDict()
+_SPATIAL_ADJACENCY_CACHE_SIZE = 8
+
+
+def _get_cached_spatial_adjacency(key_data, func, *args):
+    """Get a spatial adjacency from the bounded cache, computing if needed."""
+    key = object_hash(key_data)
+    try:
+        out = _SPATIAL_ADJACENCY_CACHE.pop(key)
+    except KeyError:
+        out = func(*args)
+        while len(_SPATIAL_ADJACENCY_CACHE) >= _SPATIAL_ADJACENCY_CACHE_SIZE:
+            _SPATIAL_ADJACENCY_CACHE.popitem(last=False)
+    _SPATIAL_ADJACENCY_CACHE[key] = out  # most recently used goes last
+    return out
+
+
 def _spatio_temporal_src_adjacency_vol(src, n_times):
     from sklearn.feature_extraction import grid_to_graph
 
     mask = _get_vol_mask(src)
-    edges = grid_to_graph(*mask.shape, mask=mask)
+    key_data = dict(kind="vol", shape=mask.shape, vertno=src[0]["vertno"])
+    edges = _get_cached_spatial_adjacency(
+        key_data, lambda: sparse.coo_array(grid_to_graph(*mask.shape, mask=mask))
+    )
     adjacency = _get_adjacency_from_edges(edges, n_times)
     return adjacency
 
 
-def _spatio_temporal_src_adjacency_surf(src, n_times):
-    if src[0]["use_tris"] is None:
-        # XXX It would be nice to support non oct source spaces too...
-        raise RuntimeError(
-            "The source space does not appear to be an ico "
-            "surface. adjacency cannot be extracted from"
-            " non-ico source spaces."
-        )
+def _spatial_src_adjacency_surf(src):
     used_verts = [np.unique(s["use_tris"]) for s in src]
     offs = np.cumsum([0] + [len(u_v) for u_v in used_verts])[:-1]
     tris = np.concatenate(
@@ -3068,31 +3154,46 @@ def _spatio_temporal_src_adjacency_surf(src, n_times):
             for u_v, s, off in zip(used_verts, src, offs)
         ]
     )
-    adjacency = spatio_temporal_tris_adjacency(tris, n_times)
+    adjacency = spatio_temporal_tris_adjacency(tris, 1)
 
     # deal with source space only using a subset of vertices
     masks = [np.isin(u, s["vertno"]) for s, u in zip(src, used_verts)]
-    if sum(u.size for u in used_verts) != adjacency.shape[0] / n_times:
+    if sum(u.size for u in used_verts) != adjacency.shape[0]:
         raise ValueError("Used vertices do not match adjacency shape")
     if [np.sum(m) for m in masks] != [len(s["vertno"]) for s in src]:
         raise ValueError("Vertex mask does not match number of vertices")
     masks = np.concatenate(masks)
     missing = 100 * float(len(masks) - np.sum(masks)) / len(masks)
     if missing:
-        warn(
-            f"{missing:0.1f}% of original source space vertices have been"
-            " omitted, tri-based adjacency will have holes.\n"
-            "Consider using distance-based adjacency or "
-            "morphing data to all source space vertices."
-        )
-        masks = np.tile(masks, n_times)
         masks = np.where(masks)[0]
         adjacency = adjacency.tocsr()
         adjacency = adjacency[masks]
         adjacency = adjacency[:, masks]
         # return to original format
         adjacency = adjacency.tocoo()
-    return adjacency
+    return adjacency, missing
+
+
+def _spatio_temporal_src_adjacency_surf(src, n_times):
+    if src[0]["use_tris"] is None:
+        # XXX It would be nice to support non oct source spaces too...
+        raise RuntimeError(
+            "The source space does not appear to be an ico "
+            "surface. adjacency cannot be extracted from"
+            " non-ico source spaces."
+        )
+    key_data = dict(kind="surf", src=[[s["use_tris"], s["vertno"]] for s in src])
+    edges, missing = _get_cached_spatial_adjacency(
+        key_data, _spatial_src_adjacency_surf, src
+    )
+    if missing:
+        warn(
+            f"{missing:0.1f}% of original source space vertices have been"
+            " omitted, tri-based adjacency will have holes.\n"
+            "Consider using distance-based adjacency or "
+            "morphing data to all source space vertices."
+        )
+    return _get_adjacency_from_edges(edges, n_times)
 
 
 @verbose
@@ -3219,13 +3320,17 @@ def spatio_temporal_dist_adjacency(src, n_times, dist, verbose=None):
         vertices are time 1, the nodes from 2 to 2N are the vertices
         during time 2, etc.
     """
-    from scipy import sparse
-
     if src[0]["dist"] is None:
         raise RuntimeError(
             "src must have distances included, consider using "
             "setup_source_space with add_dist=True"
         )
+    key_data = dict(kind="dist", dist=dist, src=[[s["dist"], s["vertno"]] for s in src])
+    edges = _get_cached_spatial_adjacency(key_data, _spatial_dist_edges, src, dist)
+    return _get_adjacency_from_edges(edges, n_times)
+
+
+def _spatial_dist_edges(src, dist):
     blocks = [s["dist"][s["vertno"], :][:, s["vertno"]] for s in src]
     # Ensure we keep explicit zeros; deal with changes in SciPy
     for bi, block in enumerate(blocks):
@@ -3240,7 +3345,7 @@ def spatio_temporal_dist_adjacency(src, n_times, dist, verbose=None):
     edges = edges.tocsr()
     edges.eliminate_zeros()
     edges = edges.tocoo()
-    return _get_adjacency_from_edges(edges, n_times)
+    return edges
 
 
 @verbose
@@ -3347,24 +3452,27 @@ def _get_adjacency_from_edges(edges, n_times, verbose=None):
     """Given edges sparse matrix, create adjacency matrix."""
     n_vertices = edges.shape[0]
     logger.info("-- number of adjacent vertices : %d", n_vertices)
-    nnz = edges.col.size
-    aux = n_vertices * np.tile(np.arange(n_times)[:, None], (1, nnz))
-    col = (edges.col[None, :] + aux).ravel()
-    row = (edges.row[None, :] + aux).ravel()
-    if n_times > 1:  # add temporal edges
-        o = (
-            n_vertices * np.arange(n_times - 1)[:, None]
-            + np.arange(n_vertices)[None, :]
-        ).ravel()
-        d = (
-            n_vertices * np.arange(1, n_times)[:, None] + np.arange(n_vertices)[None, :]
-        ).ravel()
-        row = np.concatenate((row, o, d))
-        col = np.concatenate((col, d, o))
-    data = np.ones(
-        edges.data.size * n_times + 2 * n_vertices * (n_times - 1), dtype=np.int64
+    edges = sparse.coo_array(edges)
+    spatial = sparse.coo_array(
+        (np.ones(edges.row.size, np.int64), (edges.row, edges.col)),
+        shape=edges.shape,
     )
-    adjacency = sparse.coo_array((data, (row, col)), shape=(n_times * n_vertices,) * 2)
+    # spatial edges repeated at each time point, plus each vertex connected to
+    # itself at the previous and next time points
+    eye = sparse.eye_array(n_times, dtype=np.int64)
+    blocks = [sparse.kron(eye, spatial, format="coo")]
+    if n_times > 1:
+        temporal = sparse.diags_array(
+            [np.ones(n_times - 1, np.int64)] * 2, offsets=[1, -1], dtype=np.int64
+        )
+        eye = sparse.eye_array(n_vertices, dtype=np.int64)
+        blocks.append(sparse.kron(temporal, eye, format="coo"))
+    n_total = n_times * n_vertices
+    idx_dtype = np.int32 if n_total <= np.iinfo(np.int32).max else np.int64
+    row = np.concatenate([block.row for block in blocks]).astype(idx_dtype)
+    col = np.concatenate([block.col for block in blocks]).astype(idx_dtype)
+    data = np.concatenate([block.data for block in blocks])
+    adjacency = sparse.coo_array((data, (row, col)), shape=(n_total,) * 2)
     return adjacency
 
 
@@ -3512,7 +3620,7 @@ def _prepare_label_extraction(stc, labels, src, mode, allow_empty, use_sparse):
             #
             # So if we override vertno with the stc vertices, it will pick
             # the correct normals.
-            with _temporary_vertices(src, stc.vertices):
+            with _temporary_vertices(src, vertno):
                 this_flip = label_sign_flip(label, src[:2])[:, None]
 
         label_vertidx.append(this_vertidx)
@@ -3653,100 +3761,322 @@ def _get_allowed_label_modes(stc):
         return _get_default_label_modes()
 
 
-def _gen_extract_label_time_course(
-    stcs,
-    labels,
-    src,
-    *,
-    mode="mean",
-    allow_empty=False,
-    mri_resolution=True,
-    verbose=None,
-):
-    # loop through source estimates and extract time series
-    if src is None and mode in ["mean", "max"]:
-        kind = "surface"
-    else:
-        _validate_type(src, SourceSpaces)
-        kind = src.kind
-    _check_option("mode", mode, _get_default_label_modes())
-
-    if kind in ("surface", "mixed"):
-        if not isinstance(labels, list):
-            labels = [labels]
-        use_sparse = False
-    else:
-        labels = _volume_labels(src, labels, mri_resolution)
-        use_sparse = bool(mri_resolution)
-    n_mode = len(labels)  # how many processed with the given mode
-    n_mean = len(src[2:]) if kind == "mixed" else 0
-    n_labels = n_mode + n_mean
-    vertno = func = None
-    for si, stc in enumerate(stcs):
-        _validate_type(stc, _BaseSourceEstimate, f"stcs[{si}]", "source estimate")
+def _pca_flip_factored(kernel_qr, sens_data):
+    """Compute the pca_flip time course of ``kernel @ sens_data``.
+
+    With ``kernel = Q @ R``, the SVD of ``R @ sens_data`` has the same
+    singular values and right-singular vectors, so only a small SVD is needed.
+    """
+    R, flip_q, n_vertices = kernel_qr
+    U, s, V = _safe_svd(np.dot(R, sens_data), full_matrices=False)
+    sign = np.sign(np.dot(U[:, 0], flip_q))
+    scale = np.linalg.norm(s) / np.sqrt(n_vertices)
+    return sign * scale * V[0]
+
+
+@fill_doc
+class LabelExtractor:
+    """Extract label time courses from many source estimates.
+
+    The vertex selections, sign flips and extraction matrices are computed
+    once and reused for every source estimate the extractor is applied to.
+
+    Parameters
+    ----------
+    %(labels_eltc)s
+    %(src_eltc)s
+    %(mode_eltc)s
+    %(allow_empty_eltc)s
+    %(mri_resolution_eltc)s
+    %(verbose)s
+
+    See Also
+    --------
+    extract_label_time_course
+
+    Notes
+    -----
+    %(eltc_mode_notes)s
+
+    For the linear modes ``'mean'`` and ``'mean_flip'`` (and for the volume
+    parts of a mixed source space), the extraction is a single sparse matrix
+    product. Source estimates stored as ``(kernel, sens_data)``, e.g. from
+    :func:`mne.minimum_norm.apply_inverse_epochs`, are never projected to all
+    sources: the extraction matrix is folded into the kernel once per kernel
+    (see :meth:`fold_kernel`), and for ``'pca_flip'`` the SVD is computed from
+    a QR decomposition of the label rows of the kernel.
+
+    .. versionadded:: 1.13
+    """
+
+    @verbose
+    def __init__(
+        self,
+        labels,
+        src,
+        mode="auto",
+        *,
+        allow_empty=False,
+        mri_resolution=True,
+        verbose=None,
+    ):
+        if src is None and mode in ["mean", "max"]:
+            kind = "surface"
+        else:
+            _validate_type(src, SourceSpaces)
+            kind = src.kind
+        _check_option("mode", mode, _get_default_label_modes())
+        if kind in ("surface", "mixed"):
+            if not isinstance(labels, list):
+                labels = [labels]
+            use_sparse = False
+        else:
+            labels = _volume_labels(src, labels, mri_resolution)
+            use_sparse = bool(mri_resolution)
+        self.mode = mode
+        self._labels = labels
+        self._src = src
+        self._allow_empty = allow_empty
+        self._use_sparse = use_sparse
+        self._n_mode = len(labels)  # how many processed with the given mode
+        self._n_mean = len(src[2:]) if kind == "mixed" else 0
+        self._vertices = None
+        self._ops = dict()
+        self._kernel_ops = dict()
+
+    def __repr__(self):  # noqa: D105
+        return f"<LabelExtractor | {self.n_labels} labels, mode : {self.mode}>"
+
+    @property
+    def n_labels(self):
+        """The number of extracted time courses."""
+        return self._n_mode + self._n_mean
+
+    @verbose
+    def apply(self, stcs, return_generator=False, *, verbose=None):
+        """Extract label time courses from source estimates.
+
+        Parameters
+        ----------
+        stcs : SourceEstimate | list (or generator) of SourceEstimate
+            The source estimates from which to extract the time course.
+        return_generator : bool
+            If True, a generator instead of a list is returned.
+        %(verbose)s
+
+        Returns
+        -------
+        %(label_tc_el_returns)s
+        """
+        # convert inputs to lists
+        if not isinstance(stcs, list | tuple | GeneratorType):
+            stcs = [stcs]
+            return_several = False
+            return_generator = False
+        else:
+            return_several = True
+
+        label_tc = (self._extract(stc, f"stcs[{si}]") for si, stc in enumerate(stcs))
+
+        if not return_generator:
+            # do the extraction and return a list
+            label_tc = list(label_tc)
+
+        if not return_several:
+            # input was a single SoureEstimate, return single array
+            label_tc = label_tc[0]
+
+        return label_tc
+
+    def fold_kernel(self, kernel):
+        """Fold the label extraction into an inverse kernel.
+
+        Only possible for the linear modes ``'mean'`` and ``'mean_flip'``.
+
+        Parameters
+        ----------
+        kernel : ndarray, shape (n_sources, n_channels)
+            The inverse kernel. Its rows must correspond to the vertices of
+            the source space (or of the source estimates the extractor was
+            already applied to).
+
+        Returns
+        -------
+        label_kernel : ndarray, shape (n_labels, n_channels)
+            The kernel that gives the label time courses when applied to
+            sensor data.
+        """
+        mode = self.mode
+        if mode == "auto":
+            mode = "mean" if self._src.kind == "volume" else "mean_flip"
+        _check_option("mode", mode, ("mean", "mean_flip"), "to fold into a kernel")
+        if self._vertices is None and self._src is None:
+            raise ValueError("src must be provided to fold into a kernel")
+        op = self._get_op(mode, None)
+        kernel = np.asarray(kernel)
+        if kernel.ndim != 2 or kernel.shape[0] != op["matrix"].shape[1]:
+            raise ValueError(
+                f"kernel must have shape ({op['matrix'].shape[1]}, n_channels), "
+                f"got {kernel.shape}"
+            )
+        return op["matrix"] @ kernel
+
+    def _resolve_mode(self, stc):
         _check_option(
             "mode",
-            mode,
+            self.mode,
             _get_allowed_label_modes(stc),
             "when using a vector and/or volume source estimate",
         )
+        if self.mode != "auto":
+            return self.mode
         if isinstance(stc, _BaseVolSourceEstimate | _BaseVectorSourceEstimate):
-            mode = "mean" if mode == "auto" else mode
-        else:
-            mode = "mean_flip" if mode == "auto" else mode
-        if vertno is None:
-            vertno = copy.deepcopy(stc.vertices)  # avoid keeping a ref
-            nvert = np.array([len(v) for v in vertno])
-            label_vertidx, src_flip = _prepare_label_extraction(
-                stc, labels, src, mode, allow_empty, use_sparse
+            return "mean"
+        return "mean_flip"
+
+    def _get_op(self, mode, stc):
+        if self._vertices is None:
+            if stc is None:
+                vertices = [s["vertno"] for s in self._src]
+            else:
+                vertices = stc.vertices
+            self._vertices = copy.deepcopy(vertices)  # avoid keeping a ref
+        if mode in self._ops:
+            return self._ops[mode]
+        label_vertidx, src_flip = _prepare_label_extraction(
+            stc, self._labels, self._src, mode, self._allow_empty, self._use_sparse
+        )
+        # all linear parts of the extraction as one sparse matrix
+        rows, cols, vals = list(), list(), list()
+        if mode in ("mean", "mean_flip"):
+            for li, (vertidx, flip) in enumerate(zip(label_vertidx, src_flip)):
+                if vertidx is None:
+                    continue
+                if isinstance(vertidx, sparse.csr_array):
+                    vertidx = vertidx.tocoo()  # already averaged for "mean"
+                    rows.append(np.full(vertidx.nnz, li))
+                    cols.append(vertidx.col)
+                    vals.append(vertidx.data)
+                    continue
+                weights = np.full(len(vertidx), 1.0 / len(vertidx))
+                if mode == "mean_flip":
+                    weights *= flip[:, 0]
+                rows.append(np.full(len(vertidx), li))
+                cols.append(vertidx)
+                vals.append(weights)
+        nvert = [len(v) for v in self._vertices]
+        if mode is not None and self._n_mean:
+            offset = sum(nvert[:2])
+            for i, nv in enumerate(nvert[2:]):
+                rows.append(np.full(nv, self._n_mode + i))
+                cols.append(offset + np.arange(nv))
+                vals.append(np.full(nv, 1.0 / max(nv, 1)))
+                offset += nv
+        matrix = None
+        if len(rows):
+            matrix = sparse.csr_array(
+                (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+                shape=(self.n_labels, sum(nvert)),
             )
-            func = _label_funcs[mode]
+        op = dict(
+            mode=mode,
+            vertidx=label_vertidx,
+            flip=src_flip,
+            matrix=matrix,
+            linear=mode in ("mean", "mean_flip"),
+        )
+        self._ops[mode] = op
+        return op
+
+    def _get_kernel_op(self, op, kernel):
+        """Get the kernel-folded operators, reused for the same kernel."""
+        kernel_op = self._kernel_ops.get(op["mode"])
+        if kernel_op is not None and kernel_op["kernel"] is kernel:
+            return kernel_op
+        kernel_op = dict(kernel=kernel, folded=None, qr=None)
+        if op["matrix"] is not None:
+            kernel_op["folded"] = op["matrix"] @ kernel
+        if op["mode"] == "pca_flip":
+            kernel_op["qr"] = qr = list()
+            for vertidx, flip in zip(op["vertidx"], op["flip"]):
+                if vertidx is None:
+                    qr.append(None)
+                    continue
+                Q, R = np.linalg.qr(kernel[vertidx])
+                qr.append((R, np.dot(flip[:, 0], Q), len(vertidx)))
+        self._kernel_ops[op["mode"]] = kernel_op
+        return kernel_op
+
+    def _extract(self, stc, name):
+        _validate_type(stc, _BaseSourceEstimate, name, "source estimate")
+        mode = self._resolve_mode(stc)
         # make sure the stc is compatible with the source space
-        if len(vertno) != len(stc.vertices):
-            raise ValueError("stc not compatible with source space")
-        for vn, svn in zip(vertno, stc.vertices):
-            if len(vn) != len(svn):
-                raise ValueError(
-                    "stc not compatible with source space. "
-                    f"stc has {len(svn)} time series but there are {len(vn)} "
-                    "vertices in source space. Ensure you used "
-                    "src from the forward or inverse operator, "
-                    "as forward computation can exclude vertices."
-                )
-            if not np.array_equal(svn, vn):
+        vertno = self._vertices
+        if vertno is not None:
+            if len(vertno) != len(stc.vertices):
                 raise ValueError("stc not compatible with source space")
+            for vn, svn in zip(vertno, stc.vertices):
+                if len(vn) != len(svn):
+                    raise ValueError(
+                        "stc not compatible with source space. "
+                        f"stc has {len(svn)} time series but there are {len(vn)} "
+                        "vertices in source space. Ensure you used "
+                        "src from the forward or inverse operator, "
+                        "as forward computation can exclude vertices."
+                    )
+                if not np.array_equal(svn, vn):
+                    raise ValueError("stc not compatible with source space")
+        op = self._get_op(mode, stc)
 
-        logger.info("Extracting time courses for %d labels (mode: %s)", n_labels, mode)
+        logger.info(
+            "Extracting time courses for %d labels (mode: %s)", self.n_labels, mode
+        )
 
-        # do the extraction
+        # do the extraction; when the stc is stored as (kernel, sens_data),
+        # only the sources in the labels are computed, and the linear parts
+        # are applied to the kernel directly
+        factored = stc._factored
+        kernel_op = self._get_kernel_op(op, stc._kernel) if factored else None
+        if factored:
+            dtype = np.result_type(stc._kernel, stc._sens_data)
+        else:
+            dtype = stc.data.dtype
         if mode is None:
             # prepopulate an empty list for easy array-like index-based assignment
-            label_tc = [None] * max(len(label_vertidx), len(src_flip))
+            label_tc = [None] * len(op["vertidx"])
+        elif op["matrix"] is None:
+            label_tc = np.zeros((self.n_labels,) + stc.shape[1:], dtype=dtype)
+        elif factored:
+            label_tc = np.dot(kernel_op["folded"], stc._sens_data)
         else:
-            # For other modes, initialize the label_tc array
-            label_tc = np.zeros((n_labels,) + stc.data.shape[1:], dtype=stc.data.dtype)
-        for i, (vertidx, flip) in enumerate(zip(label_vertidx, src_flip)):
-            if vertidx is not None:
-                if isinstance(vertidx, sparse.csr_array):
-                    assert mri_resolution
-                    assert vertidx.shape[1] == stc.data.shape[0]
+            data = stc.data
+            label_tc = op["matrix"] @ np.reshape(data, (data.shape[0], -1))
+            label_tc = np.reshape(label_tc, (self.n_labels,) + data.shape[1:])
+            label_tc = label_tc.astype(dtype, copy=False)
+        if op["linear"]:
+            return label_tc
+
+        func = _label_funcs[mode]
+        for i, (vertidx, flip) in enumerate(zip(op["vertidx"], op["flip"])):
+            if vertidx is None:
+                continue
+            if isinstance(vertidx, sparse.csr_array):
+                assert vertidx.shape[1] == stc.shape[0]
+                if factored:
+                    this_data = (vertidx @ stc._kernel) @ stc._sens_data
+                else:
                     this_data = np.reshape(stc.data, (stc.data.shape[0], -1))
                     this_data = vertidx @ this_data
                     this_data = _reshape_view(
                         this_data, (this_data.shape[0],) + stc.data.shape[1:]
                     )
-                else:
-                    this_data = stc.data[vertidx]
-                label_tc[i] = func(flip, this_data)
-
-        if mode is not None:
-            offset = nvert[:-n_mean].sum()  # effectively :2 or :0
-            for i, nv in enumerate(nvert[2:]):
-                if nv != 0:
-                    v2 = offset + nv
-                    label_tc[n_mode + i] = np.mean(stc.data[offset:v2], axis=0)
-                    offset = v2
-        yield label_tc
+            elif factored and mode == "pca_flip":
+                label_tc[i] = _pca_flip_factored(kernel_op["qr"][i], stc._sens_data)
+                continue
+            else:
+                this_data = stc._get_rows(vertidx)
+            label_tc[i] = func(flip, this_data)
+        return label_tc
 
 
 @verbose
@@ -3784,6 +4114,10 @@ def extract_label_time_course(
     -------
     %(label_tc_el_returns)s
 
+    See Also
+    --------
+    LabelExtractor
+
     Notes
     -----
     %(eltc_mode_notes)s
@@ -3794,32 +4128,14 @@ def extract_label_time_course(
     space is the one actually used by the inverse to compute the source
     time courses.
     """
-    # convert inputs to lists
-    if not isinstance(stcs, list | tuple | GeneratorType):
-        stcs = [stcs]
-        return_several = False
-        return_generator = False
-    else:
-        return_several = True
-
-    label_tc = _gen_extract_label_time_course(
-        stcs,
+    extractor = LabelExtractor(
         labels,
         src,
         mode=mode,
         allow_empty=allow_empty,
         mri_resolution=mri_resolution,
     )
-
-    if not return_generator:
-        # do the extraction and return a list
-        label_tc = list(label_tc)
-
-    if not return_several:
-        # input was a single SoureEstimate, return single array
-        label_tc = label_tc[0]
-
-    return label_tc
+    return extractor.apply(stcs, return_generator=return_generator)
 
 
 @verbose
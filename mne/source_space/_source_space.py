@@ -2727,6 +2727,10 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
     (2012) running 6 jobs in parallel, an ico-5 (10242 per hemi) source space
     takes about 10 minutes to compute all distances (``dist_limit = np.inf``).
     With ``dist_limit = 0.007``, computing distances takes about 1 minute.
+    The search from each source point stops at ``dist_limit``, and only the
+    distances within it are stored (as a sparse float32 matrix), so a finite
+    limit is much faster and takes much less memory. The jobs run in threads
+    that share the surface graph.
 
     We recommend computing distances once per source space and then saving
     the source space to disk, as the computed distances will automatically be
@@ -2740,7 +2744,7 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
     if src.kind != "surface":
         raise RuntimeError("Currently all source spaces must be of surface type")
 
-    parallel, p_fun, n_jobs = parallel_func(_do_src_distances, n_jobs)
+    parallel, p_fun, n_jobs = parallel_func(_do_src_distances, n_jobs, prefer="threads")
     min_dists = list()
     min_idxs = list()
     msg = "patch information" if patch_only else "source space distances"
@@ -2762,28 +2766,31 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
             for key in ("dist", "dist_limit"):
                 s[key] = None
         else:
+            # The threads share the adjacency, and each returns the sparse
+            # rows for its sources, which are in order
             d = parallel(
                 p_fun(adjacency, s["vertno"], r, dist_limit)
                 for r in np.array_split(np.arange(len(s["vertno"])), n_jobs)
             )
             # deal with indexing so we can add patch info
-            min_idx = np.array([dd[1] for dd in d])
-            min_dist = np.array([dd[2] for dd in d])
+            min_idx = np.array([dd[3] for dd in d])
+            min_dist = np.array([dd[4] for dd in d])
             midx = np.argmin(min_dist, axis=0)
             range_idx = np.arange(len(s["rr"]))
             min_dist = min_dist[midx, range_idx]
             min_idx = min_idx[midx, range_idx]
             min_dists.append(min_dist)
             min_idxs.append(min_idx)
-            # convert to sparse representation
-            d = np.concatenate([dd[0] for dd in d]).ravel()  # already float32
-            idx = d > 0
-            d = d[idx]
-            i, j = np.meshgrid(s["vertno"], s["vertno"])
-            i = i.ravel()[idx]
-            j = j.ravel()[idx]
+            # assemble the sparse representation
+            counts = np.zeros(s["np"] + 1, np.int64)
+            counts[s["vertno"] + 1] = np.concatenate([dd[0] for dd in d])
             s["dist"] = csr_array(
-                (d, (i, j)), shape=(s["np"], s["np"]), dtype=np.float32
+                (
+                    np.concatenate([dd[2] for dd in d]),  # already float32
+                    s["vertno"][np.concatenate([dd[1] for dd in d])],
+                    np.cumsum(counts),
+                ),
+                shape=(s["np"], s["np"]),
             )
             s["dist_limit"] = np.array([dist_limit], np.float32)
 
@@ -2800,28 +2807,41 @@ def add_source_space_distances(src, dist_limit=np.inf, n_jobs=None, *, verbose=N
 
 
 def _do_src_distances(con, vertno, run_inds, limit):
-    """Compute source space distances in chunks."""
+    """Compute source space distances in chunks.
+
+    Returns the number of stored distances per source, their column indices
+    into vertno and their (float32) values, i.e., sparse rows, along with
+    the nearest-source information.
+    """
     func = partial(dijkstra, limit=limit)
     chunk_size = 20  # save memory by chunking (only a little slower)
     lims = np.r_[np.arange(0, len(run_inds), chunk_size), len(run_inds)]
     n_chunks = len(lims) - 1
-    # eventually we want this in float32, so save memory by only storing 32-bit
-    d = np.empty((len(run_inds), len(vertno)), np.float32)
+    counts, cols, data = list(), list(), list()
     min_dist = np.empty((n_chunks, con.shape[0]))
     min_idx = np.empty((n_chunks, con.shape[0]), np.int32)
     range_idx = np.arange(con.shape[0])
     for li, (l1, l2) in enumerate(zip(lims[:-1], lims[1:])):
         idx = vertno[run_inds[l1:l2]]
+        # dijkstra stops expanding past the limit, and gives np.inf for
+        # uncalculated distances
         out = func(con, indices=idx)
         midx = np.argmin(out, axis=0)
         min_idx[li] = idx[midx]
         min_dist[li] = out[midx, range_idx]
-        d[l1:l2] = out[:, vertno]
+        out = out[:, vertno]
+        mask = (out > 0) & (out < np.inf)
+        counts.append(mask.sum(axis=1))
+        cols.append(np.nonzero(mask)[1])
+        data.append(out[mask].astype(np.float32))
     midx = np.argmin(min_dist, axis=0)
     min_dist = min_dist[midx, range_idx]
     min_idx = min_idx[midx, range_idx]
-    d[d == np.inf] = 0  # scipy will give us np.inf for uncalc. distances
-    return d, min_idx, min_dist
+    counts, cols, data = (
+        np.concatenate(x) if len(x) else np.zeros(0, dtype)
+        for x, dtype in ((counts, np.int64), (cols, np.int64), (data, np.float32))
+    )
+    return counts, cols, data, min_idx, min_dist
 
 
 # XXX this should probably be removed because it returns surface Labels,
@@ -12,6 +12,7 @@ from numpy.testing import (
     assert_array_less,
     assert_equal,
 )
+from scipy.sparse.csgraph import dijkstra
 
 import mne
 from mne import (
@@ -41,7 +42,12 @@ from mne.source_space import (
     get_decimated_surfaces,
 )
 from mne.source_space._source_space import _compare_source_spaces
-from mne.surface import _accumulate_normals, _triangle_neighbors
+from mne.surface import (
+    _accumulate_normals,
+    _get_ico_surface,
+    _triangle_neighbors,
+    mesh_dist,
+)
 from mne.utils import _record_warnings, copytree_rw, requires_mne, run_subprocess
 
 data_path = testing.data_path(download=False)
@@ -227,6 +233,49 @@ def test_add_source_space_distances_limited(tmp_path):
         assert_allclose(np.zeros_like(d.data), d.data, rtol=0, atol=1e-6)
 
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+@pytest.mark.parametrize("dist_limit", [0.02, np.inf])
+def test_add_source_space_distances_sparse(dist_limit, n_jobs):
+    """Test that the sparse distance rows match a dense computation."""
+    src = list()
+    for hemi_id in (FIFF.FIFFV_MNE_SURF_LEFT_HEMI, FIFF.FIFFV_MNE_SURF_RIGHT_HEMI):
+        surf = _get_ico_surface(3)
+        vertno = np.arange(0, len(surf["rr"]), 3)
+        src.append(
+            dict(
+                type="surf",
+                id=hemi_id,
+                rr=surf["rr"] * 0.08,
+                nn=surf["rr"].copy(),
+                tris=surf["tris"],
+                ntri=len(surf["tris"]),
+                np=len(surf["rr"]),
+                vertno=vertno,
+                nuse=len(vertno),
+                inuse=np.isin(np.arange(len(surf["rr"])), vertno).astype(int),
+                coord_frame=FIFF.FIFFV_COORD_MRI,
+                nearest=None,
+                nearest_dist=None,
+                pinfo=None,
+                patch_inds=None,
+            )
+        )
+    src = add_source_space_distances(
+        mne.SourceSpaces(src), dist_limit=dist_limit, n_jobs=n_jobs
+    )
+    for s in src:
+        vertno = s["vertno"]
+        want = dijkstra(mesh_dist(s["tris"], s["rr"]), indices=vertno)
+        want[want > dist_limit] = 0
+        dist = s["dist"]
+        assert dist.dtype == np.float32
+        assert dist.has_canonical_format
+        assert dist.nnz == np.count_nonzero(want[:, vertno])
+        assert_allclose(dist[vertno][:, vertno].toarray(), want[:, vertno], atol=1e-7)
+        # patch information needs all vertices to be reached
+        assert (s["pinfo"] is None) == (dist_limit < np.inf)
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_add_source_space_distances(tmp_path):
@@ -1,4 +1,5 @@
 __all__ = [
+    "RMANOVADesign",
     "_ci",
     "_parametric_ci",
     "_st_mask_from_s_inds",
@@ -10,6 +11,7 @@ __all__ = [
     "f_oneway",
     "f_threshold_mway_rm",
     "fdr_correction",
+    "holm_correction",
     "linear_regression",
     "linear_regression_raw",
     "permutation_cluster_1samp_test",
@@ -31,8 +33,9 @@ from .cluster_level import (
     spatio_temporal_cluster_test,
     summarize_clusters_stc,
 )
-from .multi_comp import bonferroni_correction, fdr_correction
+from .multi_comp import bonferroni_correction, fdr_correction, holm_correction
 from .parametric import (
+    RMANOVADesign,
     _parametric_ci,
     f_mway_rm,
     f_oneway,
@@ -82,37 +82,21 @@ def combine_adjacency(*structure):
         structure[di] = dim
     # list of coo
     assert all(isinstance(dim, sparse.coo_array) for dim in structure)
-    shape = np.array([d.shape[0] for d in structure], int)
-    n_others = np.array(
-        [
-            np.prod(np.concatenate([shape[:di], shape[di + 1 :]]))
-            for di in range(len(structure))
-        ],
-        int,
-    )
-    n_each = np.array([dim.data.size for dim in structure], int) * n_others
-    n_off = n_each.sum()  # off-diagonal terms
-    n_diag = np.prod(shape)
-    vertices = np.arange(n_diag).reshape(shape)
-    edges = np.empty((2, n_off + n_diag), int)
-    used = np.zeros(n_off, bool)
-    weights = np.empty(n_off + n_diag, float)  # even though just 0/1
-    offset = 0
+    shape = [d.shape[0] for d in structure]
+    n_vertices = int(np.prod(shape))
+    idx_dtype = np.int32 if n_vertices <= np.iinfo(np.int32).max else np.int64
+    # Each dimension contributes I(before) ⊗ A ⊗ I(after) (with C-order
+    # flattening), and the diagonal is handled separately at the end to avoid
+    # duplicate entries
+    blocks = list()
     for di, dim in enumerate(structure):
-        s_l = [slice(None)] * len(shape)
-        s_r = [slice(None)] * len(shape)
-        s_l[di] = dim.row
-        s_r[di] = dim.col
-        assert dim.row.shape == dim.col.shape == dim.data.shape
-        sl = slice(offset, offset + n_each[di])
-        edges[:, sl] = [vertices[tuple(s_l)].ravel(), vertices[tuple(s_r)].ravel()]
-        weights[sl] = np.tile(dim.data, n_others[di])
-        offset += n_each[di]
-        assert not used[sl].any()
-        used[sl] = True
-    assert used.all()
-    # Handle the diagonal separately at the end to avoid duplicate entries
-    edges[:, n_off:] = vertices.ravel()
-    weights[n_off:] = 1.0
-    graph = sparse.coo_array((weights, edges), (vertices.size, vertices.size))
+        before = sparse.eye_array(int(np.prod(shape[:di])))
+        after = sparse.eye_array(int(np.prod(shape[di + 1 :])))
+        block = sparse.kron(sparse.kron(before, dim, format="coo"), after, "coo")
+        blocks.append(block)
+    blocks.append(sparse.eye_array(n_vertices, format="coo"))
+    row = np.concatenate([block.row for block in blocks]).astype(idx_dtype)
+    col = np.concatenate([block.col for block in blocks]).astype(idx_dtype)
+    weights = np.concatenate([block.data for block in blocks])  # even though 0/1
+    graph = sparse.coo_array((weights, (row, col)), (n_vertices, n_vertices))
     return graph
@@ -4,14 +4,38 @@
 
 import numpy as np
 
+from ..utils import _check_option
 
-def _ecdf(x):
-    """No frills empirical cdf used in fdrcorrection."""
-    nobs = len(x)
-    return np.arange(1, nobs + 1) / float(nobs)
 
+def _prepare_pvals(pvals, copy):
+    """Get a flat float64 view of the p-values and the invalid entries.
 
-def fdr_correction(pvals, alpha=0.05, method="indep"):
+    Masked and NaN entries are invalid: they are set to NaN in the flat view,
+    so that they sort last and never count as tests.
+    """
+    mask = np.ma.getmaskarray(pvals) if np.ma.isMaskedArray(pvals) else None
+    data = np.ma.getdata(pvals)
+    pvals = np.array(data, np.float64) if copy else np.asarray(data, np.float64)
+    flat = pvals.reshape(-1)  # a view unless the input is not contiguous
+    invalid = np.isnan(flat)
+    if mask is not None:
+        invalid |= mask.reshape(-1)
+        flat[invalid] = np.nan
+    n_tests = flat.size - np.count_nonzero(invalid)
+    return flat, n_tests, mask
+
+
+def _finish_pvals(flat, alpha, shape, mask):
+    """Reshape the corrected p-values and compute the rejections."""
+    with np.errstate(invalid="ignore"):
+        reject = (flat < alpha).reshape(shape)
+    pvals_corrected = flat.reshape(shape)
+    if mask is not None:
+        pvals_corrected = np.ma.MaskedArray(pvals_corrected, mask)
+    return reject, pvals_corrected
+
+
+def fdr_correction(pvals, alpha=0.05, method="indep", *, copy=True):
     """P-value correction with False Discovery Rate (FDR).
 
     Correction for multiple comparison using FDR :footcite:`GenoveseEtAl2002`.
@@ -22,12 +46,20 @@ def fdr_correction(pvals, alpha=0.05, method="indep"):
     Parameters
     ----------
     pvals : array_like
-        Set of p-values of the individual tests.
+        Set of p-values of the individual tests. Can have any shape. NaN
+        values and masked entries (for :class:`numpy.ma.MaskedArray` input)
+        are not counted as tests and are never rejected.
     alpha : float
         Error rate.
     method : 'indep' | 'negcorr'
         If 'indep' it implements Benjamini/Hochberg for independent or if
         'negcorr' it corresponds to Benjamini/Yekutieli.
+    copy : bool
+        If False and ``pvals`` is a contiguous float64 array, it is overwritten
+        with the corrected p-values instead of allocating a new array, which
+        reduces the memory needed for very large p-value maps.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
@@ -35,62 +67,115 @@ def fdr_correction(pvals, alpha=0.05, method="indep"):
         True if a hypothesis is rejected, False if not.
     pval_corrected : array
         P-values adjusted for multiple hypothesis testing to limit FDR.
+        Entries that were NaN or masked in the input are NaN (or masked).
+
+    See Also
+    --------
+    bonferroni_correction
+    holm_correction
 
     References
     ----------
     .. footbibliography::
     """
-    pvals = np.asarray(pvals)
-    shape_init = pvals.shape
-    pvals = pvals.ravel()
-
-    pvals_sortind = np.argsort(pvals)
-    pvals_sorted = pvals[pvals_sortind]
-    sortrevind = pvals_sortind.argsort()
-
-    if method in ["i", "indep", "p", "poscorr"]:
-        ecdffactor = _ecdf(pvals_sorted)
-    elif method in ["n", "negcorr"]:
-        cm = np.sum(1.0 / np.arange(1, len(pvals_sorted) + 1))
-        ecdffactor = _ecdf(pvals_sorted) / cm
-    else:
-        raise ValueError("Method should be 'indep' and 'negcorr'")
-
-    reject = pvals_sorted < (ecdffactor * alpha)
-    if reject.any():
-        rejectmax = max(np.nonzero(reject)[0])
-    else:
-        rejectmax = 0
-    reject[:rejectmax] = True
-
-    pvals_corrected_raw = pvals_sorted / ecdffactor
-    pvals_corrected = np.minimum.accumulate(pvals_corrected_raw[::-1])[::-1]
-    pvals_corrected[pvals_corrected > 1.0] = 1.0
-    pvals_corrected = pvals_corrected[sortrevind].reshape(shape_init)
-    reject = reject[sortrevind].reshape(shape_init)
-    return reject, pvals_corrected
-
-
-def bonferroni_correction(pval, alpha=0.05):
+    _check_option("method", method, ["i", "indep", "p", "poscorr", "n", "negcorr"])
+    shape = np.shape(pvals)
+    flat, n_tests, mask = _prepare_pvals(pvals, copy)
+    # NaNs sort last, so the first n_tests entries are the valid ones
+    order = np.argsort(flat)[:n_tests]
+    pvals_sorted = flat[order]
+    # pvals_sorted / ecdf, computed in place
+    factor = np.arange(1, n_tests + 1, dtype=np.float64)
+    scale = float(n_tests)
+    if method in ["n", "negcorr"]:
+        scale *= np.sum(1.0 / factor)
+    np.divide(scale, factor, out=factor)
+    pvals_sorted *= factor
+    del factor
+    reverse = pvals_sorted[::-1]
+    np.minimum.accumulate(reverse, out=reverse)
+    np.minimum(pvals_sorted, 1.0, out=pvals_sorted)
+    flat[order] = pvals_sorted
+    return _finish_pvals(flat, alpha, shape, mask)
+
+
+def bonferroni_correction(pval, alpha=0.05, *, copy=True):
     """P-value correction with Bonferroni method.
 
     Parameters
     ----------
     pval : array_like
-        Set of p-values of the individual tests.
+        Set of p-values of the individual tests. Can have any shape. NaN
+        values and masked entries (for :class:`numpy.ma.MaskedArray` input)
+        are not counted as tests and are never rejected.
     alpha : float
         Error rate.
+    copy : bool
+        If False and ``pval`` is a contiguous float64 array, it is overwritten
+        with the corrected p-values.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
     reject : array, bool
         True if a hypothesis is rejected, False if not.
     pval_corrected : array
-        P-values adjusted for multiple hypothesis testing to limit FDR.
+        P-values adjusted for multiple hypothesis testing to limit FWER.
+
+    See Also
+    --------
+    fdr_correction
+    holm_correction
     """
-    pval = np.asarray(pval)
-    pval_corrected = pval * float(pval.size)
+    shape = np.shape(pval)
+    flat, n_tests, mask = _prepare_pvals(pval, copy)
+    flat *= float(n_tests)
     # p-values must not be larger than 1.
-    pval_corrected = pval_corrected.clip(max=1.0)
-    reject = pval_corrected < alpha
-    return reject, pval_corrected
+    np.minimum(flat, 1.0, out=flat)
+    return _finish_pvals(flat, alpha, shape, mask)
+
+
+def holm_correction(pval, alpha=0.05, *, copy=True):
+    """P-value correction with the Holm-Bonferroni step-down method.
+
+    This controls the family-wise error rate like
+    :func:`bonferroni_correction`, but is uniformly more powerful.
+
+    Parameters
+    ----------
+    pval : array_like
+        Set of p-values of the individual tests. Can have any shape. NaN
+        values and masked entries (for :class:`numpy.ma.MaskedArray` input)
+        are not counted as tests and are never rejected.
+    alpha : float
+        Error rate.
+    copy : bool
+        If False and ``pval`` is a contiguous float64 array, it is overwritten
+        with the corrected p-values.
+
+    Returns
+    -------
+    reject : array, bool
+        True if a hypothesis is rejected, False if not.
+    pval_corrected : array
+        P-values adjusted for multiple hypothesis testing to limit FWER.
+
+    See Also
+    --------
+    bonferroni_correction
+    fdr_correction
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+    shape = np.shape(pval)
+    flat, n_tests, mask = _prepare_pvals(pval, copy)
+    order = np.argsort(flat)[:n_tests]
+    pvals_sorted = flat[order]
+    pvals_sorted *= np.arange(n_tests, 0, -1, dtype=np.float64)
+    np.maximum.accumulate(pvals_sorted, out=pvals_sorted)
+    np.minimum(pvals_sorted, 1.0, out=pvals_sorted)
+    flat[order] = pvals_sorted
+    return _finish_pvals(flat, alpha, shape, mask)
@@ -330,6 +330,160 @@ def f_threshold_mway_rm(n_subjects, factor_levels, effects="A*B", pvalue=0.05):
     return F_threshold if len(F_threshold) > 1 else F_threshold[0]
 
 
+class RMANOVADesign:
+    """Precompiled design for M-way repeated measures ANOVA.
+
+    The contrast matrices, degrees of freedom and effect names of a fully
+    balanced repeated measures design are computed once at construction, so
+    that the F-statistics for all requested effects can be evaluated in a
+    single batched tensor contraction. This is useful when the same design is
+    evaluated many times, e.g. as ``stat_fun`` in
+    :func:`mne.stats.permutation_cluster_test`.
+
+    Parameters
+    ----------
+    n_subjects : int
+        The number of subjects (replications).
+    factor_levels : list-like
+        The number of levels per factor.
+    effects : str | list
+        The effects to compute. See :func:`mne.stats.f_mway_rm`.
+    correction : bool
+        If True, use Greenhouse-Geisser sphericity correction for the degrees
+        of freedom of the p-values.
+    return_pvals : bool
+        If True, calling the design returns a tuple of F-values and p-values,
+        otherwise only the F-values are returned (the ``stat_fun`` contract).
+
+    Attributes
+    ----------
+    effects : list of str
+        The names of the computed effects.
+    df1 : ndarray, shape (n_effects,)
+        The (uncorrected) numerator degrees of freedom of each effect.
+    df2 : ndarray, shape (n_effects,)
+        The (uncorrected) denominator degrees of freedom of each effect.
+
+    See Also
+    --------
+    f_mway_rm
+    f_threshold_mway_rm
+
+    Notes
+    -----
+    .. versionadded:: 1.13
+    """
+
+    def __init__(
+        self,
+        n_subjects,
+        factor_levels,
+        effects="all",
+        correction=False,
+        return_pvals=False,
+    ):
+        self.n_subjects = int(n_subjects)
+        self.factor_levels = [int(n_levels) for n_levels in factor_levels]
+        self.n_conditions = int(np.prod(self.factor_levels))
+        self.correction = bool(correction)
+        self.return_pvals = bool(return_pvals)
+        effect_picks, self.effects = _map_effects(len(self.factor_levels), effects)
+        contrasts, df1, df2 = list(), list(), list()
+        for c_, this_df1, this_df2 in _iter_contrasts(
+            self.n_subjects, self.factor_levels, effect_picks
+        ):
+            contrasts.append(c_)
+            df1.append(this_df1)
+            df2.append(this_df2)
+        self.df1 = np.array(df1, float)
+        self.df2 = np.array(df2, float)
+        # all contrasts stacked column-wise so that a single matrix product
+        # projects the data onto every effect at once
+        self._contrast = np.concatenate(contrasts, axis=1)
+        self._bounds = np.cumsum([0] + [c_.shape[1] for c_ in contrasts])
+
+    def __repr__(self):  # noqa: D105
+        return (
+            f"<RMANOVADesign | {self.n_subjects} subjects, "
+            f"levels={self.factor_levels}, effects={self.effects}>"
+        )
+
+    def __call__(self, *args):
+        """Compute the F-statistics.
+
+        Parameters
+        ----------
+        *args : ndarray
+            Either a single array of shape ``(n_subjects, n_conditions[,
+            n_obs])`` laid out as for :func:`mne.stats.f_mway_rm`, a single
+            array of shape ``(n_perms, n_subjects, n_conditions, n_obs)``
+            containing a block of (e.g., permuted) data sets, or one array of
+            shape ``(n_subjects, n_obs)`` per condition as passed to
+            ``stat_fun`` by the cluster permutation functions.
+
+        Returns
+        -------
+        F_vals : ndarray, shape ([n_perms,] [n_effects,] n_obs)
+            The F-values. The effects axis is omitted for single-effect
+            designs.
+        p_vals : ndarray, shape ([n_perms,] [n_effects,] n_obs)
+            The p-values, only returned if ``return_pvals=True``.
+        """
+        if len(args) == 1:
+            data = np.asarray(args[0])
+            if data.ndim == 2:
+                data = data[:, :, np.newaxis]
+            if data.ndim not in (3, 4):
+                raise ValueError(
+                    "data must be 2D, 3D or 4D when passed as a single array, "
+                    f"got {data.ndim} dimensions"
+                )
+        else:
+            data = np.stack(args, axis=1)
+        fvals, pvals = self._compute(data, self.return_pvals)
+        if len(self.effects) == 1:
+            fvals, pvals = fvals[..., 0, :], pvals[..., 0, :]
+        return (fvals, pvals) if self.return_pvals else fvals
+
+    def _compute(self, data, return_pvals):
+        """Compute F and p for data of shape (..., n_subj, n_cond, n_obs)."""
+        if data.shape[-3:-1] != (self.n_subjects, self.n_conditions):
+            raise ValueError(
+                f"Data must have {self.n_subjects} subjects and "
+                f"{self.n_conditions} conditions, got shape {data.shape}"
+            )
+        n_subjects = self.n_subjects
+        starts = self._bounds[:-1]
+        # (..., n_obs, n_subjects, n_columns), one matmul for all effects
+        y = np.matmul(np.moveaxis(data, -1, -3), self._contrast)
+        ss = n_subjects * np.add.reduceat(y.mean(axis=-2) ** 2, starts, axis=-1)
+        total = np.add.reduceat(np.einsum("...sk,...sk->...k", y, y), starts, axis=-1)
+        # (..., n_obs, n_effects) -> (..., n_effects, n_obs)
+        ss, total = np.swapaxes(ss, -1, -2), np.swapaxes(total, -1, -2)
+        df_ratio = (self.df2 / self.df1)[:, np.newaxis]
+        fvals = ss / ((total - ss) / df_ratio)
+        if not return_pvals:
+            return fvals, np.empty(fvals.shape[:-1] + (0,))
+        df1 = np.broadcast_to(self.df1[:, np.newaxis], fvals.shape)
+        df2 = np.broadcast_to(self.df2[:, np.newaxis], fvals.shape)
+        if self.correction:
+            # sample covariances, leave off "/ (y.shape[1] - 1)" norm because
+            # it falls out. trace(y.T @ y) is the total sum of squares.
+            eps = np.empty(fvals.shape)
+            for ei, (start, stop) in enumerate(zip(starts, self._bounds[1:])):
+                y_ = y[..., start:stop]
+                v = np.matmul(np.swapaxes(y_, -1, -2), y_)
+                eps[..., ei, :] = total[..., ei, :] ** 2 / (
+                    self.df1[ei] * np.sum(v * v, axis=(-2, -1))
+                )
+            # numerical imprecision can cause eps=0.99999999999999989
+            # even with a single category, so never let our degrees of
+            # freedom drop below 1.
+            df1, df2 = (np.maximum(d * eps, 1.0) for d in (df1, df2))
+        pvals = stats.f(df1, df2).sf(fvals)
+        return fvals, pvals
+
+
 def f_mway_rm(data, factor_levels, effects="all", correction=False, return_pvals=True):
     """Compute M-way repeated measures ANOVA for fully balanced designs.
 
@@ -381,9 +535,14 @@ def f_mway_rm(data, factor_levels, effects="all", correction=False, return_pvals
     --------
     f_oneway
     f_threshold_mway_rm
+    RMANOVADesign
 
     Notes
     -----
+    When the same design is evaluated repeatedly (e.g., in a permutation
+    test), use :class:`mne.stats.RMANOVADesign` to avoid recomputing the
+    contrasts on every call.
+
     .. versionadded:: 0.10
     """
     out_reshape = (-1,)
@@ -393,41 +552,10 @@ def f_mway_rm(data, factor_levels, effects="all", correction=False, return_pvals
         out_reshape = data.shape[2:]
         data = data.reshape(data.shape[0], data.shape[1], np.prod(data.shape[2:]))
 
-    effect_picks, _ = _map_effects(len(factor_levels), effects)
-    n_obs = data.shape[2]
-    n_replications = data.shape[0]
-
-    # put last axis in front to 'iterate' over mass univariate instances.
-    data = np.rollaxis(data, 2)
-    fvalues, pvalues = [], []
-    for c_, df1, df2 in _iter_contrasts(n_replications, factor_levels, effect_picks):
-        y = np.dot(data, c_)
-        b = np.mean(y, axis=1)[:, np.newaxis, :]
-        ss = np.sum(np.sum(y * b, axis=2), axis=1)
-        mse = (np.sum(np.sum(y * y, axis=2), axis=1) - ss) / (df2 / df1)
-        fvals = ss / mse
-        fvalues.append(fvals)
-        if correction:
-            # sample covariances, leave off "/ (y.shape[1] - 1)" norm because
-            # it falls out.
-            v = np.array([np.dot(y_.T, y_) for y_ in y])
-            v = np.array([np.trace(vv) for vv in v]) ** 2 / (
-                df1 * np.sum(np.sum(v * v, axis=2), axis=1)
-            )
-            eps = v
-
-        df1, df2 = np.zeros(n_obs) + df1, np.zeros(n_obs) + df2
-        if correction:
-            # numerical imprecision can cause eps=0.99999999999999989
-            # even with a single category, so never let our degrees of
-            # freedom drop below 1.
-            df1, df2 = (np.maximum(d[None, :] * eps, 1.0) for d in (df1, df2))
-
-        if return_pvals:
-            pvals = stats.f(df1, df2).sf(fvals)
-        else:
-            pvals = np.empty(0)
-        pvalues.append(pvals)
+    design = RMANOVADesign(data.shape[0], factor_levels, effects, correction)
+    fvalues, pvalues = design._compute(data, return_pvals)
+    if not return_pvals:
+        pvalues = [np.empty(0)] * len(fvalues)
 
     # handle single effect returns
     return [
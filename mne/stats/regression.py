@@ -14,8 +14,11 @@ from ..evoked import Evoked, EvokedArray
 from ..source_estimate import SourceEstimate
 from ..utils import _reject_data_segments, fill_doc, logger, warn
 
+# number of data elements (n_observations * n_features) processed at once
+_LM_BLOCK_ELEMENTS = 2**22
 
-def linear_regression(inst, design_matrix, names=None):
+
+def linear_regression(inst, design_matrix, names=None, *, return_pvals=True):
     """Fit Ordinary Least Squares (OLS) regression.
 
     Parameters
@@ -34,6 +37,12 @@ def linear_regression(inst, design_matrix, names=None):
         of columns present in design matrix (including the intercept, if
         present). Otherwise, the default names are ``'x0'``, ``'x1'``,
         ``'x2', …, 'x(n-1)'`` for ``n`` regressors.
+    return_pvals : bool
+        If False, the p-values (and their -log₁₀ transform) are not computed,
+        which saves time and memory when only the coefficients or t values are
+        needed. The corresponding entries of the results are then None.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
@@ -85,12 +94,14 @@ def linear_regression(inst, design_matrix, names=None):
     else:
         raise ValueError("Input must be epochs or iterable of source estimates")
     logger.info(msg + f", ({np.prod(data.shape[1:])} targets, {len(names)} regressors)")
-    lm_params = _fit_lm(data, design_matrix, names)
+    lm_params = _fit_lm(data, design_matrix, names, return_pvals=return_pvals)
     lm = namedtuple("lm", "beta stderr t_val p_val mlog10_p_val")
     lm_fits = {}
     for name in names:
-        parameters = [p[name] for p in lm_params]
+        parameters = [p[name] if p is not None else None for p in lm_params]
         for ii, value in enumerate(parameters):
+            if value is None:
+                continue
             out_ = out.copy()
             if not isinstance(out_, SourceEstimate | Evoked):
                 raise RuntimeError("Invalid container.")
@@ -101,7 +112,7 @@ def linear_regression(inst, design_matrix, names=None):
     return lm_fits
 
 
-def _fit_lm(data, design_matrix, names):
+def _fit_lm(data, design_matrix, names, return_pvals=True):
     """Aux function."""
     n_samples = len(data)
     n_features = np.prod(data.shape[1:])
@@ -120,38 +131,48 @@ def _fit_lm(data, design_matrix, names):
         )
 
     y = np.reshape(data, (n_samples, n_features))
-    betas, resid_sum_squares, _, _ = linalg.lstsq(a=design_matrix, b=y)
-
+    # the pseudo-inverse is shared by all features, which are then processed
+    # in blocks to keep the temporaries small
+    design_pinv = linalg.pinv(design_matrix)
     df = n_rows - n_predictors
-    sqrt_noise_var = np.sqrt(resid_sum_squares / df).reshape(data.shape[1:])
     design_invcov = linalg.inv(np.dot(design_matrix.T, design_matrix))
-    unscaled_stderrs = np.sqrt(np.diag(design_invcov))
+    unscaled_stderrs = np.sqrt(np.diag(design_invcov))[:, np.newaxis]
     tiny = np.finfo(np.float64).tiny
-    beta, stderr, t_val, p_val, mlog10_p_val = (dict() for _ in range(5))
-    for x, unscaled_stderr, predictor in zip(betas, unscaled_stderrs, names):
-        beta[predictor] = x.reshape(data.shape[1:])
-        stderr[predictor] = sqrt_noise_var * unscaled_stderr
-        p_val[predictor] = np.empty_like(stderr[predictor])
-        t_val[predictor] = np.empty_like(stderr[predictor])
-
-        stderr_pos = stderr[predictor] > 0
-        beta_pos = beta[predictor] > 0
-        t_val[predictor][stderr_pos] = (
-            beta[predictor][stderr_pos] / stderr[predictor][stderr_pos]
-        )
-        cdf = stats.t.cdf(np.abs(t_val[predictor][stderr_pos]), df)
-        p_val[predictor][stderr_pos] = np.clip((1.0 - cdf) * 2.0, tiny, 1.0)
-        # degenerate cases
-        mask = ~stderr_pos & beta_pos
-        t_val[predictor][mask] = np.inf * np.sign(beta[predictor][mask])
-        p_val[predictor][mask] = tiny
-        # could do NaN here, but hopefully this is safe enough
-        mask = ~stderr_pos & ~beta_pos
-        t_val[predictor][mask] = 0
-        p_val[predictor][mask] = 1.0
-        mlog10_p_val[predictor] = -np.log10(p_val[predictor])
 
-    return beta, stderr, t_val, p_val, mlog10_p_val
+    n_out = 5 if return_pvals else 3
+    out = np.empty((n_out, n_predictors, n_features))
+    betas, stderrs, t_vals = out[:3]
+    block = max(_LM_BLOCK_ELEMENTS // max(n_samples, 1), 1)
+    for start in range(0, n_features, block):
+        sl = slice(start, start + block)
+        y_block = y[:, sl]
+        beta = betas[:, sl]
+        beta[:] = np.dot(design_pinv, y_block)
+        resid = y_block - np.dot(design_matrix, beta)
+        sqrt_noise_var = np.sqrt(np.einsum("ij,ij->j", resid, resid) / df)
+        stderr = np.multiply(sqrt_noise_var, unscaled_stderrs, out=stderrs[:, sl])
+        stderr_pos = stderr > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_val = np.divide(beta, stderr, out=t_vals[:, sl])
+        # degenerate cases (could do NaN here, but hopefully this is safe enough)
+        beta_pos = beta > 0
+        t_val[~stderr_pos & beta_pos] = np.inf
+        t_val[~stderr_pos & ~beta_pos] = 0
+        if return_pvals:
+            p_val = out[3, :, sl]
+            cdf = stats.t.cdf(np.abs(t_val), df)
+            np.clip((1.0 - cdf) * 2.0, tiny, 1.0, out=p_val)
+            p_val[~stderr_pos & beta_pos] = tiny
+            p_val[~stderr_pos & ~beta_pos] = 1.0
+            np.negative(np.log10(p_val), out=out[4, :, sl])
+
+    shape = data.shape[1:]
+    params = [
+        {name: x.reshape(shape) for x, name in zip(param, names)} for param in out
+    ]
+    if not return_pvals:
+        params += [None, None]
+    return tuple(params)
 
 
 @fill_doc
@@ -168,6 +189,7 @@ def linear_regression_raw(
     decim=1,
     picks=None,
     solver="cholesky",
+    chunk_duration=None,
 ):
     """Estimate regression-based evoked potentials/fields by linear modeling.
 
@@ -245,6 +267,19 @@ def linear_regression_raw(
         y is of shape (n_channels, n_times).
         If str, must be ``'cholesky'``, in which case the solver used is
         ``linalg.solve(dot(X.T, X), dot(X.T, y))``.
+    chunk_duration : float | None
+        If float, the data are read from ``raw`` in consecutive chunks of
+        (approximately) this duration in seconds, and the normal equations
+        ``X.T @ X`` and ``X.T @ y`` are accumulated chunk by chunk using sparse
+        products. This gives the same result as ``solver='cholesky'`` without
+        ever holding the full data (or a dense copy of any part of the
+        predictor matrix) in memory, and also works for data that are not
+        preloaded. When ``reject`` is used,
+        the chunk length is rounded up to a multiple of ``tstep``. Can only be
+        used with ``solver='cholesky'``. If None (default), all data are
+        loaded and solved at once.
+
+        .. versionadded:: 1.13
 
     Returns
     -------
@@ -257,6 +292,15 @@ def linear_regression_raw(
     ----------
     .. footbibliography::
     """
+    if chunk_duration is not None:
+        if not isinstance(solver, str):
+            raise ValueError(
+                "chunk_duration can only be used with solver='cholesky', got a callable"
+            )
+        chunk_duration = float(chunk_duration)
+        if chunk_duration <= 0:
+            raise ValueError(f"chunk_duration must be positive, got {chunk_duration}")
+
     if isinstance(solver, str):
         if solver not in {"cholesky"}:
             raise ValueError(f"No such solver: {solver}")
@@ -274,14 +318,15 @@ def linear_regression_raw(
         raise TypeError("The solver must be a str or a callable.")
 
     # build data
-    data, info, events = _prepare_rerp_data(raw, events, picks=picks, decim=decim)
+    picks, info, events = _prepare_rerp_info(raw, events, picks=picks, decim=decim)
+    n_samples = len(range(0, raw.n_times, int(decim)))
 
     if event_id is None:
         event_id = {str(v): v for v in set(events[:, 2])}
 
     # build predictors
     X, conds, cond_length, tmin_s, tmax_s = _prepare_rerp_preds(
-        n_samples=data.shape[1],
+        n_samples=n_samples,
         sfreq=info["sfreq"],
         events=events,
         event_id=event_id,
@@ -290,17 +335,24 @@ def linear_regression_raw(
         covariates=covariates,
     )
 
-    # remove "empty" and contaminated data points
-    X, data = _clean_rerp_input(X, data, reject, flat, decim, info, tstep)
+    if chunk_duration is None:
+        data = raw[:][0][picks, :: int(decim)]
 
-    # solve linear system
-    coefs = solver(X, data.T)
-    if coefs.shape[0] != data.shape[0]:
-        raise ValueError(
-            f"solver output has unexcepted shape {coefs.shape}. Supply a "
-            "function that returns coefficients in the form "
-            "(n_targets, n_features), where "
-            f"n_targets == n_channels == {data.shape[0]}."
+        # remove "empty" and contaminated data points
+        X, data = _clean_rerp_input(X, data, reject, flat, decim, info, tstep)
+
+        # solve linear system
+        coefs = solver(X, data.T)
+        if coefs.shape[0] != data.shape[0]:
+            raise ValueError(
+                f"solver output has unexcepted shape {coefs.shape}. Supply a "
+                "function that returns coefficients in the form "
+                "(n_targets, n_features), where "
+                f"n_targets == n_channels == {data.shape[0]}."
+            )
+    else:
+        coefs = _solve_rerp_chunked(
+            raw, picks, decim, X, reject, flat, info, tstep, chunk_duration
         )
 
     # construct Evoked objects to be returned from output
@@ -309,15 +361,13 @@ def linear_regression_raw(
     return evokeds
 
 
-def _prepare_rerp_data(raw, events, picks=None, decim=1):
-    """Prepare events and data, primarily for `linear_regression_raw`."""
+def _prepare_rerp_info(raw, events, picks=None, decim=1):
+    """Prepare picks, info and events without loading any data."""
     picks = _picks_to_idx(raw.info, picks)
     info = pick_info(raw.info, picks)
     decim = int(decim)
     with info._unlock():
         info["sfreq"] /= decim
-    data, times = raw[:]
-    data = data[picks, ::decim]
     if len(set(events[:, 0])) < len(events[:, 0]):
         raise ValueError(
             "`events` contains duplicate time points. Make "
@@ -337,7 +387,7 @@ def _prepare_rerp_data(raw, events, picks=None, decim=1):
             "different decimation factor."
         )
 
-    return data, info, events
+    return picks, info, events
 
 
 def _prepare_rerp_preds(
@@ -412,6 +462,54 @@ def _clean_rerp_input(X, data, reject, flat, decim, info, tstep):
     return X.tocsr()[has_val], data[:, has_val]
 
 
+def _solve_rerp_chunked(raw, picks, decim, X, reject, flat, info, tstep, duration):
+    """Solve the normal equations by accumulating them over chunks of raw."""
+    decim = int(decim)
+    n_samples = X.shape[0]
+    chunk = max(int(round(duration * info["sfreq"])), 1)
+    if reject is not None:
+        # align chunks with the rejection windows of the unchunked solver
+        step = int(np.ceil(tstep * info["sfreq"]))
+        chunk = int(np.ceil(chunk / step)) * step
+    X = X.tocsr()
+    XtX = sparse.csr_array((X.shape[1], X.shape[1]))
+    XtY = np.zeros((X.shape[1], len(picks)))
+    n_used = 0
+    logger.info(
+        f"Accumulating normal equations over {int(np.ceil(n_samples / chunk))} "
+        f"chunk(s) of {chunk} samples"
+    )
+    for start in range(0, n_samples, chunk):
+        stop = min(start + chunk, n_samples)
+        X_chunk = X[start:stop]
+        # find only those positions where at least one predictor isn't 0
+        has_val = np.unique(X_chunk.nonzero()[0])
+        if not len(has_val):
+            continue
+        data = raw[picks, start * decim : (stop - 1) * decim + 1][0][:, ::decim]
+        if reject is not None:
+            try:
+                _, inds = _reject_data_segments(
+                    data, reject, flat, decim=None, info=info, tstep=tstep
+                )
+            except RuntimeError:  # no clean segment in this chunk
+                continue
+            for t0, t1 in inds:
+                has_val = np.setdiff1d(has_val, range(t0, t1))
+        X_chunk = X_chunk[has_val]
+        XtX += X_chunk.T @ X_chunk
+        XtY += X_chunk.T @ data[:, has_val].T
+        n_used += len(has_val)
+    if n_used == 0:
+        raise RuntimeError(
+            "No clean segment found. Please consider updating your rejection "
+            "thresholds."
+        )
+    return linalg.solve(
+        XtX.toarray(), XtY, assume_a="pos", overwrite_a=True, overwrite_b=True
+    ).T
+
+
 def _make_evokeds(coefs, conds, cond_length, tmin_s, tmax_s, info):
     """Create a dictionary of Evoked objects.
 
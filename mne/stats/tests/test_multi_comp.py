@@ -7,7 +7,7 @@ import pytest
 from numpy.testing import assert_allclose, assert_almost_equal, assert_array_equal
 from scipy import stats
 
-from mne.stats import bonferroni_correction, fdr_correction
+from mne.stats import bonferroni_correction, fdr_correction, holm_correction
 
 
 def test_bonferroni_pval_clip():
@@ -54,3 +54,59 @@ def test_multi_pval_correction():
     thresh_fdr = np.min(np.abs(T)[reject_fdr])
     assert 0 <= (reject_fdr.sum() - 50) <= 50 * 1.05
     assert thresh_uncorrected <= thresh_fdr <= thresh_bonferroni
+
+
+def _naive_fdr(pvals, alpha, cm=1.0):
+    """Compute the Benjamini-Hochberg correction without any tricks."""
+    n = pvals.size
+    order = np.argsort(pvals)
+    adj = pvals[order] * n * cm / np.arange(1, n + 1)
+    adj = np.minimum(np.minimum.accumulate(adj[::-1])[::-1], 1.0)
+    out = np.empty(n)
+    out[order] = adj
+    return out
+
+
+@pytest.mark.parametrize("copy", [True, False])
+def test_multi_comp_nan_mask_copy(copy):
+    """Test NaN and masked handling and in-place operation."""
+    rng = np.random.RandomState(0)
+    pvals = rng.uniform(0, 0.1, (4, 5, 6)) ** 2
+    valid = rng.rand(*pvals.shape) > 0.2
+    cm = np.sum(1.0 / np.arange(1, valid.sum() + 1))
+    for func, kwargs, want in (
+        (fdr_correction, dict(), _naive_fdr(pvals[valid], 0.05)),
+        (fdr_correction, dict(method="negcorr"), _naive_fdr(pvals[valid], 0.05, cm)),
+        (bonferroni_correction, dict(), np.minimum(pvals[valid] * valid.sum(), 1)),
+    ):
+        # NaN input
+        pvals_nan = np.where(valid, pvals, np.nan)
+        reject, pval_corr = func(pvals_nan, copy=copy, **kwargs)
+        assert pval_corr.shape == pvals.shape
+        assert (np.shares_memory(pval_corr, pvals_nan)) is not copy
+        assert_allclose(pval_corr[valid], want)
+        assert np.isnan(pval_corr[~valid]).all()
+        assert not reject[~valid].any()
+        assert_array_equal(reject[valid], want < 0.05)
+        # masked input
+        pvals_ma = np.ma.MaskedArray(pvals.copy(), ~valid)
+        reject, pval_corr = func(pvals_ma, copy=copy, **kwargs)
+        assert isinstance(pval_corr, np.ma.MaskedArray)
+        assert_array_equal(pval_corr.mask, ~valid)
+        assert_allclose(pval_corr.compressed(), want)
+        assert not reject[~valid].any()
+
+
+def test_holm_correction():
+    """Test Holm-Bonferroni step-down correction."""
+    pvals = np.array([0.01, 0.04, 0.03, 0.005, np.nan])
+    reject, pval_corr = holm_correction(pvals, alpha=0.05)
+    # sorted: 0.005 * 4, 0.01 * 3, 0.03 * 2, 0.04 * 1 (then monotonized)
+    assert_allclose(pval_corr, [0.03, 0.06, 0.06, 0.02, np.nan])
+    assert_array_equal(reject, [True, False, False, True, False])
+    rng = np.random.RandomState(0)
+    pvals = rng.rand(100) ** 4
+    _, p_bonf = bonferroni_correction(pvals)
+    _, p_holm = holm_correction(pvals)
+    assert (p_holm <= p_bonf).all()
+    assert p_holm.min() == p_bonf.min()
@@ -225,3 +225,31 @@ def test_f_oneway_hat_input_validation():
 
     with pytest.raises(ValueError, match="method"):
         f_oneway(X1, X2, sigma=1e-3, method="invalid")
+
+
+@pytest.mark.parametrize("correction", [False, True])
+@pytest.mark.parametrize(
+    "factor_levels, effects", [([2, 3], "all"), ([2, 2, 2], "A*B"), ([4], "A")]
+)
+def test_rm_anova_design(factor_levels, effects, correction):
+    """Test the precompiled repeated measures ANOVA design."""
+    rng = np.random.RandomState(0)
+    n_subjects, n_obs, n_perms = 7, 11, 3
+    n_conditions = np.prod(factor_levels)
+    data = rng.randn(n_perms, n_subjects, n_conditions, n_obs)
+    design = mne.stats.RMANOVADesign(
+        n_subjects, factor_levels, effects, correction, return_pvals=True
+    )
+    assert "RMANOVADesign" in repr(design)
+    fvals, pvals = design(data)
+    assert fvals.shape == pvals.shape
+    for perm, fval, pval in zip(data, fvals, pvals):
+        want_f, want_p = f_mway_rm(perm, factor_levels, effects, correction)
+        assert_allclose(fval, want_f)
+        assert_allclose(pval, want_p)
+        # stat_fun-style call with one array per condition
+        assert_allclose(design(*np.swapaxes(perm, 0, 1))[0], want_f)
+    want = f_threshold_mway_rm(n_subjects, factor_levels, effects)
+    assert_allclose(scipy.stats.f.isf(0.05, design.df1, design.df2), want)
+    with pytest.raises(ValueError, match="subjects"):
+        design(data[:, 1:])
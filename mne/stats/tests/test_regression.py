@@ -4,6 +4,7 @@
 
 import numpy as np
 import pytest
+import scipy.stats
 from numpy.testing import assert_allclose, assert_array_equal, assert_equal
 from scipy.signal.windows import hann
 
@@ -76,6 +77,40 @@ def test_regression():
     linear_regression(epochs.copy().pick("eeg"), design_matrix)
 
 
+@pytest.mark.parametrize("block_elements", [7, 2**22])
+def test_regression_blocks(block_elements, monkeypatch):
+    """Test blocked OLS against a direct least-squares solution."""
+    import mne.stats.regression as regression
+
+    monkeypatch.setattr(regression, "_LM_BLOCK_ELEMENTS", block_elements)
+    rng = np.random.RandomState(0)
+    n_epochs, n_channels, n_times = 20, 4, 6
+    data = rng.randn(n_epochs, n_channels, n_times)
+    data[:, 0, 0] = 0.0  # degenerate feature
+    design_matrix = np.c_[np.ones(n_epochs), rng.randn(n_epochs, 2)]
+    epochs = mne.EpochsArray(data, mne.create_info(n_channels, 100.0, "eeg"))
+    lm = linear_regression(epochs, design_matrix)
+    y = data.reshape(n_epochs, -1)
+    betas, resid, _, _ = np.linalg.lstsq(design_matrix, y, rcond=None)
+    df = n_epochs - design_matrix.shape[1]
+    invcov = np.linalg.inv(design_matrix.T @ design_matrix)
+    stderrs = np.sqrt(np.outer(np.diag(invcov), resid / df))
+    for ii, name in enumerate(["x0", "x1", "x2"]):
+        want_t = betas[ii, 1:] / stderrs[ii, 1:]
+        assert_allclose(lm[name].beta.data.ravel(), betas[ii], atol=1e-12)
+        assert_allclose(lm[name].stderr.data.ravel(), stderrs[ii], atol=1e-12)
+        assert_allclose(lm[name].t_val.data.ravel()[1:], want_t)
+        assert lm[name].t_val.data[0, 0] == 0
+        assert lm[name].p_val.data[0, 0] == 1
+        want_p = 2 * scipy.stats.t.sf(np.abs(want_t), df)
+        assert_allclose(lm[name].p_val.data.ravel()[1:], want_p)
+    lm_nop = linear_regression(epochs, design_matrix, return_pvals=False)
+    for name in lm:
+        assert lm_nop[name].p_val is None
+        assert lm_nop[name].mlog10_p_val is None
+        assert_array_equal(lm_nop[name].t_val.data, lm[name].t_val.data)
+
+
 @testing.requires_testing_data
 def test_continuous_regression_no_overlap():
     """Test regression without overlap correction, on real data."""
@@ -155,3 +190,40 @@ def test_continuous_regression_with_overlap():
     pytest.raises(ValueError, linear_regression_raw, raw, events, solver=solT)
     pytest.raises(ValueError, linear_regression_raw, raw, events, solver="err")
     pytest.raises(TypeError, linear_regression_raw, raw, events, solver=0)
+
+
+@pytest.mark.parametrize("decim", [1, 2])
+@pytest.mark.parametrize("reject", [None, dict(eeg=20.0)])
+def test_continuous_regression_chunked(decim, reject, tmp_path):
+    """Test that the chunked rERP solver matches the full solve."""
+    rng = np.random.RandomState(0)
+    n_times = 20000
+    events = np.zeros((60, 3), int)
+    events[:, 0] = np.sort(rng.choice(np.arange(100, n_times - 200, 4), 60, False))
+    events[:, 2] = rng.randint(1, 3, len(events))
+    data = rng.randn(3, n_times)
+    data[:, 10000:10100] *= 100  # something to reject
+    raw = RawArray(data, mne.create_info(3, 100.0, "eeg"))
+    covariates = dict(cov=rng.randn(len(events)))
+    kwargs = dict(
+        tmin=-0.1, tmax=0.4, covariates=covariates, reject=reject, decim=decim
+    )
+    want = linear_regression_raw(raw, events, **kwargs)
+    got = linear_regression_raw(raw, events, chunk_duration=7.3, **kwargs)
+    assert set(got) == set(want) == {"1", "2", "cov"}
+    for cond in want:
+        assert_allclose(got[cond].data, want[cond].data, rtol=1e-7, atol=1e-10)
+        assert got[cond].nave == want[cond].nave
+    # data that are not preloaded are read chunk by chunk
+    raw.save(tmp_path / "test_raw.fif")
+    raw = mne.io.read_raw_fif(tmp_path / "test_raw.fif", preload=False)
+    got = linear_regression_raw(raw, events, chunk_duration=7.3, **kwargs)
+    assert not raw.preload
+    for cond in want:
+        assert_allclose(got[cond].data, want[cond].data, atol=1e-5)  # float32
+    with pytest.raises(ValueError, match="must be positive"):
+        linear_regression_raw(raw, events, chunk_duration=0.0)
+    with pytest.raises(ValueError, match="solver='cholesky'"):
+        linear_regression_raw(
+            raw, events, chunk_duration=1.0, solver=lambda X, y: X.T @ y
+        )
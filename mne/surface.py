@@ -15,14 +15,14 @@ from os import path as op
 from pathlib import Path
 
 import numpy as np
-from scipy.ndimage import binary_dilation
+from scipy.ndimage import binary_dilation, label
 from scipy.sparse import coo_array, csr_array
 from scipy.spatial import ConvexHull, Delaunay
 from scipy.spatial.distance import cdist
 
 from ._fiff.constants import FIFF
 from ._fiff.pick import pick_types
-from .fixes import bincount, jit, prange
+from .fixes import bincount, has_numba, jit, prange
 from .parallel import parallel_func
 from .transforms import (
     Transform,
@@ -412,15 +412,19 @@ def _triangle_neighbors(tris, npts):
     # for ti, tri in enumerate(tris):
     #     for t in tri:
     #         neighbor_tri[t].append(ti)
+    indptr, indices = _triangle_neighbors_csr(tris, npts)
+    neighbor_tri = [indices[start:stop] for start, stop in zip(indptr[:-1], indptr[1:])]
+    assert len(neighbor_tri) == npts
+    return neighbor_tri
+
+
+def _triangle_neighbors_csr(tris, npts):
+    """Compute vertex neighboring triangles as CSR index pointers and indices."""
     rows = tris.ravel()
     cols = np.repeat(np.arange(len(tris)), 3)
     data = np.ones(len(cols))
     csr = coo_array((data, (rows, cols)), shape=(npts, len(tris))).tocsr()
-    neighbor_tri = [
-        csr.indices[start:stop] for start, stop in zip(csr.indptr[:-1], csr.indptr[1:])
-    ]
-    assert len(neighbor_tri) == npts
-    return neighbor_tri
+    return csr.indptr, csr.indices
 
 
 @jit()
@@ -448,14 +452,12 @@ def _project_onto_surface(
 ):
     """Project points onto (scalp) surface."""
     if method == "accurate":
-        surf_geom = _get_tri_supp_geom(surf)
-        pt_tris = np.empty((0,), int)
-        pt_lens = np.zeros(len(rrs) + 1, int)
-        out = _find_nearest_tri_pts(rrs, pt_tris, pt_lens, reproject=True, **surf_geom)
+        # barycentric coordinates of the closest point on the closest triangle
+        out = _TriangleTree(surf).query(rrs)[:2]
         if project_rrs:  #
             out += (np.einsum("ij,ijk->ik", out[0], surf["rr"][surf["tris"][out[1]]]),)
         if return_nn:
-            out += (surf_geom["nn"][out[1]],)
+            out += (_get_tri_supp_geom(surf)["nn"][out[1]],)
     else:  # nearest neighbor
         assert project_rrs
         idx = _compute_nearest(surf["rr"], rrs)
@@ -691,6 +693,11 @@ class _DistanceQuery:
         self.data = xhs
 
 
+_SOLIDS_BLOCK_SIZE = 4096  # points per solid-angle block
+_INSIDE_GRID_SUBDIV = 4  # voxels per maximal triangle extent
+_INSIDE_GRID_MAX = 2**21  # maximum number of pre-classification voxels
+
+
 @verbose
 def _points_outside_surface(rr, surf, n_jobs=None, verbose=None):
     """Check whether points are outside a surface.
@@ -709,11 +716,16 @@ def _points_outside_surface(rr, surf, n_jobs=None, verbose=None):
     """
     rr = np.atleast_2d(rr)
     assert rr.shape[1] == 3
-    parallel, p_fun, n_jobs = parallel_func(_get_solids, n_jobs)
+    tri_rrs = surf["rr"][surf["tris"]]
+    parallel, p_fun, n_jobs = parallel_func(_get_solids, n_jobs, prefer="threads")
+    # Blocks of points keep the per-triangle temporaries cache-sized and let
+    # the (GIL-releasing) NumPy work proceed in several threads at once
+    n_blocks = max(int(np.ceil(len(rr) / _SOLIDS_BLOCK_SIZE)), min(n_jobs, len(rr)), 1)
     tot_angles = parallel(
-        p_fun(surf["rr"][tris], rr) for tris in np.array_split(surf["tris"], n_jobs)
+        p_fun(tri_rrs, block) for block in np.array_split(rr, n_blocks)
     )
-    return np.abs(np.sum(tot_angles, axis=0) / (2 * np.pi) - 1.0) > 1e-5
+    tot_angles = np.concatenate(tot_angles)
+    return np.abs(tot_angles / (2 * np.pi) - 1.0) > 1e-5
 
 
 def _surface_to_polydata(surf):
@@ -769,6 +781,48 @@ class _CheckInside:
             dists = np.linalg.norm(self.surf["rr"] - self.center, axis=-1)
             self.inner_r = dists.min()
             self.outer_r = dists.max()
+        self._init_grid()
+
+    def _init_grid(self):
+        """Pre-classify the voxels of a grid that do not touch the surface."""
+        # Any voxel that overlaps the bounding box of a triangle is marked as
+        # a boundary voxel. Face-connected runs of the remaining voxels cannot
+        # cross the (closed) surface, so each connected component lies
+        # entirely inside or outside of it and a single exact solid-angle
+        # check of one of its voxel centers classifies all of its points.
+        self.grid = None
+        rr = self.surf["rr"]
+        tri_rrs = rr[self.surf["tris"]]
+        tri_lo, tri_hi = tri_rrs.min(axis=1), tri_rrs.max(axis=1)
+        lo, hi = rr.min(axis=0), rr.max(axis=0)
+        extent = hi - lo
+        if not np.all(extent > 0):
+            return
+        size = max(
+            (tri_hi - tri_lo).max() / _INSIDE_GRID_SUBDIV,
+            (np.prod(extent) / _INSIDE_GRID_MAX) ** (1.0 / 3.0),
+        )
+        origin = lo - size  # pad by one voxel so the exterior is connected
+        shape = np.floor((hi - origin) / size).astype(int) + 2
+        # Slightly enlarge the triangle boxes so that triangles lying on a
+        # voxel face mark the voxels on both sides of it
+        eps = 1e-6 * size
+        tri_lo = np.floor((tri_lo - eps - origin) / size).astype(int)
+        tri_hi = np.floor((tri_hi + eps - origin) / size).astype(int)
+        boundary = np.zeros(shape, bool)
+        n_sub = (tri_hi - tri_lo).max() + 1
+        for offset in np.ndindex(n_sub, n_sub, n_sub):
+            ijk = np.minimum(tri_lo + offset, tri_hi)
+            boundary[ijk[:, 0], ijk[:, 1], ijk[:, 2]] = True
+        labels, n_labels = label(~boundary)
+        # One representative voxel center per connected component
+        first = np.unique(labels.ravel(), return_index=True)[1][1:]
+        centers = origin + (np.array(np.unravel_index(first, shape)).T + 0.5) * size
+        grid = np.full(n_labels + 1, -1, np.int8)  # label 0: boundary voxels
+        grid[1:] = ~_points_outside_surface(centers, self.surf, verbose=False)
+        self.grid = grid[labels]
+        self.grid_origin = origin
+        self.grid_size = size
 
     def _init_pyvista(self):
         if not isinstance(self.surf, dict):
@@ -818,6 +872,24 @@ class _CheckInside:
         prec = int(np.ceil(np.log10(max(n_orig, 10))))
         inside = np.ones(n_orig, bool)  # innocent until proven guilty
         idx = np.arange(n_orig)
+        # Use the voxel pre-classification to handle all points that are not
+        # near the surface
+        if self.grid is not None:
+            ijk = np.floor((rr - self.grid_origin) / self.grid_size).astype(int)
+            in_grid = np.all((ijk >= 0) & (ijk < self.grid.shape), axis=1)
+            state = np.zeros(n_orig, np.int8)  # outside the grid means outside
+            state[in_grid] = self.grid[tuple(ijk[in_grid].T)]
+            inside[state == 0] = False
+            mask = state < 0
+            n = n_orig - mask.sum()
+            n_pad = str(n).rjust(prec)
+            logger.info(
+                f"    Found {n_pad}/{n_orig} point{_pl(n, ' ')} "
+                f"away from the surface using {1000 * self.grid_size:0.1f} mm "
+                "voxels"
+            )
+            idx = idx[mask]
+            rr = rr[mask]
         # Limit to indices that can plausibly be outside the surf
         # but are not definitely outside it
         if self.inner_r is not None:
@@ -826,16 +898,16 @@ class _CheckInside:
             n = (in_mask).sum()
             n_pad = str(n).rjust(prec)
             logger.info(
-                f"    Found {n_pad}/{n_orig} point{_pl(n, ' ')} "
+                f"    Found {n_pad}/{len(rr)} point{_pl(n, ' ')} "
                 f"inside  an interior sphere of radius "
                 f"{1000 * self.inner_r:6.1f} mm"
             )
             out_mask = dists > self.outer_r
-            inside[out_mask] = False
+            inside[idx[out_mask]] = False
             n = (out_mask).sum()
             n_pad = str(n).rjust(prec)
             logger.info(
-                f"    Found {n_pad}/{n_orig} point{_pl(n, ' ')} "
+                f"    Found {n_pad}/{len(rr)} point{_pl(n, ' ')} "
                 f"outside an exterior sphere of radius "
                 f"{1000 * self.outer_r:6.1f} mm"
             )
@@ -1766,6 +1838,236 @@ def _nearest_tri_edge(pt_tris, pqs, dist, a, b, c):  # pragma: no cover
     return p, q, pt, dist
 
 
+_TRI_TREE_LEAF_SIZE = 8  # triangles per leaf of a _TriangleTree
+_TRI_TREE_TIE_RTOL = 1e-10  # relative squared-distance tolerance for ties
+_TRI_TREE_TIE_ATOL = 1e-24  # absolute squared-distance tolerance for ties
+
+
+def _morton_codes(rr):
+    """Compute 30-bit Morton (Z-order) codes for points."""
+    lo, hi = rr.min(axis=0), rr.max(axis=0)
+    span = np.where(hi > lo, hi - lo, 1.0)
+    ijk = np.clip((rr - lo) / span * 1024, 0, 1023).astype(np.uint64)
+    for shift, mask in ((16, 0x030000FF), (8, 0x0300F00F), (4, 0x030C30C3)):
+        ijk = (ijk | (ijk << np.uint64(shift))) & np.uint64(mask)
+    ijk = (ijk | (ijk << np.uint64(2))) & np.uint64(0x09249249)
+    return (ijk[:, 0] << np.uint64(2)) | (ijk[:, 1] << np.uint64(1)) | ijk[:, 2]
+
+
+class _TriangleTree:
+    """Axis-aligned bounding box tree for nearest-triangle queries.
+
+    Triangles are sorted along a Morton curve and grouped into leaves of
+    ``leaf_size`` triangles, which form the bottom level of an implicit
+    (heap-ordered) complete binary tree of bounding boxes.
+    """
+
+    def __init__(self, surf, *, leaf_size=None):
+        leaf_size = _TRI_TREE_LEAF_SIZE if leaf_size is None else leaf_size
+        tri_rrs = surf["rr"][surf["tris"]]
+        n_tri = len(tri_rrs)
+        assert n_tri > 0
+        self.order = np.argsort(_morton_codes(tri_rrs.mean(axis=1)), kind="stable")
+        self.tri_rrs = np.ascontiguousarray(tri_rrs[self.order], dtype=np.float64)
+        n_leaf = -(-n_tri // leaf_size)
+        n_leaf_pad = 1 << int(np.ceil(np.log2(n_leaf)))
+        lo = np.full((2 * n_leaf_pad - 1, 3), np.inf)
+        hi = np.full((2 * n_leaf_pad - 1, 3), -np.inf)
+        starts = np.arange(0, n_tri, leaf_size)
+        first = n_leaf_pad - 1
+        lo[first : first + n_leaf] = np.minimum.reduceat(
+            self.tri_rrs.min(axis=1), starts
+        )
+        hi[first : first + n_leaf] = np.maximum.reduceat(
+            self.tri_rrs.max(axis=1), starts
+        )
+        while first > 0:
+            parents = np.arange((first - 1) // 2, first)
+            lo[parents] = np.minimum(lo[2 * parents + 1], lo[2 * parents + 2])
+            hi[parents] = np.maximum(hi[2 * parents + 1], hi[2 * parents + 2])
+            first = parents[0]
+        self.lo = lo
+        self.hi = hi
+        self.leaf_size = leaf_size
+
+    def query(self, rr):
+        """Find the nearest triangle to each point.
+
+        Parameters
+        ----------
+        rr : ndarray, shape (n_points, 3)
+            The points.
+
+        Returns
+        -------
+        weights : ndarray, shape (n_points, 3)
+            Barycentric coordinates of the nearest point on the triangle.
+        tri_idx : ndarray, shape (n_points,)
+            The index of the nearest triangle.
+        dists : ndarray, shape (n_points,)
+            The distance from each point to its nearest triangle.
+
+        Notes
+        -----
+        When several triangles are equally near (e.g., they share the nearest
+        vertex or edge), the one with the lowest index is returned.
+        """
+        rr = np.ascontiguousarray(np.atleast_2d(rr), dtype=np.float64)
+        assert rr.ndim == 2 and rr.shape[1] == 3
+        weights, tri_idx, dists = _tri_tree_query(
+            rr, self.lo, self.hi, self.tri_rrs, self.order, self.leaf_size
+        )
+        return weights, self.order[tri_idx], dists
+
+
+@jit(fastmath=False)
+def _box_dist2(rr, lo, hi):  # pragma: no cover
+    """Get the squared distance from a point to a bounding box."""
+    dist2 = 0.0
+    for ii in range(3):
+        if rr[ii] < lo[ii]:
+            dist2 += (lo[ii] - rr[ii]) ** 2
+        elif rr[ii] > hi[ii]:
+            dist2 += (rr[ii] - hi[ii]) ** 2
+    return dist2
+
+
+@jit(fastmath=False)
+def _closest_on_tri(rr, tri_rr):  # pragma: no cover
+    """Get barycentric coordinates of the nearest point on a triangle.
+
+    See Ericson, Real-Time Collision Detection (2004), Section 5.1.5.
+    """
+    abx = tri_rr[1, 0] - tri_rr[0, 0]
+    aby = tri_rr[1, 1] - tri_rr[0, 1]
+    abz = tri_rr[1, 2] - tri_rr[0, 2]
+    acx = tri_rr[2, 0] - tri_rr[0, 0]
+    acy = tri_rr[2, 1] - tri_rr[0, 1]
+    acz = tri_rr[2, 2] - tri_rr[0, 2]
+    apx = rr[0] - tri_rr[0, 0]
+    apy = rr[1] - tri_rr[0, 1]
+    apz = rr[2] - tri_rr[0, 2]
+    d1 = abx * apx + aby * apy + abz * apz
+    d2 = acx * apx + acy * apy + acz * apz
+    if d1 <= 0 and d2 <= 0:
+        return 0.0, 0.0
+    bpx = rr[0] - tri_rr[1, 0]
+    bpy = rr[1] - tri_rr[1, 1]
+    bpz = rr[2] - tri_rr[1, 2]
+    d3 = abx * bpx + aby * bpy + abz * bpz
+    d4 = acx * bpx + acy * bpy + acz * bpz
+    if d3 >= 0 and d4 <= d3:
+        return 1.0, 0.0
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0:
+        return d1 / (d1 - d3), 0.0
+    cpx = rr[0] - tri_rr[2, 0]
+    cpy = rr[1] - tri_rr[2, 1]
+    cpz = rr[2] - tri_rr[2, 2]
+    d5 = abx * cpx + aby * cpy + abz * cpz
+    d6 = acx * cpx + acy * cpy + acz * cpz
+    if d6 >= 0 and d5 <= d6:
+        return 0.0, 1.0
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0:
+        return 0.0, d2 / (d2 - d6)
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and (d4 - d3) >= 0 and (d5 - d6) >= 0:
+        w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        return 1.0 - w, w
+    denom = 1.0 / (va + vb + vc)
+    return vb * denom, vc * denom
+
+
+@jit(fastmath=False)
+def _tri_dist2(rr, tri_rr):  # pragma: no cover
+    """Get the squared distance and nearest point from a point to a triangle."""
+    p, q = _closest_on_tri(rr, tri_rr)
+    dist2 = 0.0
+    for ii in range(3):
+        diff = (
+            rr[ii]
+            - tri_rr[0, ii]
+            - p * (tri_rr[1, ii] - tri_rr[0, ii])
+            - q * (tri_rr[2, ii] - tri_rr[0, ii])
+        )
+        dist2 += diff * diff
+    return dist2, p, q
+
+
+@jit(fastmath=False)
+def _tri_tree_search(rr, lo, hi, tri_rrs, order, leaf_size, thresh):  # pragma: no cover
+    """Search a _TriangleTree for the nearest triangle to a point.
+
+    With ``thresh=np.inf`` the nearest triangle is found. Otherwise, the
+    triangle with the lowest (original) index among those no farther than
+    ``sqrt(thresh)`` is found, which makes ties deterministic.
+    """
+    n_tri = len(tri_rrs)
+    first_leaf = (len(lo) - 1) // 2
+    stack = np.empty(128, np.int64)
+    stack[0] = 0
+    n_stack = 1
+    nearest = np.isinf(thresh)
+    best, best_p, best_q, best_tri = thresh, 0.0, 0.0, -1
+    while n_stack > 0:
+        n_stack -= 1
+        node = stack[n_stack]
+        if _box_dist2(rr, lo[node], hi[node]) > best:
+            continue
+        if node >= first_leaf:
+            start = (node - first_leaf) * leaf_size
+            for ti in range(start, min(start + leaf_size, n_tri)):
+                dist2, p, q = _tri_dist2(rr, tri_rrs[ti])
+                if nearest:
+                    use = dist2 < best
+                else:
+                    use = dist2 <= thresh and (
+                        best_tri < 0 or order[ti] < order[best_tri]
+                    )
+                if use:
+                    best_p, best_q, best_tri = p, q, ti
+                    if nearest:
+                        best = dist2
+        else:
+            # push the farther child first so the nearer is visited first
+            left, right = 2 * node + 1, 2 * node + 2
+            dist_left = _box_dist2(rr, lo[left], hi[left])
+            dist_right = _box_dist2(rr, lo[right], hi[right])
+            if dist_left < dist_right:
+                left, right = right, left
+                dist_left, dist_right = dist_right, dist_left
+            if dist_left <= best:
+                stack[n_stack] = left
+                n_stack += 1
+            if dist_right <= best:
+                stack[n_stack] = right
+                n_stack += 1
+    return best, best_p, best_q, best_tri
+
+
+@jit(parallel=True, fastmath=False)
+def _tri_tree_query(rrs, lo, hi, tri_rrs, order, leaf_size):  # pragma: no cover
+    """Find the nearest triangles to points by traversing a _TriangleTree."""
+    weights = np.empty((len(rrs), 3))
+    tri_idx = np.empty(len(rrs), np.int64)
+    dists = np.empty(len(rrs))
+    for ri in prange(len(rrs)):
+        rr = rrs[ri]
+        best = _tri_tree_search(rr, lo, hi, tri_rrs, order, leaf_size, np.inf)[0]
+        # triangles sharing the nearest vertex or edge are (nearly) equidistant,
+        # so take the lowest-index one within a small tolerance of the minimum
+        thresh = best * (1 + _TRI_TREE_TIE_RTOL) + _TRI_TREE_TIE_ATOL
+        _, p, q, ti = _tri_tree_search(rr, lo, hi, tri_rrs, order, leaf_size, thresh)
+        dist2 = _tri_dist2(rr, tri_rrs[ti])[0]
+        weights[ri, 0] = 1.0 - p - q
+        weights[ri, 1] = p
+        weights[ri, 2] = q
+        tri_idx[ri] = ti
+        dists[ri] = np.sqrt(dist2)
+    return weights, tri_idx, dists
+
+
 def mesh_edges(tris):
     """Return sparse matrix with edges as an adjacency matrix.
 
@@ -1892,8 +2194,7 @@ def read_tri(fname_in, swap=False, verbose=None):
     return (rr, tris)
 
 
-@jit()
-def _get_solids(tri_rrs, fros):
+def _get_solids_fallback(tri_rrs, fros):
     """Compute _sum_solids_div total angle in chunks."""
     # NOTE: This incorporates the division by 4PI that used to be separate
     tot_angle = np.zeros(len(fros))
@@ -1902,9 +2203,7 @@ def _get_solids(tri_rrs, fros):
         v1 = fros - tri_rr[0]
         v2 = fros - tri_rr[1]
         v3 = fros - tri_rr[2]
-        v4 = np.empty((v1.shape[0], 3))
-        _jit_cross(v4, v1, v2)
-        triple = np.sum(v4 * v3, axis=1)
+        triple = np.sum(np.cross(v1, v2) * v3, axis=1)
         l1 = np.sqrt(np.sum(v1 * v1, axis=1))
         l2 = np.sqrt(np.sum(v2 * v2, axis=1))
         l3 = np.sqrt(np.sum(v3 * v3, axis=1))
@@ -1918,6 +2217,46 @@ def _get_solids(tri_rrs, fros):
     return tot_angle
 
 
+if has_numba:
+
+    @jit()
+    def _get_solids(tri_rrs, fros):
+        """Compute _sum_solids_div total angle one point at a time."""
+        tot_angle = np.zeros(len(fros))
+        for pi in range(len(fros)):
+            total = 0.0
+            for ti in range(len(tri_rrs)):
+                x1 = fros[pi, 0] - tri_rrs[ti, 0, 0]
+                y1 = fros[pi, 1] - tri_rrs[ti, 0, 1]
+                z1 = fros[pi, 2] - tri_rrs[ti, 0, 2]
+                x2 = fros[pi, 0] - tri_rrs[ti, 1, 0]
+                y2 = fros[pi, 1] - tri_rrs[ti, 1, 1]
+                z2 = fros[pi, 2] - tri_rrs[ti, 1, 2]
+                x3 = fros[pi, 0] - tri_rrs[ti, 2, 0]
+                y3 = fros[pi, 1] - tri_rrs[ti, 2, 1]
+                z3 = fros[pi, 2] - tri_rrs[ti, 2, 2]
+                triple = (
+                    (y1 * z2 - z1 * y2) * x3
+                    + (z1 * x2 - x1 * z2) * y3
+                    + (x1 * y2 - y1 * x2) * z3
+                )
+                l1 = np.sqrt(x1 * x1 + y1 * y1 + z1 * z1)
+                l2 = np.sqrt(x2 * x2 + y2 * y2 + z2 * z2)
+                l3 = np.sqrt(x3 * x3 + y3 * y3 + z3 * z3)
+                s = (
+                    l1 * l2 * l3
+                    + (x1 * x2 + y1 * y2 + z1 * z2) * l3
+                    + (x1 * x3 + y1 * y3 + z1 * z3) * l2
+                    + (x2 * x3 + y2 * y3 + z2 * z3) * l1
+                )
+                total -= np.arctan2(triple, s)
+            tot_angle[pi] = total
+        return tot_angle
+
+else:  # pragma: no cover
+    _get_solids = _get_solids_fallback
+
+
 def _complete_sphere_surf(sphere, idx, level, complete=True):
     """Convert sphere conductor model to surface."""
     rad = sphere["layers"][idx]["rad"]
@@ -32,16 +32,19 @@ from mne.bem import (
     _assert_inside,
     _bem_find_surface,
     _check_surface_size,
+    _fwd_bem_lin_pot_coeff,
     _get_ico_map,
     _ico_downsample,
+    _lin_pot_coeff,
     _order_surfaces,
+    _surfaces_to_bem,
     distance_to_bem,
     fit_sphere_to_headshape,
     make_scalp_surfaces,
 )
 from mne.datasets import testing
 from mne.io import read_info
-from mne.surface import _get_ico_surface, read_surface
+from mne.surface import _get_ico_surface, mesh_edges, read_surface
 from mne.transforms import translation
 from mne.utils import (
     _chmod_rw_R,
@@ -326,6 +329,95 @@ def test_bem_solution(tmp_path, cond, fname):
     _compare_bem_solutions(solution_read, solution)
 
 
+def _make_ellipsoid_bem_surfaces(grade=2):
+    """Make nested ellipsoidal three-layer BEM surfaces."""
+    ids = (
+        FIFF.FIFFV_BEM_SURF_ID_HEAD,
+        FIFF.FIFFV_BEM_SURF_ID_SKULL,
+        FIFF.FIFFV_BEM_SURF_ID_BRAIN,
+    )
+    surfs = list()
+    for rad in (0.09, 0.085, 0.08):
+        surf = _get_ico_surface(grade)
+        surf["rr"] = surf["rr"] * rad * np.array([1.0, 1.1, 0.95])
+        surfs.append(surf)
+    return _surfaces_to_bem(surfs, ids, (0.3, 0.006, 0.3), rescale=False)
+
+
+def test_bem_solution_blocks_cache(tmp_path, monkeypatch):
+    """Test blocked BEM coefficient assembly and cached BEM solutions."""
+    surfs = _make_ellipsoid_bem_surfaces()
+    coeff = _fwd_bem_lin_pot_coeff(surfs)
+    # one triangle at a time
+    nps = [surf["np"] for surf in surfs]
+    offsets = np.cumsum([0] + nps)
+    want = np.zeros_like(coeff)
+    mask = np.ones(coeff.shape, bool)
+    for si_1, surf1 in enumerate(surfs):
+        for si_2, surf2 in enumerate(surfs):
+            submat = want[
+                offsets[si_1] : offsets[si_1 + 1], offsets[si_2] : offsets[si_2 + 1]
+            ]
+            for tri, tri_rr, tri_nn, tri_area in zip(
+                surf2["tris"],
+                surf2["rr"][surf2["tris"]],
+                surf2["tri_nn"],
+                surf2["tri_area"],
+            ):
+                coeffs = _lin_pot_coeff(
+                    surf1["rr"],
+                    tri_rr[np.newaxis],
+                    tri_nn[np.newaxis],
+                    tri_area[np.newaxis],
+                )[:, 0]
+                if si_1 == si_2:
+                    coeffs[tri] = 0.0
+                submat[:, tri] -= coeffs
+            if si_1 == si_2:
+                # auto elements make each row sum to the solid angle 2 pi
+                assert_allclose(
+                    coeff[
+                        offsets[si_1] : offsets[si_1 + 1],
+                        offsets[si_2] : offsets[si_2 + 1],
+                    ].sum(axis=1),
+                    2 * np.pi,
+                )
+                # and only modify the node itself and its neighbors
+                adj = mesh_edges(surf1["tris"]).toarray() + np.eye(len(submat))
+                mask[
+                    offsets[si_1] : offsets[si_1 + 1],
+                    offsets[si_2] : offsets[si_2 + 1],
+                ] = adj == 0
+    assert_allclose(coeff[mask], want[mask], rtol=1e-7, atol=1e-12)
+    monkeypatch.setattr(mne.bem, "_LIN_POT_BLOCK_SIZE", 1000)
+    assert_allclose(
+        _fwd_bem_lin_pot_coeff(surfs, n_jobs=2), coeff, rtol=1e-12, atol=1e-15
+    )
+
+    # caching is opt-in, and not enabled by the joblib cache directory
+    monkeypatch.setenv("MNE_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("MNE_BEM_CACHE_DIR", raising=False)
+    sol = make_bem_solution(deepcopy(surfs))
+    assert not list(tmp_path.rglob("*-bem-sol.npz"))
+    cache_dir = tmp_path / "bem"
+    monkeypatch.setenv("MNE_BEM_CACHE_DIR", str(cache_dir))
+    sol = make_bem_solution(deepcopy(surfs))
+    fnames = list(cache_dir.glob("*-bem-sol.npz"))
+    assert len(fnames) == 1
+    with catch_logging() as log:
+        sol_cached = make_bem_solution(deepcopy(surfs), verbose=True)
+    assert "Using cached BEM solution" in log.getvalue()
+    _compare_bem_solutions(sol, sol_cached)
+    assert_allclose(sol["solution"], sol_cached["solution"], rtol=0, atol=0)
+    # a different conductivity is a different solution
+    surfs[1]["sigma"] = 0.0075
+    with catch_logging() as log:
+        sol_new = make_bem_solution(surfs, verbose=True)
+    assert "Using cached" not in log.getvalue()
+    assert len(list(cache_dir.glob("*-bem-sol.npz"))) == 2
+    assert not np.allclose(sol_new["solution"], sol["solution"])
+
+
 def test_fit_sphere_to_headshape():
     """Test fitting a sphere to digitization points."""
     # Create points of various kinds
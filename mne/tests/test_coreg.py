@@ -18,9 +18,11 @@ from numpy.testing import (
 
 import mne
 from mne._fiff.constants import FIFF
+from mne.bem import _surfaces_to_bem
 from mne.channels import DigMontage
 from mne.coreg import (
     Coregistration,
+    _decimate_points,
     _is_mri_subject,
     coregister_fiducials,
     create_default_subject,
@@ -33,6 +35,7 @@ from mne.coreg import (
 from mne.datasets import testing
 from mne.io import read_fiducials, read_info
 from mne.source_space import write_source_spaces
+from mne.surface import _get_ico_surface
 from mne.transforms import (
     Transform,
     _angle_between_quats,
@@ -380,6 +383,71 @@ def test_fit_matched_points():
     pytest.raises(RuntimeError, fit_matched_points, tgt_pts, src_pts, tol=10)
 
 
+def test_decimate_points():
+    """Test decimating points on a voxel grid."""
+    rng = np.random.RandomState(0)
+    pts = rng.randn(2000, 3) * 0.05
+    res = 0.01
+    dec = _decimate_points(pts, res)
+    # at most one point per voxel, each the one closest to its voxel center
+    vox = np.floor((dec - (pts.min(0) - res / 2.0)) / res)
+    assert len(np.unique(vox, axis=0)) == len(dec)
+    mids = (vox + 0.5) * res + (pts.min(0) - res / 2.0)
+    for pt, mid in zip(dec, mids):
+        in_vox = np.all(np.abs(pts - mid) < res / 2.0, axis=1)
+        dists = np.linalg.norm(pts[in_vox] - mid, axis=1)
+        assert_allclose(np.linalg.norm(pt - mid), dists.min())
+
+
+def _make_synthetic_coreg_subject(tmp_path):
+    """Make a subject with an ellipsoidal head and matching digitization."""
+    surf = _get_ico_surface(4)
+    rad = np.array([0.075, 0.095, 0.085])
+    surf["rr"] = surf["rr"] * rad
+    head = _surfaces_to_bem([surf], [FIFF.FIFFV_BEM_SURF_ID_HEAD], [0.3], rescale=False)
+    (tmp_path / "sub" / "bem").mkdir(parents=True)
+    mne.write_bem_surfaces(tmp_path / "sub" / "bem" / "sub-head.fif", head)
+    fids = dict(lpa=rad * [-1, 0, 0], nasion=rad * [0, 1, 0], rpa=rad * [1, 0, 0])
+    mri_head_t = np.dot(translation(0.004, -0.003, 0.005), rotation(0.03, -0.04, 0.05))
+    rr = head[0]["rr"]
+    hsp = apply_trans(mri_head_t, rr[rr[:, 2] > 0][::5])
+    montage = mne.channels.make_dig_montage(
+        hsp=hsp,
+        coord_frame="head",
+        **{key: apply_trans(mri_head_t, val) for key, val in fids.items()},
+    )
+    info = mne.create_info(1, 1000.0, "misc")
+    info.set_montage(montage)
+    return info, fids, mri_head_t
+
+
+@pytest.mark.parametrize("scale_mode", (None, "uniform"))
+def test_coregistration_icp_coarse_to_fine(tmp_path, scale_mode):
+    """Test coarse-to-fine ICP with a persistent nearest-neighbor tree."""
+    info, fids, mri_head_t = _make_synthetic_coreg_subject(tmp_path)
+    coreg = Coregistration(info, "sub", tmp_path, fiducials=fids)
+    coreg.set_fid_match("matched").set_scale_mode(scale_mode)
+    tree = coreg._nearest_tree
+    coreg.fit_icp(20, coarse_to_fine=True)
+    # isotropic scaling does not require rebuilding the tree
+    assert coreg._nearest_tree is tree
+    assert_allclose(coreg.trans["trans"], np.linalg.inv(mri_head_t), atol=1e-4)
+    assert_allclose(coreg._scale, 1.0, atol=1e-4)
+    assert_array_less(coreg.compute_dig_mri_distances(), 1e-4)
+    # a single iteration still uses the full-resolution surface
+    coreg.reset().set_fid_match("matched")
+    n_calls = list()
+    coreg.fit_icp(
+        1,
+        coarse_to_fine=True,
+        callback=lambda iteration, n_iterations: n_calls.append(iteration),
+    )
+    assert n_calls == [0]
+    # anisotropic scaling does
+    coreg.set_scale([1.0, 1.1, 1.0])
+    assert coreg._nearest_tree is not tree
+
+
 @testing.requires_testing_data
 def test_get_mni_fiducials():
     """Test get_mni_fiducials."""
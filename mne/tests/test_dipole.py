@@ -3,6 +3,7 @@
 # Copyright the MNE-Python contributors.
 
 import os
+from pathlib import Path
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -21,6 +22,7 @@ from mne import (
     head_to_mni,
     make_ad_hoc_cov,
     make_fixed_length_events,
+    make_forward_dipole,
     make_forward_solution,
     make_sphere_model,
     pick_info,
@@ -36,12 +38,12 @@ from mne._fiff.constants import FIFF
 from mne.bem import _bem_find_surface, read_bem_solution
 from mne.datasets import testing
 from mne.dipole import _BDIP_ERROR_KEYS, get_phantom_dipoles
-from mne.io import read_raw_ctf, read_raw_fif
+from mne.io import read_info, read_raw_ctf, read_raw_fif
 from mne.proj import make_eeg_average_ref_proj
 from mne.simulation import simulate_evoked
 from mne.surface import _compute_nearest
 from mne.transforms import _get_trans, apply_trans
-from mne.utils import _record_warnings, requires_mne, run_subprocess
+from mne.utils import _record_warnings, catch_logging, requires_mne, run_subprocess
 
 data_path = testing.data_path(download=False)
 meg_path = data_path / "MEG" / "sample"
@@ -65,6 +67,14 @@ fname_xfit_dip_txt = data_path / "dip" / "fixed_auto.dip"
 fname_xfit_seq_txt = data_path / "dip" / "sequential.dip"
 fname_ctf = data_path / "CTF" / "testdata_ctf_short.ds"
 subjects_dir = data_path / "subjects"
+fname_bti_raw = (
+    Path(__file__).parents[1]
+    / "io"
+    / "bti"
+    / "tests"
+    / "data"
+    / "exported4D_linux_raw.fif"
+)
 
 
 def _compare_dipoles(orig, new):
@@ -500,6 +510,41 @@ def test_get_phantom_dipoles(kind, count):
     assert_allclose(np.sum(pos * ori, axis=1), 0.0, atol=1e-7)
 
 
+@pytest.mark.parametrize("optimizer", ("cobyla", "simplex"))
+@pytest.mark.parametrize("warm_start", (False, True))
+def test_dipole_fitting_sequential(optimizer, warm_start):
+    """Test sequential dipole fitting with warm starts and optimizers."""
+    info = read_info(fname_bti_raw)
+    info = pick_info(info, pick_types(info, meg=True)[::4])
+    sphere = make_sphere_model((0.0, 0.0, 0.04), 0.09)
+    n_times = 5
+    ang = np.linspace(0, np.pi / 4, n_times)
+    pos = np.c_[0.03 * np.cos(ang), 0.03 * np.sin(ang), np.full(n_times, 0.05)]
+    ori = np.c_[-np.sin(ang), np.cos(ang), np.zeros(n_times)]
+    amp = np.full(n_times, 50e-9)
+    dip_true = Dipole(np.arange(n_times) / 1000.0, pos, amp, ori, np.ones(n_times))
+    fwd, _ = make_forward_dipole(dip_true, sphere, info)
+    data = fwd["sol"]["data"] * 50e-9
+    evoked = EvokedArray(data, info, tmin=0)
+    cov = make_ad_hoc_cov(info)
+    dip, residual = fit_dipole(
+        evoked, cov, sphere, warm_start=warm_start, optimizer=optimizer
+    )
+    _check_dipole(dip, n_times)
+    assert_allclose(dip.pos, pos, atol=1e-3)
+    assert_allclose(dip.amplitude, amp, rtol=3e-2)
+    assert_array_less(99.9, dip.gof)
+    assert_array_less(np.abs(residual.data), 0.01 * np.abs(data).max())
+    with pytest.raises(ValueError, match="Invalid value for the 'optimizer'"):
+        fit_dipole(evoked, cov, sphere, optimizer="foo")
+    # verbose can still be passed positionally
+    with catch_logging() as log:
+        fit_dipole(
+            evoked, cov, sphere, None, 5.0, None, None, None, None, "normal", 5e-5, True
+        )
+    assert "Guess grid" in log.getvalue()
+
+
 @testing.requires_testing_data
 def test_confidence(tmp_path):
     """Test confidence limits."""
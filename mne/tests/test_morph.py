@@ -77,6 +77,108 @@ def test_sourcemorph_consistency():
     )
 
 
+def test_morph_batch_and_kernel():
+    """Test morphing lists of stcs and folding the morph into a kernel."""
+    rng = np.random.RandomState(0)
+    vertices_from = [np.arange(0, 20, 2), np.arange(5)]
+    vertices_to = [np.arange(8), np.arange(4)]
+    morph_mat = csr_array(rng.rand(12, 15) * (rng.rand(12, 15) > 0.7))
+    morph = SourceMorph(
+        "a",
+        "b",
+        "surface",
+        None,
+        None,
+        None,
+        None,
+        None,
+        False,
+        morph_mat,
+        vertices_to,
+        None,
+        None,
+        None,
+        None,
+        dict(vertices_from=vertices_from),
+        None,
+    )
+    kernel = rng.randn(15, 4)
+    stcs = [
+        SourceEstimate(
+            (kernel, rng.randn(4, n_times)), vertices_from, 0, 0.1, subject="a"
+        )
+        for n_times in (3, 5)
+    ]
+    stcs.append(SourceEstimate(rng.randn(15, 2), vertices_from, 0.1, 0.1))
+    stcs_to = morph.apply(stcs)
+    assert len(stcs_to) == 3
+    assert [stc._factored for stc in stcs_to] == [True, True, False]
+    assert stcs_to[0]._kernel is stcs_to[1]._kernel  # morphed only once
+    for stc, stc_to in zip(stcs, stcs_to):
+        assert stc_to.subject == "b"
+        assert stc_to.tmin == stc.tmin
+        assert_array_equal(stc_to.vertices[0], vertices_to[0])
+        assert_allclose(stc_to.data, morph_mat @ stc.data)
+        assert_allclose(morph.apply(stc).data, stc_to.data)
+    kernel_to = morph.fold_kernel(kernel)
+    assert_allclose(kernel_to, morph_mat @ kernel)
+    with pytest.raises(ValueError, match="kernel must have shape"):
+        morph.fold_kernel(kernel[1:])
+    stcs[1].vertices[0] = stcs[1].vertices[0] + 1
+    with pytest.raises(ValueError, match=r"stc_from\[1\] does not have the same"):
+        morph.apply(stcs)
+
+
+@pytest.mark.parametrize("n_jobs", (1, 2))
+def test_surface_morph_cache(tmp_path, n_jobs):
+    """Test the content-addressed cache of surface morph matrices."""
+    from mne.surface import _get_ico_surface, write_surface
+
+    rng = np.random.RandomState(0)
+    ico = _get_ico_surface(3)
+
+    def _write_spheres(subject, scale):
+        (tmp_path / subject / "surf").mkdir(parents=True, exist_ok=True)
+        for hemi in ("lh", "rh"):
+            rr = ico["rr"] + scale * rng.randn(*ico["rr"].shape)
+            rr *= 100 / np.linalg.norm(rr, axis=1, keepdims=True)
+            fname = tmp_path / subject / "surf" / f"{hemi}.sphere.reg"
+            write_surface(fname, rr, ico["tris"], overwrite=True)
+
+    _write_spheres("a", 0.0)
+    _write_spheres("b", 0.01)
+    vertices = [np.arange(0, len(ico["rr"]), 2), np.arange(0, len(ico["rr"]), 3)]
+    stc = SourceEstimate(
+        rng.randn(sum(len(v) for v in vertices), 2), vertices, 0, 1, subject="a"
+    )
+    kwargs = dict(
+        subject_to="b",
+        subjects_dir=tmp_path,
+        spacing=[np.arange(100), np.arange(50)],
+        n_jobs=n_jobs,
+        verbose=True,
+    )
+    cache_dir = tmp_path / "morph-maps" / "cache"
+    with catch_logging() as log:
+        morph = compute_source_morph(stc, **kwargs)
+    assert "cached" not in log.getvalue()
+    assert len(list(cache_dir.glob("a-b-*-morph.npz"))) == 1
+    with catch_logging() as log:
+        morph_cached = compute_source_morph(stc, **kwargs)
+    assert "Using cached morph matrix" in log.getvalue()
+    assert_allclose(morph_cached.morph_mat.toarray(), morph.morph_mat.toarray())
+    # other parameters or changed surfaces must not hit the cache
+    morph_nearest = compute_source_morph(stc, smooth="nearest", **kwargs)
+    assert len(list(cache_dir.glob("*.npz"))) == 2
+    assert not np.allclose(morph_nearest.morph_mat.toarray(), morph.morph_mat.toarray())
+    _write_spheres("b", 0.02)
+    for fname in (tmp_path / "morph-maps").glob("*-morph.fif"):
+        fname.unlink()  # stale morph map
+    morph_new = compute_source_morph(stc, **kwargs)
+    assert len(list(cache_dir.glob("*.npz"))) == 3
+    assert not np.allclose(morph_new.morph_mat.toarray(), morph.morph_mat.toarray())
+
+
 @testing.requires_testing_data
 def test_sparse_morph():
     """Test sparse morphing."""
@@ -651,6 +753,15 @@ def test_volume_source_morph_round_trip(
         )
     log = log.getvalue()
     assert "individual volume morph" in log
+    # warping blocks of volumes in threads gives the same result
+    block_size = mne.morph._VOL_BLOCK_SIZE
+    monkeypatch.setattr(mne.morph, "_VOL_BLOCK_SIZE", 1)
+    stc_from_rt_blocks = morph_to_from.apply(
+        morph_from_to.apply(stc_from, n_jobs=2), n_jobs=2
+    )
+    assert_allclose(stc_from_rt.data, stc_from_rt_blocks.data)
+    del stc_from_rt_blocks
+    monkeypatch.setattr(mne.morph, "_VOL_BLOCK_SIZE", block_size)
     maxs = np.argmax(stc_from_rt.data, axis=0)
     src_rr = np.concatenate([s["rr"][s["vertno"]] for s in src_from])
     dists = 1000 * np.linalg.norm(src_rr[use] - src_rr[maxs], axis=1)
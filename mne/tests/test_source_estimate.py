@@ -1101,6 +1101,125 @@ def test_transform_data():
         VolSourceEstimate((kernel, sens_data), vertices, 0, 1)
 
 
+def _fake_factored_stc_src(n_sens=6, n_times=20):
+    """Make a factored SourceEstimate along with a matching surface src."""
+    src = list()
+    for hemi_id in (FIFF.FIFFV_MNE_SURF_LEFT_HEMI, FIFF.FIFFV_MNE_SURF_RIGHT_HEMI):
+        nn = rng.randn(30, 3)
+        nn /= np.linalg.norm(nn, axis=1, keepdims=True)
+        vertno = np.sort(rng.choice(30, 15, replace=False))
+        src.append(
+            dict(
+                type="surf",
+                id=hemi_id,
+                np=30,
+                rr=rng.randn(30, 3),
+                nn=nn,
+                vertno=vertno,
+                nuse=len(vertno),
+                coord_frame=FIFF.FIFFV_COORD_MRI,
+            )
+        )
+    src = SourceSpaces(src)
+    vertices = [s["vertno"] for s in src]
+    kernel = rng.randn(30, n_sens)
+    sens_data = rng.randn(n_sens, n_times)
+    stc = SourceEstimate((kernel, sens_data), vertices, tmin=-0.05, tstep=0.01)
+    return stc, src
+
+
+def test_factored_stc():
+    """Test operations on stcs stored as (kernel, sens_data)."""
+    stc, src = _fake_factored_stc_src()
+    assert stc._factored
+    want = np.dot(stc._kernel, stc._sens_data)
+    labels = [
+        Label(stc.vertices[0][:5], hemi="lh", name="a"),
+        Label(stc.vertices[1][3:9], hemi="rh", name="b"),
+        Label(stc.vertices[0][7:], hemi="lh") + Label(stc.vertices[1][:2], hemi="rh"),
+    ]
+    stc_full = SourceEstimate(want, stc.vertices, stc.tmin, stc.tstep)
+    for mode in ("mean", "mean_flip", "max", "pca_flip"):
+        label_tc = stc.extract_label_time_course(labels, src, mode=mode)
+        assert_allclose(
+            label_tc, stc_full.extract_label_time_course(labels, src, mode=mode)
+        )
+    assert stc._factored  # nothing was projected
+    # linear operations keep the factorization
+    assert_allclose(stc.mean().data, want.mean(-1, keepdims=True))
+    assert_allclose(stc.sum().data, want.sum(-1, keepdims=True))
+    stc_bin = stc.bin(0.05)
+    assert stc_bin._factored
+    assert_allclose(stc_bin.data, stc_full.bin(0.05).data)
+    other = stc.copy()
+    for out, out_want in (
+        (stc + other, 2 * want),
+        (stc - 2 * other, -want),
+        (-stc / 4.0, -want / 4.0),
+    ):
+        assert out._factored
+        assert_allclose(out.data, out_want)
+    assert_allclose((stc + 1).data, want + 1)  # not linear, so projected
+    stc_base = stc.copy().apply_baseline((None, 0))
+    assert stc_base._factored
+    assert_allclose(stc_base.data, stc_full.copy().apply_baseline((None, 0)).data)
+    stc.crop(0, 0.1)
+    assert stc._factored
+    assert_allclose(stc.data, stc_full.crop(0, 0.1).data)
+    assert not stc._factored
+
+
+@pytest.mark.parametrize("mode", ("mean", "mean_flip", "max", "pca_flip", None))
+def test_label_extractor(mode):
+    """Test reusing a label extraction operator across stcs."""
+    stc, src = _fake_factored_stc_src()
+    labels = [
+        Label(stc.vertices[0][:5], hemi="lh", name="a"),
+        Label(stc.vertices[1][3:9], hemi="rh", name="b"),
+    ]
+    stcs = [stc.copy() for _ in range(3)]
+    for this_stc in stcs[1:]:
+        this_stc._kernel = stcs[0]._kernel  # as for apply_inverse_epochs
+        this_stc._sens_data = rng.randn(*this_stc._sens_data.shape)
+    stcs_full = [
+        SourceEstimate(this_stc._get_rows(slice(None)), stc.vertices, 0, 1)
+        for this_stc in stcs
+    ]
+    extractor = mne.LabelExtractor(labels, src, mode=mode)
+    assert extractor.n_labels == 2
+    assert "2 labels" in repr(extractor)
+
+    def _flat(label_tc):
+        return np.concatenate(label_tc) if mode is None else label_tc  # per label
+
+    want = extract_label_time_course(stcs_full, labels, src, mode=mode)
+    want = [_flat(w) for w in want]
+    for use_stcs in (stcs, stcs_full):
+        got = [_flat(g) for g in extractor.apply(use_stcs)]
+        assert len(got) == len(want)
+        for g, w in zip(got, want):
+            assert_allclose(g, w, rtol=1e-10)
+    assert list(extractor._ops) == [mode]  # prepared only once
+    assert all(this_stc._factored for this_stc in stcs)
+    gen = extractor.apply((s for s in stcs), return_generator=True)
+    assert_allclose(_flat(next(gen)), want[0], rtol=1e-10)
+    assert_allclose(_flat(extractor.apply(stcs_full[1])), want[1], rtol=1e-10)
+    if mode in ("mean", "mean_flip"):
+        label_kernel = extractor.fold_kernel(stc._kernel)
+        assert label_kernel.shape == (2, stc._kernel.shape[1])
+        assert_allclose(label_kernel @ stc._sens_data, want[0], rtol=1e-10)
+        with pytest.raises(ValueError, match="kernel must have shape"):
+            extractor.fold_kernel(stc._kernel[1:])
+    else:
+        with pytest.raises(ValueError, match="Invalid value for the 'mode'"):
+            extractor.fold_kernel(stc._kernel)
+    # incompatible stcs
+    bad_stc = stcs_full[0].copy()
+    bad_stc.vertices[0] = bad_stc.vertices[0] + 1
+    with pytest.raises(ValueError, match="not compatible"):
+        extractor.apply(bad_stc)
+
+
 def test_transform():
     """Test applying linear (time) transform to data."""
     # make up some data
@@ -1615,6 +1734,35 @@ def test_vol_adjacency():
     assert np.all(adjacency2.data == 1)
 
 
+def test_vol_adjacency_cache():
+    """Test that spatial adjacency is cached and extended via Kronecker."""
+    pytest.importorskip("sklearn")
+    import mne.source_estimate as source_estimate
+
+    vol = mne.setup_volume_source_space(pos=20.0, sphere=(0.0, 0.0, 0.0, 0.09))
+    vol[0]["type"] = "vol"  # no MRI, but still a regular grid
+    n_vertices = len(vol[0]["vertno"])
+    source_estimate._SPATIAL_ADJACENCY_CACHE.clear()
+    adjacency = spatial_src_adjacency(vol)
+    assert len(source_estimate._SPATIAL_ADJACENCY_CACHE) == 1
+    adjacency2 = spatio_temporal_src_adjacency(vol, n_times=3)
+    assert len(source_estimate._SPATIAL_ADJACENCY_CACHE) == 1
+    assert adjacency2.row.dtype == np.int32
+    temporal = sparse.diags_array(
+        [np.ones(2), np.ones(3), np.ones(2)], offsets=[-1, 0, 1]
+    )
+    want = sparse.kron(temporal, sparse.eye_array(n_vertices)) + sparse.kron(
+        sparse.eye_array(3), adjacency
+    )
+    # the diagonal is in both terms
+    want.setdiag(1)
+    assert_array_equal(adjacency2.toarray(), want.toarray())
+    # a changed source space must not hit the cache
+    vol[0]["vertno"] = vol[0]["vertno"][1:]
+    assert spatial_src_adjacency(vol).shape == (n_vertices - 1,) * 2
+    assert len(source_estimate._SPATIAL_ADJACENCY_CACHE) == 2
+
+
 @pytest.mark.slowtest
 @testing.requires_testing_data
 def test_spatial_src_adjacency():
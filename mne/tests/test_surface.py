@@ -8,6 +8,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose, assert_array_equal, assert_equal
 
+import mne.surface
 from mne import (
     decimate_surface,
     dig_mri_distances,
@@ -21,13 +22,16 @@ from mne.channels import make_dig_montage
 from mne.datasets import testing
 from mne.io import read_info
 from mne.surface import (
+    _CheckInside,
     _compute_nearest,
     _get_ico_surface,
     _marching_cubes,
     _normal_orth,
+    _points_outside_surface,
     _project_onto_surface,
     _read_patch,
     _tessellate_sphere,
+    _TriangleTree,
     _voxel_neighbors,
     fast_cross_3d,
     get_head_surf,
@@ -367,3 +371,106 @@ def test_project_onto_surface(method, ret_nn):
             atol=0.05,  # ico > 3 would be even better tol
             err_msg=f"{kind} not in same direction as locs for {method}",
         )
+
+
+@pytest.mark.parametrize("grid_max", (2**21, 100))
+def test_check_inside(numba_conditional, grid_max, monkeypatch):
+    """Test the voxel-accelerated interior check against solid angles."""
+    monkeypatch.setattr(mne.surface, "_SOLIDS_BLOCK_SIZE", 100)
+    monkeypatch.setattr(mne.surface, "_INSIDE_GRID_MAX", grid_max)
+    surf = _get_ico_surface(3)
+    rr = surf["rr"]
+    # a bumpy, non-convex ellipsoid
+    rr = rr * (1 + 0.2 * np.sin(5 * rr[:, :1]) * np.cos(4 * rr[:, 1:2]))
+    surf = dict(rr=rr * [0.07, 0.09, 0.06] + [0.0, 0.01, 0.04], tris=surf["tris"])
+    pts = np.concatenate(
+        [
+            np.random.default_rng(0).uniform(-0.12, 0.14, (1000, 3)),
+            surf["rr"] * 0.99,
+            surf["rr"] * 1.01,
+        ]
+    )
+    want = ~_points_outside_surface(pts, surf)
+    assert 0 < want.sum() < len(want)
+    check_inside = _CheckInside(surf)
+    assert check_inside.grid is not None
+    with catch_logging(verbose=True) as log:
+        inside = check_inside(pts, n_jobs=2)
+    assert "away from the surface" in log.getvalue()
+    assert_array_equal(inside, want)
+    assert not check_inside(np.zeros((0, 3))).size
+
+
+def _brute_tri_dists(pts, tri_rrs):
+    """Compute point-triangle distances from planes and edges."""
+    r1 = tri_rrs[:, 0]
+    r12, r13 = tri_rrs[:, 1] - r1, tri_rrs[:, 2] - r1
+    nn = np.cross(r12, r13)
+    nn /= np.linalg.norm(nn, axis=1, keepdims=True)
+    diff = pts[:, np.newaxis] - r1
+    mat = np.linalg.inv(np.stack([r12, r13, nn], axis=-1))
+    pqz = np.einsum("tij,ptj->pti", mat, diff)
+    p, q, z = pqz[..., 0], pqz[..., 1], pqz[..., 2]
+    inside = (p >= 0) & (q >= 0) & (p + q <= 1)
+    dists = np.where(inside, np.abs(z), np.inf)
+    for ii, jj in ((0, 1), (1, 2), (0, 2)):
+        start, edge = tri_rrs[:, ii], tri_rrs[:, jj] - tri_rrs[:, ii]
+        t = np.einsum("ptj,tj->pt", pts[:, np.newaxis] - start, edge)
+        t = np.clip(t / np.einsum("tj,tj->t", edge, edge), 0, 1)
+        closest = start + t[..., np.newaxis] * edge
+        dists = np.minimum(dists, np.linalg.norm(pts[:, np.newaxis] - closest, axis=-1))
+    return dists
+
+
+@pytest.mark.parametrize("leaf_size", (1, 8, 1000))
+def test_triangle_tree(leaf_size):
+    """Test nearest-triangle queries with _TriangleTree."""
+    surf = _get_ico_surface(2)
+    rr = surf["rr"] * (1 + 0.2 * np.sin(5 * surf["rr"][:, :1]))
+    surf = dict(rr=rr, tris=surf["tris"])
+    pts = np.concatenate(
+        [
+            np.random.default_rng(0).normal(size=(200, 3)),
+            rr * 1.01,
+            rr[surf["tris"]].mean(axis=1) * 0.99,
+        ]
+    )
+    weights, tri_idx, dists = _TriangleTree(surf, leaf_size=leaf_size).query(pts)
+    tri_rrs = rr[surf["tris"]]
+    want = _brute_tri_dists(pts, tri_rrs)
+    assert_allclose(dists, want.min(axis=1), atol=1e-12)
+    assert_allclose(want[np.arange(len(pts)), tri_idx], dists, atol=1e-12)
+    assert (weights >= -1e-12).all()
+    assert_allclose(weights.sum(axis=1), 1.0)
+    proj = np.einsum("ij,ijk->ik", weights, tri_rrs[tri_idx])
+    assert_allclose(np.linalg.norm(pts - proj, axis=1), dists, atol=1e-12)
+
+
+@pytest.mark.parametrize("leaf_size", (1, 8, 1000))
+def test_project_onto_surface_ties(leaf_size, monkeypatch):
+    """Test that projection is exact and deterministic for tied triangles."""
+    monkeypatch.setattr(mne.surface, "_TRI_TREE_LEAF_SIZE", leaf_size)
+    surf = _get_ico_surface(2)
+    rr = surf["rr"] * (1 + 0.2 * np.sin(5 * surf["rr"][:, :1]))
+    surf = dict(rr=rr, tris=surf["tris"])
+    tri_rrs = rr[surf["tris"]]
+    edges = np.unique(
+        np.sort(surf["tris"][:, [0, 1, 1, 2, 0, 2]].reshape(-1, 2)), axis=0
+    )
+    pts = np.concatenate(
+        [
+            rr * 1.02,  # nearest a vertex
+            rr[edges].mean(axis=1) * 1.01,  # nearest an edge
+            rr * np.random.default_rng(0).uniform(0.97, 1.03, (len(rr), 1)),
+        ]
+    )
+    weights, tri_idx, proj = _project_onto_surface(pts, surf, project_rrs=True)
+    want = _brute_tri_dists(pts, tri_rrs)
+    dists = np.linalg.norm(pts - proj, axis=1)
+    assert_allclose(dists, want.min(axis=1), atol=1e-12)
+    assert (weights >= -1e-12).all()
+    assert_allclose(weights.sum(axis=1), 1.0)
+    # ties go to the lowest triangle index
+    tied = want <= want.min(axis=1, keepdims=True) + 1e-9
+    assert tied.sum(axis=1).max() > 1
+    assert_array_equal(tri_idx, np.argmax(tied, axis=1))
@@ -92,6 +92,10 @@ _known_config_types = {
     ),
     "MNE_3D_OPTION_SMOOTH_SHADING": ("bool, whether to use smooth shading in 3D plots"),
     "MNE_3D_OPTION_THEME": ("str, the color theme (light or dark) to use for 3D plots"),
+    "MNE_BEM_CACHE_DIR": (
+        "str, path to a directory in which make_bem_solution caches BEM solutions "
+        "(disabled if not set)"
+    ),
     "MNE_BROWSE_RAW_SIZE": (
         "tuple, width and height of the raw browser window (in inches)"
     ),
@@ -182,6 +186,14 @@ _known_config_types = {
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
+    "MNE_FORWARD_CACHE_DIR": (
+        "str, path to a directory in which make_forward_solution caches the gain "
+        "of each sensor for each source (disabled if not set)"
+    ),
+    "MNE_FORWARD_CACHE_SIZE": (
+        "float, maximum size of the forward solution cache in megabytes, beyond "
+        "which the least recently used entries are removed (default 1024)"
+    ),
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
         "decorated with @verbose. See "